@@ -38,6 +38,10 @@ class RNNWrapper(nn.Module):
         output, _ = self.rnn(x)  # Extract and return only the output
         return output
 
+    def forward_with_state(self, x, hidden=None):
+        """ Forward pass starting from the given hidden state, returning the output and the new hidden state """
+        return self.rnn(x, hidden)
+
     @classmethod
     def create(cls, rnn_cell_class):
         """
@@ -283,6 +287,26 @@ class RNNMLPHybrid(nn.Module, BaseApproximator):
 
         rnn_out = self.rnn(x_rnn) # Only one output due to the wrapper
         rnn_out = rnn_out[:, -1, :]  # Take the last output of the RNN
+
+        return self.forward_head(rnn_out, x_mlp)
+
+    def step(self, x_rnn, hidden=None, x_mlp=None):
+
+        """
+        Stateful forward pass that only feeds the newest timestep of ```x_rnn``` (batch, time, features) into the
+        RNN, starting from ```hidden``` (the hidden state returned by the previous step or None at the start of
+        a sequence). Returns the output and the new hidden state.
+        """
+
+        rnn, rnn_activation = self.rnn[0], self.rnn[1]
+        rnn_out, hidden = rnn.forward_with_state(x_rnn[:, -1:, :], hidden)
+        rnn_out = rnn_activation(rnn_out[:, -1, :])
+
+        return self.forward_head(rnn_out, x_mlp), hidden
+
+    def forward_head(self, rnn_out, x_mlp=None):
+
+        """ Combine the last RNN output with the (optional) MLP input and apply the MLP layers """
         
         # Input MLP
         if x_mlp is not None:
@@ -351,6 +375,20 @@ class BaseApproximatorRNN(BaseApproximator, nn.Module):
                                     init_method,
                                     )
 
+    def split_state(self, state):
+
+        """
+        Split flat states of shape (..., features) into the RNN input of shape (batch, time, features) and the
+        MLP input of shape (batch, features) with one reshape, independent of the number of batch dimensions.
+        """
+
+        n_rnn_features = self.rnn_shape[0] * self.rnn_shape[1]
+
+        rnn_input = state[..., :n_rnn_features].reshape(-1, self.rnn_shape[0], self.rnn_shape[1])
+        mlp_input = state[..., n_rnn_features:].reshape(rnn_input.shape[0], -1)
+
+        return rnn_input, mlp_input
+
 
         
 
@@ -528,6 +566,9 @@ class RNNActor(BaseApproximatorRNN):
                 self.mlp_shape = None
             self.get_time_input = False
 
+        self.stateful = False # if True, only the newest timestep is fed and the hidden state is carried between calls
+        self.hidden_state = None
+
         self.build_RNN(     input_size,
                             output_shape[0],
                             hidden_layers_RNN,
@@ -542,43 +583,36 @@ class RNNActor(BaseApproximatorRNN):
                             init_method)
 
     def forward(self, state):
-        
+
+        state = state.float()
+        batched = state.dim() == (3 if self.get_time_input else 2)
+
         if self.get_time_input: # already in the right 2d (or 3d with batch) format
-            a = self.model(state.float(), None)
-        
+            rnn_input = state.reshape(-1, self.rnn_shape[0], self.rnn_shape[1])
+            mlp_input = None
         else:
-            if state.dim() == 1:
-                a = self.forward_without_batch(state.float())
-            else:
-                a = self.forward_with_batch(state.float())
-                
-        return a
-
-    def forward_with_batch(self, state):
-        if self.mlp_shape is not None:
-            rnn_input = state[:, :self.rnn_shape[0] * self.rnn_shape[1]]
-            mlp_input = state[:, self.rnn_shape[0] * self.rnn_shape[1]:]
+            rnn_input, mlp_input = self.split_state(state)
+            if self.mlp_shape is None:
+                mlp_input = None
+
+        if self.stateful:
+            if self.hidden_state is not None and self.hidden_state_batch_size() != rnn_input.shape[0]:
+                raise ValueError("The batch size must not change in stateful mode, call reset_state first")
+            a, hidden_state = self.model.step(rnn_input, self.hidden_state, mlp_input)
+            self.hidden_state = tuple(h.detach() for h in hidden_state) if isinstance(hidden_state, tuple) else hidden_state.detach()
         else:
-            rnn_input = state
-            mlp_input = None
-    
-        # Reshape rnn_input to (batch_size, time, features)
-        rnn_input = rnn_input.view(-1, self.rnn_shape[0], self.rnn_shape[1])
-        
-        return self.model(rnn_input, mlp_input)
+            a = self.model(rnn_input, mlp_input)
 
-    def forward_without_batch(self, state):
-        if self.mlp_shape is not None:
-            rnn_input = state[:self.rnn_shape[0] * self.rnn_shape[1]]
-            mlp_input = state[self.rnn_shape[0] * self.rnn_shape[1]:]
-        else:
-            rnn_input = state
-            mlp_input = None
-        
-        # Reshape rnn_input to (time, features)
-        rnn_input = rnn_input.view(self.rnn_shape[0], self.rnn_shape[1])
-        
-        return self.model(rnn_input, mlp_input)
+        return a if batched else a[0]
+
+    def hidden_state_batch_size(self):
+        """ Batch size of the carried hidden state """
+        hidden_state = self.hidden_state[0] if isinstance(self.hidden_state, tuple) else self.hidden_state # LSTMs have (h, c)
+        return hidden_state.shape[1]
+
+    def reset_state(self):
+        """ Reset the hidden state carried in stateful mode, e.g., at the start of an episode """
+        self.hidden_state = None
 
 # %% ../nbs/30_agents/60_approximators/21_critic_networks.ipynb 13
 class RNNStateAction(BaseApproximatorRNN):
@@ -652,44 +686,15 @@ class RNNStateAction(BaseApproximatorRNN):
 
     def forward(self, state, action):
 
-        if self.get_time_input: # already in the right 2d (or 3d with batch) format
-            q = self.model(state.float(), action.float())
-        
-        else:
-            if state.dim() == 1:
-                q = self.forward_without_batch(state.float(), action.float())
-            else:
-                q = self.forward_with_batch(state.float(), action.float())
+        state = state.float()
 
-        return torch.squeeze(q)
-    
-    def forward_with_batch(self, state, action):
-        
-        if self.mlp_shape is not None:
-            rnn_input = state[:, :self.rnn_shape[0] * self.rnn_shape[1]]
-            mlp_input = state[:, self.rnn_shape[0] * self.rnn_shape[1]:]
+        if self.get_time_input: # already in the right 2d (or 3d with batch) format
+            rnn_input = state.reshape(-1, self.rnn_shape[0], self.rnn_shape[1])
+            mlp_input = action.float().reshape(rnn_input.shape[0], -1)
         else:
-            rnn_input = state
-            mlp_input = None
-    
-        # Reshape rnn_input to (batch_size, time, features)
-        rnn_input = rnn_input.view(-1, self.rnn_shape[0], self.rnn_shape[1])
+            rnn_input, mlp_input = self.split_state(state)
+            mlp_input = torch.cat((mlp_input, action.float().reshape(rnn_input.shape[0], -1)), dim=1)
 
-        mlp_input = torch.cat((mlp_input, action), dim=1) # dim 0 is batch dimension
-        
-        return self.model(rnn_input, mlp_input)
-    
-    def forward_without_batch(self, state, action):
-        if self.mlp_shape is not None:
-            rnn_input = state[:self.rnn_shape[0] * self.rnn_shape[1]]
-            mlp_input = state[self.rnn_shape[0] * self.rnn_shape[1:]:]
-        else:
-            rnn_input = state
-            mlp_input = None
-        
-        # Reshape rnn_input to (time, features)
-        rnn_input = rnn_input.view(self.rnn_shape[0], self.rnn_shape[1])
+        q = self.model(rnn_input, mlp_input)
 
-        mlp_input = torch.cat((mlp_input, action), dim=0) # no batch dimension  
-        
-        return self.model(rnn_input, mlp_input)
+        return torch.squeeze(q)
@@ -33,6 +33,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                    'ddopai/RL_approximators.py'),
                                          'ddopai.RL_approximators.BaseApproximatorRNN.build_RNN': ( '30_agents/60_approximators/critic_networks.html#baseapproximatorrnn.build_rnn',
                                                                                                     'ddopai/RL_approximators.py'),
+                                         'ddopai.RL_approximators.BaseApproximatorRNN.split_state': ( '30_agents/60_approximators/critic_networks.html#baseapproximatorrnn.split_state',
+                                                                                                      'ddopai/RL_approximators.py'),
                                          'ddopai.RL_approximators.MLPActor': ( '30_agents/60_approximators/critic_networks.html#mlpactor',
                                                                                'ddopai/RL_approximators.py'),
                                          'ddopai.RL_approximators.MLPActor.__init__': ( '30_agents/60_approximators/critic_networks.html#mlpactor.__init__',
@@ -57,26 +59,26 @@ d = { 'settings': { 'branch': 'main',
                                                                                         'ddopai/RL_approximators.py'),
                                          'ddopai.RL_approximators.RNNActor.forward': ( '30_agents/60_approximators/critic_networks.html#rnnactor.forward',
                                                                                        'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.RNNActor.forward_with_batch': ( '30_agents/60_approximators/critic_networks.html#rnnactor.forward_with_batch',
-                                                                                                  'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.RNNActor.forward_without_batch': ( '30_agents/60_approximators/critic_networks.html#rnnactor.forward_without_batch',
-                                                                                                     'ddopai/RL_approximators.py'),
+                                         'ddopai.RL_approximators.RNNActor.hidden_state_batch_size': ( '30_agents/60_approximators/critic_networks.html#rnnactor.hidden_state_batch_size',
+                                                                                                       'ddopai/RL_approximators.py'),
+                                         'ddopai.RL_approximators.RNNActor.reset_state': ( '30_agents/60_approximators/critic_networks.html#rnnactor.reset_state',
+                                                                                           'ddopai/RL_approximators.py'),
                                          'ddopai.RL_approximators.RNNMLPHybrid': ( '30_agents/60_approximators/critic_networks.html#rnnmlphybrid',
                                                                                    'ddopai/RL_approximators.py'),
                                          'ddopai.RL_approximators.RNNMLPHybrid.__init__': ( '30_agents/60_approximators/critic_networks.html#rnnmlphybrid.__init__',
                                                                                             'ddopai/RL_approximators.py'),
                                          'ddopai.RL_approximators.RNNMLPHybrid.forward': ( '30_agents/60_approximators/critic_networks.html#rnnmlphybrid.forward',
                                                                                            'ddopai/RL_approximators.py'),
+                                         'ddopai.RL_approximators.RNNMLPHybrid.forward_head': ( '30_agents/60_approximators/critic_networks.html#rnnmlphybrid.forward_head',
+                                                                                                'ddopai/RL_approximators.py'),
+                                         'ddopai.RL_approximators.RNNMLPHybrid.step': ( '30_agents/60_approximators/critic_networks.html#rnnmlphybrid.step',
+                                                                                        'ddopai/RL_approximators.py'),
                                          'ddopai.RL_approximators.RNNStateAction': ( '30_agents/60_approximators/critic_networks.html#rnnstateaction',
                                                                                      'ddopai/RL_approximators.py'),
                                          'ddopai.RL_approximators.RNNStateAction.__init__': ( '30_agents/60_approximators/critic_networks.html#rnnstateaction.__init__',
                                                                                               'ddopai/RL_approximators.py'),
                                          'ddopai.RL_approximators.RNNStateAction.forward': ( '30_agents/60_approximators/critic_networks.html#rnnstateaction.forward',
                                                                                              'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.RNNStateAction.forward_with_batch': ( '30_agents/60_approximators/critic_networks.html#rnnstateaction.forward_with_batch',
-                                                                                                        'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.RNNStateAction.forward_without_batch': ( '30_agents/60_approximators/critic_networks.html#rnnstateaction.forward_without_batch',
-                                                                                                           'ddopai/RL_approximators.py'),
                                          'ddopai.RL_approximators.RNNWrapper': ( '30_agents/60_approximators/critic_networks.html#rnnwrapper',
                                                                                  'ddopai/RL_approximators.py'),
                                          'ddopai.RL_approximators.RNNWrapper.__init__': ( '30_agents/60_approximators/critic_networks.html#rnnwrapper.__init__',
@@ -84,7 +86,9 @@ d = { 'settings': { 'branch': 'main',
                                          'ddopai.RL_approximators.RNNWrapper.create': ( '30_agents/60_approximators/critic_networks.html#rnnwrapper.create',
                                                                                         'ddopai/RL_approximators.py'),
                                          'ddopai.RL_approximators.RNNWrapper.forward': ( '30_agents/60_approximators/critic_networks.html#rnnwrapper.forward',
-                                                                                         'ddopai/RL_approximators.py')},
+                                                                                         'ddopai/RL_approximators.py'),
+                                         'ddopai.RL_approximators.RNNWrapper.forward_with_state': ( '30_agents/60_approximators/critic_networks.html#rnnwrapper.forward_with_state',
+                                                                                                    'ddopai/RL_approximators.py')},
             'ddopai.agents.base': { 'ddopai.agents.base.BaseAgent': ( '30_agents/40_base_agents/base_agents.html#baseagent',
                                                                       'ddopai/agents/base.py'),
                                     'ddopai.agents.base.BaseAgent.__init__': ( '30_agents/40_base_agents/base_agents.html#baseagent.__init__',
@@ -101,6 +105,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                   'ddopai/agents/base.py'),
                                     'ddopai.agents.base.BaseAgent.draw_action_': ( '30_agents/40_base_agents/base_agents.html#baseagent.draw_action_',
                                                                                    'ddopai/agents/base.py'),
+                                    'ddopai.agents.base.BaseAgent.draw_action_batch': ( '30_agents/40_base_agents/base_agents.html#baseagent.draw_action_batch',
+                                                                                        'ddopai/agents/base.py'),
                                     'ddopai.agents.base.BaseAgent.eval': ( '30_agents/40_base_agents/base_agents.html#baseagent.eval',
                                                                            'ddopai/agents/base.py'),
                                     'ddopai.agents.base.BaseAgent.load': ( '30_agents/40_base_agents/base_agents.html#baseagent.load',
@@ -129,7 +135,13 @@ d = { 'settings': { 'branch': 'main',
                                         'ddopai.agents.ml_utils.LRSchedulerPerStep.__init__': ( '30_agents/ml_utils.html#lrschedulerperstep.__init__',
                                                                                                 'ddopai/agents/ml_utils.py'),
                                         'ddopai.agents.ml_utils.LRSchedulerPerStep.step': ( '30_agents/ml_utils.html#lrschedulerperstep.step',
-                                                                                            'ddopai/agents/ml_utils.py')},
+                                                                                            'ddopai/agents/ml_utils.py'),
+                                        'ddopai.agents.ml_utils.log_network_summary': ( '30_agents/ml_utils.html#log_network_summary',
+                                                                                        'ddopai/agents/ml_utils.py'),
+                                        'ddopai.agents.ml_utils.log_torchinfo_summary': ( '30_agents/ml_utils.html#log_torchinfo_summary',
+                                                                                          'ddopai/agents/ml_utils.py'),
+                                        'ddopai.agents.ml_utils.network_summary': ( '30_agents/ml_utils.html#network_summary',
+                                                                                    'ddopai/agents/ml_utils.py')},
             'ddopai.agents.newsvendor.erm': { 'ddopai.agents.newsvendor.erm.BaseMetaAgent': ( '30_agents/41_NV_agents/nv_erm_agents.html#basemetaagent',
                                                                                               'ddopai/agents/newsvendor/erm.py'),
                                               'ddopai.agents.newsvendor.erm.BaseMetaAgent.set_meta_dataloader': ( '30_agents/41_NV_agents/nv_erm_agents.html#basemetaagent.set_meta_dataloader',
@@ -192,8 +204,12 @@ d = { 'settings': { 'branch': 'main',
                                                                                                   'ddopai/agents/newsvendor/erm.py'),
                                               'ddopai.agents.newsvendor.erm.SGDBaseAgent.fit_epoch': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent.fit_epoch',
                                                                                                        'ddopai/agents/newsvendor/erm.py'),
+                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.get_checkpoint': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent.get_checkpoint',
+                                                                                                            'ddopai/agents/newsvendor/erm.py'),
                                               'ddopai.agents.newsvendor.erm.SGDBaseAgent.load': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent.load',
                                                                                                   'ddopai/agents/newsvendor/erm.py'),
+                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.load_checkpoint': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent.load_checkpoint',
+                                                                                                             'ddopai/agents/newsvendor/erm.py'),
                                               'ddopai.agents.newsvendor.erm.SGDBaseAgent.predict': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent.predict',
                                                                                                      'ddopai/agents/newsvendor/erm.py'),
                                               'ddopai.agents.newsvendor.erm.SGDBaseAgent.save': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent.save',
@@ -215,7 +231,9 @@ d = { 'settings': { 'branch': 'main',
                                               'ddopai.agents.newsvendor.erm.SGDBaseAgent.to': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent.to',
                                                                                                 'ddopai/agents/newsvendor/erm.py'),
                                               'ddopai.agents.newsvendor.erm.SGDBaseAgent.train': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent.train',
-                                                                                                   'ddopai/agents/newsvendor/erm.py')},
+                                                                                                   'ddopai/agents/newsvendor/erm.py'),
+                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.write_checkpoint': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent.write_checkpoint',
+                                                                                                              'ddopai/agents/newsvendor/erm.py')},
             'ddopai.agents.newsvendor.saa': { 'ddopai.agents.newsvendor.saa.BaseSAAagent': ( '30_agents/41_NV_agents/nv_saa_agents.html#basesaaagent',
                                                                                              'ddopai/agents/newsvendor/saa.py'),
                                               'ddopai.agents.newsvendor.saa.BaseSAAagent.__init__': ( '30_agents/41_NV_agents/nv_saa_agents.html#basesaaagent.__init__',
@@ -242,6 +260,26 @@ d = { 'settings': { 'branch': 'main',
                                                                                                       'ddopai/agents/newsvendor/saa.py'),
                                               'ddopai.agents.newsvendor.saa.BasewSAAagent.save': ( '30_agents/41_NV_agents/nv_saa_agents.html#basewsaaagent.save',
                                                                                                    'ddopai/agents/newsvendor/saa.py'),
+                                              'ddopai.agents.newsvendor.saa.NewsvendorOnlineSAAagent': ( '30_agents/41_NV_agents/nv_saa_agents.html#newsvendoronlinesaaagent',
+                                                                                                         'ddopai/agents/newsvendor/saa.py'),
+                                              'ddopai.agents.newsvendor.saa.NewsvendorOnlineSAAagent.__init__': ( '30_agents/41_NV_agents/nv_saa_agents.html#newsvendoronlinesaaagent.__init__',
+                                                                                                                  'ddopai/agents/newsvendor/saa.py'),
+                                              'ddopai.agents.newsvendor.saa.NewsvendorOnlineSAAagent.draw_action_': ( '30_agents/41_NV_agents/nv_saa_agents.html#newsvendoronlinesaaagent.draw_action_',
+                                                                                                                      'ddopai/agents/newsvendor/saa.py'),
+                                              'ddopai.agents.newsvendor.saa.NewsvendorOnlineSAAagent.fit': ( '30_agents/41_NV_agents/nv_saa_agents.html#newsvendoronlinesaaagent.fit',
+                                                                                                             'ddopai/agents/newsvendor/saa.py'),
+                                              'ddopai.agents.newsvendor.saa.NewsvendorOnlineSAAagent.load': ( '30_agents/41_NV_agents/nv_saa_agents.html#newsvendoronlinesaaagent.load',
+                                                                                                              'ddopai/agents/newsvendor/saa.py'),
+                                              'ddopai.agents.newsvendor.saa.NewsvendorOnlineSAAagent.merge': ( '30_agents/41_NV_agents/nv_saa_agents.html#newsvendoronlinesaaagent.merge',
+                                                                                                               'ddopai/agents/newsvendor/saa.py'),
+                                              'ddopai.agents.newsvendor.saa.NewsvendorOnlineSAAagent.partial_fit': ( '30_agents/41_NV_agents/nv_saa_agents.html#newsvendoronlinesaaagent.partial_fit',
+                                                                                                                     'ddopai/agents/newsvendor/saa.py'),
+                                              'ddopai.agents.newsvendor.saa.NewsvendorOnlineSAAagent.quantile': ( '30_agents/41_NV_agents/nv_saa_agents.html#newsvendoronlinesaaagent.quantile',
+                                                                                                                  'ddopai/agents/newsvendor/saa.py'),
+                                              'ddopai.agents.newsvendor.saa.NewsvendorOnlineSAAagent.quantiles': ( '30_agents/41_NV_agents/nv_saa_agents.html#newsvendoronlinesaaagent.quantiles',
+                                                                                                                   'ddopai/agents/newsvendor/saa.py'),
+                                              'ddopai.agents.newsvendor.saa.NewsvendorOnlineSAAagent.save': ( '30_agents/41_NV_agents/nv_saa_agents.html#newsvendoronlinesaaagent.save',
+                                                                                                              'ddopai/agents/newsvendor/saa.py'),
                                               'ddopai.agents.newsvendor.saa.NewsvendorRFwSAAagent': ( '30_agents/41_NV_agents/nv_saa_agents.html#newsvendorrfwsaaagent',
                                                                                                       'ddopai/agents/newsvendor/saa.py'),
                                               'ddopai.agents.newsvendor.saa.NewsvendorRFwSAAagent.__init__': ( '30_agents/41_NV_agents/nv_saa_agents.html#newsvendorrfwsaaagent.__init__',
@@ -261,7 +299,27 @@ d = { 'settings': { 'branch': 'main',
                                               'ddopai.agents.newsvendor.saa.NewsvendorSAAagent.load': ( '30_agents/41_NV_agents/nv_saa_agents.html#newsvendorsaaagent.load',
                                                                                                         'ddopai/agents/newsvendor/saa.py'),
                                               'ddopai.agents.newsvendor.saa.NewsvendorSAAagent.save': ( '30_agents/41_NV_agents/nv_saa_agents.html#newsvendorsaaagent.save',
-                                                                                                        'ddopai/agents/newsvendor/saa.py')},
+                                                                                                        'ddopai/agents/newsvendor/saa.py'),
+                                              'ddopai.agents.newsvendor.saa.QuantileSketch': ( '30_agents/41_NV_agents/nv_saa_agents.html#quantilesketch',
+                                                                                               'ddopai/agents/newsvendor/saa.py'),
+                                              'ddopai.agents.newsvendor.saa.QuantileSketch.__init__': ( '30_agents/41_NV_agents/nv_saa_agents.html#quantilesketch.__init__',
+                                                                                                        'ddopai/agents/newsvendor/saa.py'),
+                                              'ddopai.agents.newsvendor.saa.QuantileSketch.__len__': ( '30_agents/41_NV_agents/nv_saa_agents.html#quantilesketch.__len__',
+                                                                                                       'ddopai/agents/newsvendor/saa.py'),
+                                              'ddopai.agents.newsvendor.saa.QuantileSketch.centroids': ( '30_agents/41_NV_agents/nv_saa_agents.html#quantilesketch.centroids',
+                                                                                                         'ddopai/agents/newsvendor/saa.py'),
+                                              'ddopai.agents.newsvendor.saa.QuantileSketch.compress': ( '30_agents/41_NV_agents/nv_saa_agents.html#quantilesketch.compress',
+                                                                                                        'ddopai/agents/newsvendor/saa.py'),
+                                              'ddopai.agents.newsvendor.saa.QuantileSketch.merge': ( '30_agents/41_NV_agents/nv_saa_agents.html#quantilesketch.merge',
+                                                                                                     'ddopai/agents/newsvendor/saa.py'),
+                                              'ddopai.agents.newsvendor.saa.QuantileSketch.quantile': ( '30_agents/41_NV_agents/nv_saa_agents.html#quantilesketch.quantile',
+                                                                                                        'ddopai/agents/newsvendor/saa.py'),
+                                              'ddopai.agents.newsvendor.saa.QuantileSketch.scale': ( '30_agents/41_NV_agents/nv_saa_agents.html#quantilesketch.scale',
+                                                                                                     'ddopai/agents/newsvendor/saa.py'),
+                                              'ddopai.agents.newsvendor.saa.QuantileSketch.total_weight': ( '30_agents/41_NV_agents/nv_saa_agents.html#quantilesketch.total_weight',
+                                                                                                            'ddopai/agents/newsvendor/saa.py'),
+                                              'ddopai.agents.newsvendor.saa.QuantileSketch.update': ( '30_agents/41_NV_agents/nv_saa_agents.html#quantilesketch.update',
+                                                                                                      'ddopai/agents/newsvendor/saa.py')},
             'ddopai.agents.obsprocessors': { 'ddopai.agents.obsprocessors.AddParamsToFeatures': ( '30_agents/obsprocessors.html#addparamstofeatures',
                                                                                                   'ddopai/agents/obsprocessors.py'),
                                              'ddopai.agents.obsprocessors.AddParamsToFeatures.__call__': ( '30_agents/obsprocessors.html#addparamstofeatures.__call__',
@@ -300,14 +358,20 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                 'ddopai/agents/rl/mushroom_rl.py'),
                                               'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.add_obsprocessor': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.add_obsprocessor',
                                                                                                                    'ddopai/agents/rl/mushroom_rl.py'),
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.apply_preprocessors_batch': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.apply_preprocessors_batch',
+                                                                                                                            'ddopai/agents/rl/mushroom_rl.py'),
                                               'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.draw_action_': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.draw_action_',
                                                                                                                'ddopai/agents/rl/mushroom_rl.py'),
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.draw_action_batch': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.draw_action_batch',
+                                                                                                                    'ddopai/agents/rl/mushroom_rl.py'),
                                               'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.episode_start': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.episode_start',
                                                                                                                 'ddopai/agents/rl/mushroom_rl.py'),
                                               'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.eval': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.eval',
                                                                                                        'ddopai/agents/rl/mushroom_rl.py'),
                                               'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.fit': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.fit',
                                                                                                       'ddopai/agents/rl/mushroom_rl.py'),
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.get_checkpoint': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.get_checkpoint',
+                                                                                                                 'ddopai/agents/rl/mushroom_rl.py'),
                                               'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.get_input_shape': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.get_input_shape',
                                                                                                                   'ddopai/agents/rl/mushroom_rl.py'),
                                               'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.get_loss_function': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.get_loss_function',
@@ -316,6 +380,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                       'ddopai/agents/rl/mushroom_rl.py'),
                                               'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.load': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.load',
                                                                                                        'ddopai/agents/rl/mushroom_rl.py'),
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.load_checkpoint': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.load_checkpoint',
+                                                                                                                  'ddopai/agents/rl/mushroom_rl.py'),
                                               'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.predict': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.predict',
                                                                                                           'ddopai/agents/rl/mushroom_rl.py'),
                                               'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.predict_': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.predict_',
@@ -332,6 +398,12 @@ d = { 'settings': { 'branch': 'main',
                                                                                                             'ddopai/agents/rl/mushroom_rl.py'),
                                               'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.set_optimizer': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.set_optimizer',
                                                                                                                 'ddopai/agents/rl/mushroom_rl.py'),
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.set_replay_memory': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.set_replay_memory',
+                                                                                                                    'ddopai/agents/rl/mushroom_rl.py'),
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.split_batch': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.split_batch',
+                                                                                                              'ddopai/agents/rl/mushroom_rl.py'),
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.stack_batch': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.stack_batch',
+                                                                                                              'ddopai/agents/rl/mushroom_rl.py'),
                                               'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.stop': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.stop',
                                                                                                        'ddopai/agents/rl/mushroom_rl.py'),
                                               'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.to': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.to',
@@ -339,13 +411,63 @@ d = { 'settings': { 'branch': 'main',
                                               'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.train': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.train',
                                                                                                         'ddopai/agents/rl/mushroom_rl.py'),
                                               'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.transfer_obs_processors_to_mushroom_agent': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.transfer_obs_processors_to_mushroom_agent',
-                                                                                                                                            'ddopai/agents/rl/mushroom_rl.py')},
+                                                                                                                                            'ddopai/agents/rl/mushroom_rl.py'),
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.write_checkpoint': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.write_checkpoint',
+                                                                                                                   'ddopai/agents/rl/mushroom_rl.py')},
             'ddopai.agents.rl.ppo': { 'ddopai.agents.rl.ppo.PPOAgent': ( '30_agents/51_RL_agents/ppo_agents.html#ppoagent',
                                                                          'ddopai/agents/rl/ppo.py'),
                                       'ddopai.agents.rl.ppo.PPOAgent.__init__': ( '30_agents/51_RL_agents/ppo_agents.html#ppoagent.__init__',
                                                                                   'ddopai/agents/rl/ppo.py'),
                                       'ddopai.agents.rl.ppo.PPOAgent.get_network_list': ( '30_agents/51_RL_agents/ppo_agents.html#ppoagent.get_network_list',
                                                                                           'ddopai/agents/rl/ppo.py')},
+            'ddopai.agents.rl.replay_memory': { 'ddopai.agents.rl.replay_memory.ArrayReplayMemory': ( '30_agents/51_RL_agents/replay_memory.html#arrayreplaymemory',
+                                                                                                      'ddopai/agents/rl/replay_memory.py'),
+                                                'ddopai.agents.rl.replay_memory.ArrayReplayMemory.__init__': ( '30_agents/51_RL_agents/replay_memory.html#arrayreplaymemory.__init__',
+                                                                                                               'ddopai/agents/rl/replay_memory.py'),
+                                                'ddopai.agents.rl.replay_memory.ArrayReplayMemory._allocate': ( '30_agents/51_RL_agents/replay_memory.html#arrayreplaymemory._allocate',
+                                                                                                                'ddopai/agents/rl/replay_memory.py'),
+                                                'ddopai.agents.rl.replay_memory.ArrayReplayMemory._load_states': ( '30_agents/51_RL_agents/replay_memory.html#arrayreplaymemory._load_states',
+                                                                                                                   'ddopai/agents/rl/replay_memory.py'),
+                                                'ddopai.agents.rl.replay_memory.ArrayReplayMemory._post_load': ( '30_agents/51_RL_agents/replay_memory.html#arrayreplaymemory._post_load',
+                                                                                                                 'ddopai/agents/rl/replay_memory.py'),
+                                                'ddopai.agents.rl.replay_memory.ArrayReplayMemory._store_states': ( '30_agents/51_RL_agents/replay_memory.html#arrayreplaymemory._store_states',
+                                                                                                                    'ddopai/agents/rl/replay_memory.py'),
+                                                'ddopai.agents.rl.replay_memory.ArrayReplayMemory.add': ( '30_agents/51_RL_agents/replay_memory.html#arrayreplaymemory.add',
+                                                                                                          'ddopai/agents/rl/replay_memory.py'),
+                                                'ddopai.agents.rl.replay_memory.ArrayReplayMemory.get': ( '30_agents/51_RL_agents/replay_memory.html#arrayreplaymemory.get',
+                                                                                                          'ddopai/agents/rl/replay_memory.py'),
+                                                'ddopai.agents.rl.replay_memory.ArrayReplayMemory.get_transitions': ( '30_agents/51_RL_agents/replay_memory.html#arrayreplaymemory.get_transitions',
+                                                                                                                      'ddopai/agents/rl/replay_memory.py'),
+                                                'ddopai.agents.rl.replay_memory.ArrayReplayMemory.initialized': ( '30_agents/51_RL_agents/replay_memory.html#arrayreplaymemory.initialized',
+                                                                                                                  'ddopai/agents/rl/replay_memory.py'),
+                                                'ddopai.agents.rl.replay_memory.ArrayReplayMemory.nbytes': ( '30_agents/51_RL_agents/replay_memory.html#arrayreplaymemory.nbytes',
+                                                                                                             'ddopai/agents/rl/replay_memory.py'),
+                                                'ddopai.agents.rl.replay_memory.ArrayReplayMemory.reset': ( '30_agents/51_RL_agents/replay_memory.html#arrayreplaymemory.reset',
+                                                                                                            'ddopai/agents/rl/replay_memory.py'),
+                                                'ddopai.agents.rl.replay_memory.ArrayReplayMemory.size': ( '30_agents/51_RL_agents/replay_memory.html#arrayreplaymemory.size',
+                                                                                                           'ddopai/agents/rl/replay_memory.py'),
+                                                'ddopai.agents.rl.replay_memory.IndexReplayMemory': ( '30_agents/51_RL_agents/replay_memory.html#indexreplaymemory',
+                                                                                                      'ddopai/agents/rl/replay_memory.py'),
+                                                'ddopai.agents.rl.replay_memory.IndexReplayMemory.__init__': ( '30_agents/51_RL_agents/replay_memory.html#indexreplaymemory.__init__',
+                                                                                                               'ddopai/agents/rl/replay_memory.py'),
+                                                'ddopai.agents.rl.replay_memory.IndexReplayMemory._allocate': ( '30_agents/51_RL_agents/replay_memory.html#indexreplaymemory._allocate',
+                                                                                                                'ddopai/agents/rl/replay_memory.py'),
+                                                'ddopai.agents.rl.replay_memory.IndexReplayMemory._check_layout': ( '30_agents/51_RL_agents/replay_memory.html#indexreplaymemory._check_layout',
+                                                                                                                    'ddopai/agents/rl/replay_memory.py'),
+                                                'ddopai.agents.rl.replay_memory.IndexReplayMemory._load_states': ( '30_agents/51_RL_agents/replay_memory.html#indexreplaymemory._load_states',
+                                                                                                                   'ddopai/agents/rl/replay_memory.py'),
+                                                'ddopai.agents.rl.replay_memory.IndexReplayMemory._store_states': ( '30_agents/51_RL_agents/replay_memory.html#indexreplaymemory._store_states',
+                                                                                                                    'ddopai/agents/rl/replay_memory.py'),
+                                                'ddopai.agents.rl.replay_memory.IndexReplayMemory.add': ( '30_agents/51_RL_agents/replay_memory.html#indexreplaymemory.add',
+                                                                                                          'ddopai/agents/rl/replay_memory.py'),
+                                                'ddopai.agents.rl.replay_memory.IndexReplayMemory.nbytes': ( '30_agents/51_RL_agents/replay_memory.html#indexreplaymemory.nbytes',
+                                                                                                             'ddopai/agents/rl/replay_memory.py'),
+                                                'ddopai.agents.rl.replay_memory.IndexReplayMemory.reset': ( '30_agents/51_RL_agents/replay_memory.html#indexreplaymemory.reset',
+                                                                                                            'ddopai/agents/rl/replay_memory.py'),
+                                                'ddopai.agents.rl.replay_memory.IndexReplayMemory.set_dataloader': ( '30_agents/51_RL_agents/replay_memory.html#indexreplaymemory.set_dataloader',
+                                                                                                                     'ddopai/agents/rl/replay_memory.py'),
+                                                'ddopai.agents.rl.replay_memory.IndexReplayMemory.set_indices': ( '30_agents/51_RL_agents/replay_memory.html#indexreplaymemory.set_indices',
+                                                                                                                  'ddopai/agents/rl/replay_memory.py')},
             'ddopai.agents.rl.sac': { 'ddopai.agents.rl.sac.SACAgent': ( '30_agents/51_RL_agents/sac_agents.html#sacagent',
                                                                          'ddopai/agents/rl/sac.py'),
                                       'ddopai.agents.rl.sac.SACAgent.__init__': ( '30_agents/51_RL_agents/sac_agents.html#sacagent.__init__',
@@ -361,7 +483,13 @@ d = { 'settings': { 'branch': 'main',
                                       'ddopai.agents.rl.sac.SACRNNAgent': ( '30_agents/51_RL_agents/sac_agents.html#sacrnnagent',
                                                                             'ddopai/agents/rl/sac.py'),
                                       'ddopai.agents.rl.sac.SACRNNAgent.__init__': ( '30_agents/51_RL_agents/sac_agents.html#sacrnnagent.__init__',
-                                                                                     'ddopai/agents/rl/sac.py')},
+                                                                                     'ddopai/agents/rl/sac.py'),
+                                      'ddopai.agents.rl.sac.SACRNNAgent.actor_networks': ( '30_agents/51_RL_agents/sac_agents.html#sacrnnagent.actor_networks',
+                                                                                           'ddopai/agents/rl/sac.py'),
+                                      'ddopai.agents.rl.sac.SACRNNAgent.draw_action_': ( '30_agents/51_RL_agents/sac_agents.html#sacrnnagent.draw_action_',
+                                                                                         'ddopai/agents/rl/sac.py'),
+                                      'ddopai.agents.rl.sac.SACRNNAgent.episode_start': ( '30_agents/51_RL_agents/sac_agents.html#sacrnnagent.episode_start',
+                                                                                          'ddopai/agents/rl/sac.py')},
             'ddopai.agents.rl.td3': { 'ddopai.agents.rl.td3.TD3Agent': ( '30_agents/51_RL_agents/td3_agents.html#td3agent',
                                                                          'ddopai/agents/rl/td3.py'),
                                       'ddopai.agents.rl.td3.TD3Agent.__init__': ( '30_agents/51_RL_agents/td3_agents.html#td3agent.__init__',
@@ -432,6 +560,24 @@ d = { 'settings': { 'branch': 'main',
                                                                               'ddopai/approximators.py'),
                                       'ddopai.approximators.rotate_half': ( '30_agents/60_approximators/approximators.html#rotate_half',
                                                                             'ddopai/approximators.py')},
+            'ddopai.checkpointing': { 'ddopai.checkpointing.CheckpointWriter': ( '00_utils/checkpointing.html#checkpointwriter',
+                                                                                 'ddopai/checkpointing.py'),
+                                      'ddopai.checkpointing.CheckpointWriter.__init__': ( '00_utils/checkpointing.html#checkpointwriter.__init__',
+                                                                                          'ddopai/checkpointing.py'),
+                                      'ddopai.checkpointing.CheckpointWriter._raise_error': ( '00_utils/checkpointing.html#checkpointwriter._raise_error',
+                                                                                              'ddopai/checkpointing.py'),
+                                      'ddopai.checkpointing.CheckpointWriter._run': ( '00_utils/checkpointing.html#checkpointwriter._run',
+                                                                                      'ddopai/checkpointing.py'),
+                                      'ddopai.checkpointing.CheckpointWriter.close': ( '00_utils/checkpointing.html#checkpointwriter.close',
+                                                                                       'ddopai/checkpointing.py'),
+                                      'ddopai.checkpointing.CheckpointWriter.flush': ( '00_utils/checkpointing.html#checkpointwriter.flush',
+                                                                                       'ddopai/checkpointing.py'),
+                                      'ddopai.checkpointing.CheckpointWriter.submit': ( '00_utils/checkpointing.html#checkpointwriter.submit',
+                                                                                        'ddopai/checkpointing.py'),
+                                      'ddopai.checkpointing.atomic_torch_save': ( '00_utils/checkpointing.html#atomic_torch_save',
+                                                                                  'ddopai/checkpointing.py'),
+                                      'ddopai.checkpointing.state_dict_to_cpu': ( '00_utils/checkpointing.html#state_dict_to_cpu',
+                                                                                  'ddopai/checkpointing.py')},
             'ddopai.dataloaders.base': { 'ddopai.dataloaders.base.BaseDataLoader': ( '10_dataloaders/base_dataloader.html#basedataloader',
                                                                                      'ddopai/dataloaders/base.py'),
                                          'ddopai.dataloaders.base.BaseDataLoader.X_shape': ( '10_dataloaders/base_dataloader.html#basedataloader.x_shape',
@@ -444,6 +590,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                               'ddopai/dataloaders/base.py'),
                                          'ddopai.dataloaders.base.BaseDataLoader.__len__': ( '10_dataloaders/base_dataloader.html#basedataloader.__len__',
                                                                                              'ddopai/dataloaders/base.py'),
+                                         'ddopai.dataloaders.base.BaseDataLoader.get_X_batch': ( '10_dataloaders/base_dataloader.html#basedataloader.get_x_batch',
+                                                                                                 'ddopai/dataloaders/base.py'),
                                          'ddopai.dataloaders.base.BaseDataLoader.get_all_X': ( '10_dataloaders/base_dataloader.html#basedataloader.get_all_x',
                                                                                                'ddopai/dataloaders/base.py'),
                                          'ddopai.dataloaders.base.BaseDataLoader.get_all_Y': ( '10_dataloaders/base_dataloader.html#basedataloader.get_all_y',
@@ -514,7 +662,31 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                              'ddopai/dataloaders/distribution.py'),
                                                  'ddopai.dataloaders.distribution.NormalDistributionDataLoader.len_val': ( '10_dataloaders/distribution_loaders.html#normaldistributiondataloader.len_val',
                                                                                                                            'ddopai/dataloaders/distribution.py')},
-            'ddopai.dataloaders.tabular': { 'ddopai.dataloaders.tabular.MultiShapeLoader': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader',
+            'ddopai.dataloaders.tabular': { 'ddopai.dataloaders.tabular.ArrayScaler': ( '10_dataloaders/tabular_dataloaders.html#arrayscaler',
+                                                                                        'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.ArrayScaler.__init__': ( '10_dataloaders/tabular_dataloaders.html#arrayscaler.__init__',
+                                                                                                 'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.ArrayScaler.fit': ( '10_dataloaders/tabular_dataloaders.html#arrayscaler.fit',
+                                                                                            'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.ArrayScaler.fit_transform_frame': ( '10_dataloaders/tabular_dataloaders.html#arrayscaler.fit_transform_frame',
+                                                                                                            'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.ArrayScaler.inverse_transform': ( '10_dataloaders/tabular_dataloaders.html#arrayscaler.inverse_transform',
+                                                                                                          'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.ArrayScaler.transform': ( '10_dataloaders/tabular_dataloaders.html#arrayscaler.transform',
+                                                                                                  'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.ArrayScaler.transform_frame': ( '10_dataloaders/tabular_dataloaders.html#arrayscaler.transform_frame',
+                                                                                                        'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.AvailabilitySampler': ( '10_dataloaders/tabular_dataloaders.html#availabilitysampler',
+                                                                                                'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.AvailabilitySampler.__init__': ( '10_dataloaders/tabular_dataloaders.html#availabilitysampler.__init__',
+                                                                                                         'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.AvailabilitySampler.__iter__': ( '10_dataloaders/tabular_dataloaders.html#availabilitysampler.__iter__',
+                                                                                                         'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.AvailabilitySampler.__len__': ( '10_dataloaders/tabular_dataloaders.html#availabilitysampler.__len__',
+                                                                                                        'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.AvailabilitySampler.decode_training_index': ( '10_dataloaders/tabular_dataloaders.html#availabilitysampler.decode_training_index',
+                                                                                                                      'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.MultiShapeLoader': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader',
                                                                                              'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.MultiShapeLoader.X_shape': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.x_shape',
                                                                                                      'ddopai/dataloaders/tabular.py'),
@@ -526,8 +698,12 @@ d = { 'settings': { 'branch': 'main',
                                                                                                       'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.MultiShapeLoader.__len__': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.__len__',
                                                                                                      'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.MultiShapeLoader.append': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.append',
+                                                                                                    'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.MultiShapeLoader.build_engineered_SKU_features': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.build_engineered_sku_features',
                                                                                                                            'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.MultiShapeLoader.build_sku_time_index': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.build_sku_time_index',
+                                                                                                                  'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.MultiShapeLoader.get_all_X': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.get_all_x',
                                                                                                        'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.MultiShapeLoader.get_all_Y': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.get_all_y',
@@ -550,6 +726,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                      'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.MultiShapeLoader.normalize_demand_and_features_out_of_sample': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.normalize_demand_and_features_out_of_sample',
                                                                                                                                          'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.MultiShapeLoader.normalize_new_demand': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.normalize_new_demand',
+                                                                                                                  'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.MultiShapeLoader.save_indices': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.save_indices',
                                                                                                           'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.MultiShapeLoader.set_in_sample_val_test_SKUs': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.set_in_sample_val_test_skus',
@@ -560,6 +738,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                             'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.MultiShapeLoader.set_train_subset': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.set_train_subset',
                                                                                                               'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.MultiShapeLoader.take_columns': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.take_columns',
+                                                                                                          'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.MultiShapeLoader.test_out_of_sample_SKUs': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.test_out_of_sample_skus',
                                                                                                                      'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.MultiShapeLoader.update_lag_features': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.update_lag_features',
@@ -576,6 +756,10 @@ d = { 'settings': { 'branch': 'main',
                                                                                                   'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.XYDataLoader.__len__': ( '10_dataloaders/tabular_dataloaders.html#xydataloader.__len__',
                                                                                                  'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.XYDataLoader.append': ( '10_dataloaders/tabular_dataloaders.html#xydataloader.append',
+                                                                                                'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.XYDataLoader.get_X_batch': ( '10_dataloaders/tabular_dataloaders.html#xydataloader.get_x_batch',
+                                                                                                     'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.XYDataLoader.get_all_X': ( '10_dataloaders/tabular_dataloaders.html#xydataloader.get_all_x',
                                                                                                    'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.XYDataLoader.get_all_Y': ( '10_dataloaders/tabular_dataloaders.html#xydataloader.get_all_y',
@@ -591,7 +775,11 @@ d = { 'settings': { 'branch': 'main',
                                             'ddopai.dataloaders.tabular.XYDataLoader.prep_lag_features': ( '10_dataloaders/tabular_dataloaders.html#xydataloader.prep_lag_features',
                                                                                                            'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.XYDataLoader.update_lag_features': ( '10_dataloaders/tabular_dataloaders.html#xydataloader.update_lag_features',
-                                                                                                             'ddopai/dataloaders/tabular.py')},
+                                                                                                             'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular._append_rows': ( '10_dataloaders/tabular_dataloaders.html#_append_rows',
+                                                                                         'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.one_hot_columns': ( '10_dataloaders/tabular_dataloaders.html#one_hot_columns',
+                                                                                            'ddopai/dataloaders/tabular.py')},
             'ddopai.datasets.bakery': { 'ddopai.datasets.bakery.BakeryDatasetLoader': ( '90_datasets/meta_bakery.html#bakerydatasetloader',
                                                                                         'ddopai/datasets/bakery.py'),
                                         'ddopai.datasets.bakery.BakeryDatasetLoader.__init__': ( '90_datasets/meta_bakery.html#bakerydatasetloader.__init__',
@@ -610,10 +798,42 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                'ddopai/datasets/default_datasets.py'),
                                                   'ddopai.datasets.default_datasets.DatasetLoader.load_dataset': ( '90_datasets/default_datasets.html#datasetloader.load_dataset',
                                                                                                                    'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets.DatasetLoader.load_datasets': ( '90_datasets/default_datasets.html#datasetloader.load_datasets',
+                                                                                                                    'ddopai/datasets/default_datasets.py'),
                                                   'ddopai.datasets.default_datasets.DatasetLoader.show_dataset_types': ( '90_datasets/default_datasets.html#datasetloader.show_dataset_types',
                                                                                                                          'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets.DatasetRegistry': ( '90_datasets/default_datasets.html#datasetregistry',
+                                                                                                        'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets.DatasetRegistry.__init__': ( '90_datasets/default_datasets.html#datasetregistry.__init__',
+                                                                                                                 'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets.DatasetRegistry.dataset_dir': ( '90_datasets/default_datasets.html#datasetregistry.dataset_dir',
+                                                                                                                    'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets.DatasetRegistry.get': ( '90_datasets/default_datasets.html#datasetregistry.get',
+                                                                                                            'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets.DatasetRegistry.key': ( '90_datasets/default_datasets.html#datasetregistry.key',
+                                                                                                            'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets.DatasetRegistry.register': ( '90_datasets/default_datasets.html#datasetregistry.register',
+                                                                                                                 'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets._file_dtype': ( '90_datasets/default_datasets.html#_file_dtype',
+                                                                                                    'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets._is_url': ( '90_datasets/default_datasets.html#_is_url',
+                                                                                                'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets._local_path': ( '90_datasets/default_datasets.html#_local_path',
+                                                                                                    'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets._read_csv': ( '90_datasets/default_datasets.html#_read_csv',
+                                                                                                  'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets._to_numpy': ( '90_datasets/default_datasets.html#_to_numpy',
+                                                                                                  'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets._write_json_atomic': ( '90_datasets/default_datasets.html#_write_json_atomic',
+                                                                                                           'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets.add_to_mirror': ( '90_datasets/default_datasets.html#add_to_mirror',
+                                                                                                      'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets.download_file': ( '90_datasets/default_datasets.html#download_file',
+                                                                                                      'ddopai/datasets/default_datasets.py'),
                                                   'ddopai.datasets.default_datasets.download_file_from_github': ( '90_datasets/default_datasets.html#download_file_from_github',
                                                                                                                   'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets.fetch_file': ( '90_datasets/default_datasets.html#fetch_file',
+                                                                                                   'ddopai/datasets/default_datasets.py'),
                                                   'ddopai.datasets.default_datasets.get_all_release_tags': ( '90_datasets/default_datasets.html#get_all_release_tags',
                                                                                                              'ddopai/datasets/default_datasets.py'),
                                                   'ddopai.datasets.default_datasets.get_asset_url': ( '90_datasets/default_datasets.html#get_asset_url',
@@ -624,6 +844,10 @@ d = { 'settings': { 'branch': 'main',
                                                                                                         'ddopai/datasets/default_datasets.py'),
                                                   'ddopai.datasets.default_datasets.load_data_from_directory': ( '90_datasets/default_datasets.html#load_data_from_directory',
                                                                                                                  'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets.read_mirror_manifest': ( '90_datasets/default_datasets.html#read_mirror_manifest',
+                                                                                                             'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets.sha256sum': ( '90_datasets/default_datasets.html#sha256sum',
+                                                                                                  'ddopai/datasets/default_datasets.py'),
                                                   'ddopai.datasets.default_datasets.unzip_file': ( '90_datasets/default_datasets.html#unzip_file',
                                                                                                    'ddopai/datasets/default_datasets.py')},
             'ddopai.datasets.kaggle_m5': { 'ddopai.datasets.kaggle_m5.KaggleM5DatasetLoader': ( '90_datasets/meta_kaggle_m5.html#kagglem5datasetloader',
@@ -764,6 +988,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                      'ddopai/envs/inventory/single_period.py'),
                                                      'ddopai.envs.inventory.single_period.NewsvendorEnv.determine_cost': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenv.determine_cost',
                                                                                                                            'ddopai/envs/inventory/single_period.py'),
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnv.determine_cost_batch': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenv.determine_cost_batch',
+                                                                                                                                 'ddopai/envs/inventory/single_period.py'),
                                                      'ddopai.envs.inventory.single_period.NewsvendorEnv.step_': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenv.step_',
                                                                                                                   'ddopai/envs/inventory/single_period.py'),
                                                      'ddopai.envs.inventory.single_period.NewsvendorEnv.update_cu_co': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenv.update_cu_co',
@@ -778,6 +1004,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                             'ddopai/envs/inventory/single_period.py'),
                                                      'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.determine_cost': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.determine_cost',
                                                                                                                                      'ddopai/envs/inventory/single_period.py'),
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.determine_cost_batch': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.determine_cost_batch',
+                                                                                                                                           'ddopai/envs/inventory/single_period.py'),
                                                      'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.draw_parameter': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.draw_parameter',
                                                                                                                                      'ddopai/envs/inventory/single_period.py'),
                                                      'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.get_observation': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.get_observation',
@@ -786,16 +1014,78 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                             'ddopai/envs/inventory/single_period.py'),
                                                      'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.set_val_test_sl': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.set_val_test_sl',
                                                                                                                                       'ddopai/envs/inventory/single_period.py')},
+            'ddopai.experiments.actor_learner': { 'ddopai.experiments.actor_learner.ActorLearnerCore': ( '40_experiments/actor_learner.html#actorlearnercore',
+                                                                                                         'ddopai/experiments/actor_learner.py'),
+                                                  'ddopai.experiments.actor_learner.ActorLearnerCore.__init__': ( '40_experiments/actor_learner.html#actorlearnercore.__init__',
+                                                                                                                  'ddopai/experiments/actor_learner.py'),
+                                                  'ddopai.experiments.actor_learner.ActorLearnerCore.close': ( '40_experiments/actor_learner.html#actorlearnercore.close',
+                                                                                                               'ddopai/experiments/actor_learner.py'),
+                                                  'ddopai.experiments.actor_learner.ActorLearnerCore.get_transitions': ( '40_experiments/actor_learner.html#actorlearnercore.get_transitions',
+                                                                                                                         'ddopai/experiments/actor_learner.py'),
+                                                  'ddopai.experiments.actor_learner.ActorLearnerCore.learn': ( '40_experiments/actor_learner.html#actorlearnercore.learn',
+                                                                                                               'ddopai/experiments/actor_learner.py'),
+                                                  'ddopai.experiments.actor_learner.ActorLearnerCore.publish_weights': ( '40_experiments/actor_learner.html#actorlearnercore.publish_weights',
+                                                                                                                         'ddopai/experiments/actor_learner.py'),
+                                                  'ddopai.experiments.actor_learner.ActorLearnerCore.start': ( '40_experiments/actor_learner.html#actorlearnercore.start',
+                                                                                                               'ddopai/experiments/actor_learner.py'),
+                                                  'ddopai.experiments.actor_learner._ActorAgent': ( '40_experiments/actor_learner.html#_actoragent',
+                                                                                                    'ddopai/experiments/actor_learner.py'),
+                                                  'ddopai.experiments.actor_learner._ActorAgent.__init__': ( '40_experiments/actor_learner.html#_actoragent.__init__',
+                                                                                                             'ddopai/experiments/actor_learner.py'),
+                                                  'ddopai.experiments.actor_learner._ActorAgent.draw_action': ( '40_experiments/actor_learner.html#_actoragent.draw_action',
+                                                                                                                'ddopai/experiments/actor_learner.py'),
+                                                  'ddopai.experiments.actor_learner._ActorAgent.episode_start': ( '40_experiments/actor_learner.html#_actoragent.episode_start',
+                                                                                                                  'ddopai/experiments/actor_learner.py'),
+                                                  'ddopai.experiments.actor_learner._ActorAgent.fit': ( '40_experiments/actor_learner.html#_actoragent.fit',
+                                                                                                        'ddopai/experiments/actor_learner.py'),
+                                                  'ddopai.experiments.actor_learner._ActorAgent.preprocessors': ( '40_experiments/actor_learner.html#_actoragent.preprocessors',
+                                                                                                                  'ddopai/experiments/actor_learner.py'),
+                                                  'ddopai.experiments.actor_learner._ActorAgent.stop': ( '40_experiments/actor_learner.html#_actoragent.stop',
+                                                                                                         'ddopai/experiments/actor_learner.py'),
+                                                  'ddopai.experiments.actor_learner._ActorAgent.sync_weights': ( '40_experiments/actor_learner.html#_actoragent.sync_weights',
+                                                                                                                 'ddopai/experiments/actor_learner.py'),
+                                                  'ddopai.experiments.actor_learner._StopActor': ( '40_experiments/actor_learner.html#_stopactor',
+                                                                                                   'ddopai/experiments/actor_learner.py'),
+                                                  'ddopai.experiments.actor_learner._run_actor': ( '40_experiments/actor_learner.html#_run_actor',
+                                                                                                   'ddopai/experiments/actor_learner.py')},
+            'ddopai.experiments.backtesting': { 'ddopai.experiments.backtesting._fit_agent': ( '40_experiments/backtesting.html#_fit_agent',
+                                                                                               'ddopai/experiments/backtesting.py'),
+                                                'ddopai.experiments.backtesting._predict': ( '40_experiments/backtesting.html#_predict',
+                                                                                             'ddopai/experiments/backtesting.py'),
+                                                'ddopai.experiments.backtesting._run_origins': ( '40_experiments/backtesting.html#_run_origins',
+                                                                                                 'ddopai/experiments/backtesting.py'),
+                                                'ddopai.experiments.backtesting.rolling_origins': ( '40_experiments/backtesting.html#rolling_origins',
+                                                                                                    'ddopai/experiments/backtesting.py'),
+                                                'ddopai.experiments.backtesting.run_backtest': ( '40_experiments/backtesting.html#run_backtest',
+                                                                                                 'ddopai/experiments/backtesting.py'),
+                                                'ddopai.experiments.backtesting.split_view': ( '40_experiments/backtesting.html#split_view',
+                                                                                               'ddopai/experiments/backtesting.py')},
             'ddopai.experiments.experiment_functions': { 'ddopai.experiments.experiment_functions.EarlyStoppingHandler': ( '40_experiments/experiment_functions.html#earlystoppinghandler',
                                                                                                                            'ddopai/experiments/experiment_functions.py'),
                                                          'ddopai.experiments.experiment_functions.EarlyStoppingHandler.__init__': ( '40_experiments/experiment_functions.html#earlystoppinghandler.__init__',
                                                                                                                                     'ddopai/experiments/experiment_functions.py'),
+                                                         'ddopai.experiments.experiment_functions.EarlyStoppingHandler._update_windows': ( '40_experiments/experiment_functions.html#earlystoppinghandler._update_windows',
+                                                                                                                                           'ddopai/experiments/experiment_functions.py'),
                                                          'ddopai.experiments.experiment_functions.EarlyStoppingHandler.add_result': ( '40_experiments/experiment_functions.html#earlystoppinghandler.add_result',
                                                                                                                                       'ddopai/experiments/experiment_functions.py'),
+                                                         'ddopai.experiments.experiment_functions.EarlyStoppingHandler.history': ( '40_experiments/experiment_functions.html#earlystoppinghandler.history',
+                                                                                                                                   'ddopai/experiments/experiment_functions.py'),
+                                                         'ddopai.experiments.experiment_functions.EarlyStoppingHandler.reset': ( '40_experiments/experiment_functions.html#earlystoppinghandler.reset',
+                                                                                                                                 'ddopai/experiments/experiment_functions.py'),
+                                                         'ddopai.experiments.experiment_functions.EvaluationCache': ( '40_experiments/experiment_functions.html#evaluationcache',
+                                                                                                                      'ddopai/experiments/experiment_functions.py'),
+                                                         'ddopai.experiments.experiment_functions.EvaluationCache.__init__': ( '40_experiments/experiment_functions.html#evaluationcache.__init__',
+                                                                                                                               'ddopai/experiments/experiment_functions.py'),
+                                                         'ddopai.experiments.experiment_functions.EvaluationCache.is_supported': ( '40_experiments/experiment_functions.html#evaluationcache.is_supported',
+                                                                                                                                   'ddopai/experiments/experiment_functions.py'),
+                                                         'ddopai.experiments.experiment_functions.EvaluationCache.test_agent': ( '40_experiments/experiment_functions.html#evaluationcache.test_agent',
+                                                                                                                                 'ddopai/experiments/experiment_functions.py'),
                                                          'ddopai.experiments.experiment_functions.calculate_score': ( '40_experiments/experiment_functions.html#calculate_score',
                                                                                                                       'ddopai/experiments/experiment_functions.py'),
                                                          'ddopai.experiments.experiment_functions.log_info': ( '40_experiments/experiment_functions.html#log_info',
                                                                                                                'ddopai/experiments/experiment_functions.py'),
+                                                         'ddopai.experiments.experiment_functions.log_profiling': ( '40_experiments/experiment_functions.html#log_profiling',
+                                                                                                                    'ddopai/experiments/experiment_functions.py'),
                                                          'ddopai.experiments.experiment_functions.run_experiment': ( '40_experiments/experiment_functions.html#run_experiment',
                                                                                                                      'ddopai/experiments/experiment_functions.py'),
                                                          'ddopai.experiments.experiment_functions.run_test_episode': ( '40_experiments/experiment_functions.html#run_test_episode',
@@ -838,14 +1128,102 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                                   'ddopai/experiments/meta_experiment_functions.py'),
                                                               'ddopai.experiments.meta_experiment_functions.transfer_lag_window_to_env': ( '40_experiments/meta_experiment_functions.html#transfer_lag_window_to_env',
                                                                                                                                            'ddopai/experiments/meta_experiment_functions.py')},
+            'ddopai.experiments.sweeps': { 'ddopai.experiments.sweeps.ASHAScheduler': ( '40_experiments/sweeps.html#ashascheduler',
+                                                                                        'ddopai/experiments/sweeps.py'),
+                                           'ddopai.experiments.sweeps.ASHAScheduler.__init__': ( '40_experiments/sweeps.html#ashascheduler.__init__',
+                                                                                                 'ddopai/experiments/sweeps.py'),
+                                           'ddopai.experiments.sweeps.ASHAScheduler._record': ( '40_experiments/sweeps.html#ashascheduler._record',
+                                                                                                'ddopai/experiments/sweeps.py'),
+                                           'ddopai.experiments.sweeps.ASHAScheduler._rung_path': ( '40_experiments/sweeps.html#ashascheduler._rung_path',
+                                                                                                   'ddopai/experiments/sweeps.py'),
+                                           'ddopai.experiments.sweeps.ASHAScheduler.cutoff': ( '40_experiments/sweeps.html#ashascheduler.cutoff',
+                                                                                               'ddopai/experiments/sweeps.py'),
+                                           'ddopai.experiments.sweeps.ASHAScheduler.handler': ( '40_experiments/sweeps.html#ashascheduler.handler',
+                                                                                                'ddopai/experiments/sweeps.py'),
+                                           'ddopai.experiments.sweeps.ASHAScheduler.on_result': ( '40_experiments/sweeps.html#ashascheduler.on_result',
+                                                                                                  'ddopai/experiments/sweeps.py'),
+                                           'ddopai.experiments.sweeps.ASHAScheduler.recorded': ( '40_experiments/sweeps.html#ashascheduler.recorded',
+                                                                                                 'ddopai/experiments/sweeps.py'),
+                                           'ddopai.experiments.sweeps.ASHATrialHandler': ( '40_experiments/sweeps.html#ashatrialhandler',
+                                                                                           'ddopai/experiments/sweeps.py'),
+                                           'ddopai.experiments.sweeps.ASHATrialHandler.__init__': ( '40_experiments/sweeps.html#ashatrialhandler.__init__',
+                                                                                                    'ddopai/experiments/sweeps.py'),
+                                           'ddopai.experiments.sweeps.ASHATrialHandler.add_result': ( '40_experiments/sweeps.html#ashatrialhandler.add_result',
+                                                                                                      'ddopai/experiments/sweeps.py'),
+                                           'ddopai.experiments.sweeps._dataloader_template': ( '40_experiments/sweeps.html#_dataloader_template',
+                                                                                               'ddopai/experiments/sweeps.py'),
+                                           'ddopai.experiments.sweeps._grid_values': ( '40_experiments/sweeps.html#_grid_values',
+                                                                                       'ddopai/experiments/sweeps.py'),
+                                           'ddopai.experiments.sweeps._run_trial': ( '40_experiments/sweeps.html#_run_trial',
+                                                                                     'ddopai/experiments/sweeps.py'),
+                                           'ddopai.experiments.sweeps._sample_value': ( '40_experiments/sweeps.html#_sample_value',
+                                                                                        'ddopai/experiments/sweeps.py'),
+                                           'ddopai.experiments.sweeps._thread_env_variables': ( '40_experiments/sweeps.html#_thread_env_variables',
+                                                                                                'ddopai/experiments/sweeps.py'),
+                                           'ddopai.experiments.sweeps.apply_params': ( '40_experiments/sweeps.html#apply_params',
+                                                                                       'ddopai/experiments/sweeps.py'),
+                                           'ddopai.experiments.sweeps.limit_threads': ( '40_experiments/sweeps.html#limit_threads',
+                                                                                        'ddopai/experiments/sweeps.py'),
+                                           'ddopai.experiments.sweeps.load_shared_data': ( '40_experiments/sweeps.html#load_shared_data',
+                                                                                           'ddopai/experiments/sweeps.py'),
+                                           'ddopai.experiments.sweeps.run_sweep': ( '40_experiments/sweeps.html#run_sweep',
+                                                                                    'ddopai/experiments/sweeps.py'),
+                                           'ddopai.experiments.sweeps.sample_configs': ( '40_experiments/sweeps.html#sample_configs',
+                                                                                         'ddopai/experiments/sweeps.py'),
+                                           'ddopai.experiments.sweeps.share_data': ( '40_experiments/sweeps.html#share_data',
+                                                                                     'ddopai/experiments/sweeps.py')},
             'ddopai.experiments.tracking': { 'ddopai.experiments.tracking.get_git_hash': ( '40_experiments/tracking.html#get_git_hash',
                                                                                            'ddopai/experiments/tracking.py'),
                                              'ddopai.experiments.tracking.get_library_version': ( '40_experiments/tracking.html#get_library_version',
                                                                                                   'ddopai/experiments/tracking.py')},
+            'ddopai.fast_loss_functions': { 'ddopai.fast_loss_functions._get_pinball_kernel': ( '00_utils/fast_loss_functions.html#_get_pinball_kernel',
+                                                                                                'ddopai/fast_loss_functions.py'),
+                                            'ddopai.fast_loss_functions._pinball_kernel': ( '00_utils/fast_loss_functions.html#_pinball_kernel',
+                                                                                            'ddopai/fast_loss_functions.py'),
+                                            'ddopai.fast_loss_functions.pinball_loss_batch': ( '00_utils/fast_loss_functions.html#pinball_loss_batch',
+                                                                                               'ddopai/fast_loss_functions.py'),
+                                            'ddopai.fast_loss_functions.pinball_loss_fast': ( '00_utils/fast_loss_functions.html#pinball_loss_fast',
+                                                                                              'ddopai/fast_loss_functions.py'),
+                                            'ddopai.fast_loss_functions.quantile_loss_batch': ( '00_utils/fast_loss_functions.html#quantile_loss_batch',
+                                                                                                'ddopai/fast_loss_functions.py'),
+                                            'ddopai.fast_loss_functions.quantile_loss_fast': ( '00_utils/fast_loss_functions.html#quantile_loss_fast',
+                                                                                               'ddopai/fast_loss_functions.py')},
             'ddopai.loss_functions': { 'ddopai.loss_functions.pinball_loss': ( '00_utils/loss_functions.html#pinball_loss',
                                                                                'ddopai/loss_functions.py'),
                                        'ddopai.loss_functions.quantile_loss': ( '00_utils/loss_functions.html#quantile_loss',
                                                                                 'ddopai/loss_functions.py')},
+            'ddopai.profiling': { 'ddopai.profiling.TimerRegistry': ('00_utils/profiling.html#timerregistry', 'ddopai/profiling.py'),
+                                  'ddopai.profiling.TimerRegistry.__enter__': ( '00_utils/profiling.html#timerregistry.__enter__',
+                                                                                'ddopai/profiling.py'),
+                                  'ddopai.profiling.TimerRegistry.__exit__': ( '00_utils/profiling.html#timerregistry.__exit__',
+                                                                               'ddopai/profiling.py'),
+                                  'ddopai.profiling.TimerRegistry.__init__': ( '00_utils/profiling.html#timerregistry.__init__',
+                                                                               'ddopai/profiling.py'),
+                                  'ddopai.profiling.TimerRegistry.disable': ( '00_utils/profiling.html#timerregistry.disable',
+                                                                              'ddopai/profiling.py'),
+                                  'ddopai.profiling.TimerRegistry.enable': ( '00_utils/profiling.html#timerregistry.enable',
+                                                                             'ddopai/profiling.py'),
+                                  'ddopai.profiling.TimerRegistry.flat_summary': ( '00_utils/profiling.html#timerregistry.flat_summary',
+                                                                                   'ddopai/profiling.py'),
+                                  'ddopai.profiling.TimerRegistry.log_summary': ( '00_utils/profiling.html#timerregistry.log_summary',
+                                                                                  'ddopai/profiling.py'),
+                                  'ddopai.profiling.TimerRegistry.record': ( '00_utils/profiling.html#timerregistry.record',
+                                                                             'ddopai/profiling.py'),
+                                  'ddopai.profiling.TimerRegistry.reset': ( '00_utils/profiling.html#timerregistry.reset',
+                                                                            'ddopai/profiling.py'),
+                                  'ddopai.profiling.TimerRegistry.summary': ( '00_utils/profiling.html#timerregistry.summary',
+                                                                              'ddopai/profiling.py'),
+                                  'ddopai.profiling.TimerRegistry.timer': ( '00_utils/profiling.html#timerregistry.timer',
+                                                                            'ddopai/profiling.py'),
+                                  'ddopai.profiling.TimerRegistry.to_json': ( '00_utils/profiling.html#timerregistry.to_json',
+                                                                              'ddopai/profiling.py'),
+                                  'ddopai.profiling._Timer': ('00_utils/profiling.html#_timer', 'ddopai/profiling.py'),
+                                  'ddopai.profiling._Timer.__enter__': ('00_utils/profiling.html#_timer.__enter__', 'ddopai/profiling.py'),
+                                  'ddopai.profiling._Timer.__exit__': ('00_utils/profiling.html#_timer.__exit__', 'ddopai/profiling.py'),
+                                  'ddopai.profiling._Timer.__init__': ('00_utils/profiling.html#_timer.__init__', 'ddopai/profiling.py'),
+                                  'ddopai.profiling.import_time': ('00_utils/profiling.html#import_time', 'ddopai/profiling.py'),
+                                  'ddopai.profiling.import_time_benchmark': ( '00_utils/profiling.html#import_time_benchmark',
+                                                                              'ddopai/profiling.py')},
             'ddopai.torch_utils.loss_functions': { 'ddopai.torch_utils.loss_functions.TorchPinballLoss': ( '00_utils/torch_loss_functions.html#torchpinballloss',
                                                                                                            'ddopai/torch_utils/loss_functions.py'),
                                                    'ddopai.torch_utils.loss_functions.TorchPinballLoss.__init__': ( '00_utils/torch_loss_functions.html#torchpinballloss.__init__',
@@ -876,11 +1254,18 @@ d = { 'settings': { 'branch': 'main',
                                                                                'ddopai/utils.py'),
                               'ddopai.utils.DatasetWrapperMeta.__init__': ( '00_utils/utils.html#datasetwrappermeta.__init__',
                                                                             'ddopai/utils.py'),
+                              'ddopai.utils.LazyModule': ('00_utils/utils.html#lazymodule', 'ddopai/utils.py'),
+                              'ddopai.utils.LazyModule.__getattr__': ('00_utils/utils.html#lazymodule.__getattr__', 'ddopai/utils.py'),
+                              'ddopai.utils.LazyModule.__init__': ('00_utils/utils.html#lazymodule.__init__', 'ddopai/utils.py'),
+                              'ddopai.utils.LazyModule.__repr__': ('00_utils/utils.html#lazymodule.__repr__', 'ddopai/utils.py'),
+                              'ddopai.utils.LazyModule._load': ('00_utils/utils.html#lazymodule._load', 'ddopai/utils.py'),
                               'ddopai.utils.MDPInfo': ('00_utils/utils.html#mdpinfo', 'ddopai/utils.py'),
                               'ddopai.utils.MDPInfo.__init__': ('00_utils/utils.html#mdpinfo.__init__', 'ddopai/utils.py'),
                               'ddopai.utils.MDPInfo.shape': ('00_utils/utils.html#mdpinfo.shape', 'ddopai/utils.py'),
                               'ddopai.utils.MDPInfo.size': ('00_utils/utils.html#mdpinfo.size', 'ddopai/utils.py'),
                               'ddopai.utils.Parameter': ('00_utils/utils.html#parameter', 'ddopai/utils.py'),
                               'ddopai.utils.check_parameter_types': ('00_utils/utils.html#check_parameter_types', 'ddopai/utils.py'),
+                              'ddopai.utils.get_default_dtype': ('00_utils/utils.html#get_default_dtype', 'ddopai/utils.py'),
                               'ddopai.utils.merge_dictionaries': ('00_utils/utils.html#merge_dictionaries', 'ddopai/utils.py'),
+                              'ddopai.utils.set_default_dtype': ('00_utils/utils.html#set_default_dtype', 'ddopai/utils.py'),
                               'ddopai.utils.set_param': ('00_utils/utils.html#set_param', 'ddopai/utils.py')}}}
@@ -15,6 +15,7 @@ import numpy as np
 
 from ..envs.base import BaseEnvironment
 from ..utils import MDPInfo, Parameter
+from ..profiling import PROFILER
 import numbers
 
 # # TEMPORARY
@@ -56,10 +57,27 @@ class BaseAgent():
 
         observation = self.add_batch_dim(observation) # adds batch dim if self.receive_batch_dim is False
 
-        for obsprocessor in self.obsprocessors:
-            observation = obsprocessor(observation) # applies all preprocessors to the dict observation
+        with PROFILER.timer("agent.obsprocessors"):
+            for obsprocessor in self.obsprocessors:
+                observation = obsprocessor(observation) # applies all preprocessors to the dict observation
         
-        action = self.draw_action_(observation)
+        with PROFILER.timer("agent.draw_action"):
+            action = self.draw_action_(observation)
+
+        return action
+
+    def draw_action_batch(self, observations: np.ndarray | dict[str, np.ndarray]) -> np.ndarray: #
+
+        """
+        Draw actions for a batch of observations at once, e.g., a full validation set. The observations
+        must already have a batch dimension as first dimension. Applies the obsprocessors to the full batch.
+        The returned array has one action per observation along the first dimension.
+        """
+
+        for obsprocessor in self.obsprocessors:
+            observations = obsprocessor(observations)
+
+        action = self.draw_action_(observations)
 
         return action
 
@@ -10,6 +10,7 @@ AGENT_CLASSES = {
     "RandomAgent": "ddopai.agents.saa.SAA", #
 
     "SAA": "ddopai.agents.newsvendor.saa.NewsvendorSAAagent",
+    "OnlineSAA": "ddopai.agents.newsvendor.saa.NewsvendorOnlineSAAagent",
     "wSAA": "ddopai.agents.newsvendor.saa.NewsvendorRFwSAAagent",
     "RFwSAA": "ddopai.agents.newsvendor.saa.NewsvendorRFwSAAagent",
 
@@ -3,10 +3,11 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/30_agents/40_ml_utils.ipynb.
 
 # %% auto 0
-__all__ = ['LRSchedulerPerStep']
+__all__ = ['LRSchedulerPerStep', 'network_summary', 'log_network_summary', 'log_torchinfo_summary']
 
 # %% ../../nbs/30_agents/40_ml_utils.ipynb 3
 from typing import  List, Tuple, Literal
+import logging
 import torch
 
 # %% ../../nbs/30_agents/40_ml_utils.ipynb 4
@@ -39,3 +40,53 @@ class LRSchedulerPerStep():
         
         for param_group in self.optimizer.param_groups:
             param_group['lr'] = lr
+
+# %% ../../nbs/30_agents/40_ml_utils.ipynb 5
+def network_summary(model: torch.nn.Module, # network to summarize
+                    ) -> str:
+
+    """
+    Summarize a network from its module metadata: one line per module with parameters (name, type, parameter shapes
+    and number of parameters) followed by the totals. Unlike the torchinfo summary, no forward pass is needed.
+    """
+
+    lines = [f"{'Layer':<40}{'Type':<16}{'Parameter shapes':<36}{'Params':>12}", "=" * 104]
+
+    for name, module in model.named_modules():
+        parameters = list(module.parameters(recurse=False))
+        if len(parameters) == 0:
+            continue
+        shapes = ", ".join(str(tuple(parameter.shape)) for parameter in parameters)
+        n_parameters = sum(parameter.numel() for parameter in parameters)
+        lines.append(f"{name or type(model).__name__:<40}{type(module).__name__:<16}{shapes:<36}{n_parameters:>12,}")
+
+    total = sum(parameter.numel() for parameter in model.parameters())
+    trainable = sum(parameter.numel() for parameter in model.parameters() if parameter.requires_grad)
+    size = sum(parameter.numel() * parameter.element_size() for parameter in model.parameters()) / 1e6
+
+    lines += ["=" * 104, f"Total params: {total:,}", f"Trainable params: {trainable:,}", f"Params size (MB): {size:.2f}"]
+
+    return "\n".join(lines)
+
+def log_network_summary(model: torch.nn.Module, # network to summarize
+                        ):
+
+    """ Log the ```network_summary``` of a network if INFO logging is enabled """
+
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info("\n%s", network_summary(model))
+
+def log_torchinfo_summary(model: torch.nn.Module, # network to summarize
+                            device: str = "cpu", # device of the network
+                            input_data: Tuple | None = None, # example inputs for the forward pass
+                            input_size: List | Tuple | None = None, # alternatively, the input shapes (including batch dimension)
+                            ):
+
+    """
+    Log the full torchinfo summary of a network. This requires a forward pass with the example inputs
+    and is therefore only meant to be used when explicitly requested (via ```network_summary="torchinfo"``` of the agents).
+    """
+
+    from torchinfo import summary # only imported when the full summary is requested
+
+    logging.info("\n%s", summary(model, input_data=input_data, input_size=input_size, device=device, verbose=0))
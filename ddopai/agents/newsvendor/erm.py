@@ -15,10 +15,6 @@ from typing import Union, Optional, List, Tuple, Literal, Callable, Dict
 import numpy as np
 import os
 from tqdm import tqdm
-import time
-from IPython import get_ipython
-
-import xgboost as xgb
 
 from ...envs.base import BaseEnvironment
 from ..base import BaseAgent
@@ -26,13 +22,16 @@ from ...utils import MDPInfo, Parameter, DatasetWrapper, DatasetWrapperMeta
 from ...torch_utils.loss_functions import TorchQuantileLoss, TorchPinballLoss
 from ..obsprocessors import FlattenTimeDimNumpy
 from ...dataloaders.base import BaseDataLoader
-from ..ml_utils import LRSchedulerPerStep
+from ..ml_utils import LRSchedulerPerStep, log_network_summary, log_torchinfo_summary
+from ...checkpointing import state_dict_to_cpu, atomic_torch_save
+from ...utils import LazyModule
 
 import torch
 
-from torchinfo import summary
-
 # %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 4
+xgb = LazyModule("xgboost") # only imported when an XGB agent is created
+
+# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 5
 class NewsvendorXGBAgent(BaseAgent):
 
     """
@@ -75,7 +74,10 @@ class NewsvendorXGBAgent(BaseAgent):
 
                     ### General params
                     nthread: int = 1,
-                    device: str = "CPU"):
+                    device: str = "CPU",
+
+                    warm_start_estimators: int | None = None, # number of trees added by a warm-started fit, default: n_estimators of the model
+                    ):
 
         # if float, convert to array
         cu = self.convert_to_numpy_array(cu)
@@ -83,6 +85,7 @@ class NewsvendorXGBAgent(BaseAgent):
 
         self.sl = cu / (cu + co)
         self.fitted = False
+        self.warm_start_estimators = warm_start_estimators
 
         self.model = xgb.XGBRegressor(
             objective = "reg:quantileerror",
@@ -124,17 +127,32 @@ class NewsvendorXGBAgent(BaseAgent):
 
     def fit(self,
             X: np.ndarray, # features will be ignored
-            Y: np.ndarray) -> None:
+            Y: np.ndarray,
+            warm_start: bool = False, # if True and the agent is already fitted, boosting continues from the current model
+            ) -> None:
 
         """
 
-        Fit the agent to the data by training the XGBoost model.
+        Fit the agent to the data by training the XGBoost model. With warm_start, the new trees are added
+        to the current model instead of training from scratch (e.g., to update the model when new data arrives).
+        Each warm-started fit adds ```warm_start_estimators``` trees (by default as many as the initial fit), such that
+        the ensemble and the prediction time grow linearly with the number of warm-started fits.
 
         """
 
         if X.ndim == 3:
             X = X.reshape(X.shape[0], -1)
-        self.model.fit(X, Y)
+
+        if warm_start and self.fitted:
+            n_estimators = self.model.get_params()["n_estimators"]
+            if self.warm_start_estimators is not None:
+                self.model.set_params(n_estimators=self.warm_start_estimators)
+            try:
+                self.model.fit(X, Y, xgb_model=self.model.get_booster())
+            finally:
+                self.model.set_params(n_estimators=n_estimators) # a fit from scratch uses the original number of trees
+        else:
+            self.model.fit(X, Y)
         self.fitted = True
     
     def draw_action_(self, 
@@ -194,7 +212,7 @@ class NewsvendorXGBAgent(BaseAgent):
 
 
 
-# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 5
+# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 6
 class SGDBaseAgent(BaseAgent):
 
     """
@@ -219,6 +237,7 @@ class SGDBaseAgent(BaseAgent):
             agent_name: str | None = None,
             test_batch_size: int = 1024,
             receive_batch_dim: bool = False,
+            network_summary: Literal["light", "torchinfo"] = "light", # "torchinfo" logs the full torchinfo summary (requires a forward pass)
             ):
         
         # Initialize default values for mutable arguments
@@ -241,10 +260,10 @@ class SGDBaseAgent(BaseAgent):
 
         batch_dim = 1
         logging.info("Network architecture:")
-        if logging.getLogger().isEnabledFor(logging.INFO):
+        if network_summary == "torchinfo": # the full torchinfo summary needs a forward pass with random inputs
 
             self.model.eval()
-            print(self.obsprocessors)
+            logging.debug("obsprocessors: %s", self.obsprocessors)
             if any(isinstance(obsprocessor, FlattenTimeDimNumpy) for obsprocessor in self.obsprocessors):
                 input_size = (batch_dim, int(np.prod(input_shape)))
             else:
@@ -253,11 +272,12 @@ class SGDBaseAgent(BaseAgent):
             input_tensor = torch.randn(*input_size).to(self.device)
             input_tuple = (input_tensor,)
 
-            if get_ipython() is not None:
-                print(summary(self.model, input_data=input_tuple, device=self.device))
-            else:
-                summary(self.model, input_data=input_tuple, device=self.device)
-            time.sleep(0.2)
+            log_torchinfo_summary(self.model, self.device, input_data=input_tuple)
+            self.model.train() # the agent starts in train mode
+        elif network_summary == "light":
+            log_network_summary(self.model)
+        else:
+            raise ValueError("network_summary must be 'light' or 'torchinfo'")
 
         self.to(self.device)
 
@@ -355,7 +375,7 @@ class SGDBaseAgent(BaseAgent):
                 X, y = output
                 loss_function_params = None
 
-            # convert X and y to float32
+            # convert X and y to float32 (no copy if the data is already served as float32, the default dtype)
             X = X.type(torch.float32)
             y = y.type(torch.float32)
             
@@ -413,7 +433,7 @@ class SGDBaseAgent(BaseAgent):
             X = batch
 
 
-            X = torch.tensor(X, dtype=torch.float32)
+            X = torch.as_tensor(X, dtype=torch.float32) # no copy if X is already float32
             X = X.to(device)
 
             with torch.no_grad():
@@ -465,24 +485,55 @@ class SGDBaseAgent(BaseAgent):
 
         """
         
+        self.write_checkpoint(path, self.get_checkpoint(), overwrite=overwrite)
+
+    def get_checkpoint(self) -> Dict: #
+
+        """
+        Return a copy of the model's state_dict on the CPU, keyed by the file name it is saved to.
+        The copy can be written to disk later (e.g., by a background thread) while training continues.
+        """
+
         if not hasattr(self, 'model') or self.model is None:
             raise AttributeError("Model is not defined in the class.")
 
+        return {"model.pth": state_dict_to_cpu(self.model.state_dict())}
+
+    def write_checkpoint(self,
+                path: str, # The directory where the file will be saved.
+                checkpoint: Dict, # Checkpoint as returned by get_checkpoint
+                overwrite: bool=True): # Allow overwriting; if False, a FileExistsError will be raised if the file exists.
+
+        """
+        Write a checkpoint to the specified directory. Each file is first written to a temporary
+        file and then renamed, such that an interrupted write never leaves a corrupt model file behind.
+        """
+
         # Create the directory path if it does not exist
         os.makedirs(path, exist_ok=True)
 
-        # Construct the file path using os.path.join for better cross-platform compatibility
-        full_path = os.path.join(path, "model.pth")
+        for file_name, state_dict in checkpoint.items():
 
-        if os.path.exists(full_path):
-            if not overwrite:
-                raise FileExistsError(f"The file {full_path} already exists and will not be overwritten.")
-            else:
-                logging.debug(f"Overwriting file {full_path}") # Only log with info as during training we will continuously overwrite the model
-        
-        # Save the model's state_dict using torch.save
-        torch.save(self.model.state_dict(), full_path)
-        logging.debug(f"Model saved successfully to {full_path}")
+            # Construct the file path using os.path.join for better cross-platform compatibility
+            full_path = os.path.join(path, file_name)
+
+            if os.path.exists(full_path):
+                if not overwrite:
+                    raise FileExistsError(f"The file {full_path} already exists and will not be overwritten.")
+                else:
+                    logging.debug(f"Overwriting file {full_path}") # Only log with info as during training we will continuously overwrite the model
+            
+            # Save the model's state_dict using torch.save
+            atomic_torch_save(state_dict, full_path)
+            logging.debug(f"Model saved successfully to {full_path}")
+
+    def load_checkpoint(self, checkpoint: Dict): #
+
+        """
+        Load a checkpoint as returned by get_checkpoint from memory.
+        """
+
+        self.model.load_state_dict(checkpoint["model.pth"])
 
     def load(self, path: str): # Only the path to the folder is needed, not the file itself
  
@@ -510,7 +561,7 @@ class SGDBaseAgent(BaseAgent):
             raise RuntimeError(f"An error occurred while loading the model: {e}")
     
 
-# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 21
+# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 24
 class NVBaseAgent(SGDBaseAgent):
 
     """
@@ -535,6 +586,7 @@ class NVBaseAgent(SGDBaseAgent):
                 agent_name: str | None = None,
                 test_batch_size: int = 1024,
                 receive_batch_dim: bool = False,
+                network_summary: Literal["light", "torchinfo"] = "light", # "torchinfo" logs the full torchinfo summary (requires a forward pass)
                 loss_function: Literal["quantile", "pinball"] = "quantile", 
                 ):
 
@@ -562,6 +614,7 @@ class NVBaseAgent(SGDBaseAgent):
             agent_name=agent_name,
             test_batch_size=test_batch_size,
             receive_batch_dim=receive_batch_dim,
+            network_summary=network_summary,
         )   
         
     def set_loss_function(self):
@@ -583,7 +636,7 @@ class NVBaseAgent(SGDBaseAgent):
         else:
             raise ValueError(f"Loss function {self.loss_function} not supported")
 
-# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 24
+# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 27
 class NewsvendorlERMAgent(NVBaseAgent):
 
     """
@@ -610,6 +663,7 @@ class NewsvendorlERMAgent(NVBaseAgent):
                 agent_name: str | None = "lERM",
                 test_batch_size: int = 1024,
                 receive_batch_dim: bool = False,
+                network_summary: Literal["light", "torchinfo"] = "light", # "torchinfo" logs the full torchinfo summary (requires a forward pass)
                 loss_function: Literal["quantile", "pinball"] = "quantile", 
                 ):
 
@@ -636,6 +690,7 @@ class NewsvendorlERMAgent(NVBaseAgent):
             agent_name=agent_name,
             test_batch_size=test_batch_size,
             receive_batch_dim=receive_batch_dim,
+            network_summary=network_summary,
             loss_function=loss_function,
         )
     def set_model(self, input_shape, output_shape):
@@ -650,7 +705,7 @@ class NewsvendorlERMAgent(NVBaseAgent):
 
         self.model = LinearModel(input_size=input_size, output_size=output_size, **self.model_params)
 
-# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 31
+# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 34
 class NewsvendorDLAgent(NVBaseAgent):
 
     """
@@ -678,6 +733,7 @@ class NewsvendorDLAgent(NVBaseAgent):
                 agent_name: str | None = "DLNV",
                 test_batch_size: int = 1024,
                 receive_batch_dim: bool = False,
+                network_summary: Literal["light", "torchinfo"] = "light", # "torchinfo" logs the full torchinfo summary (requires a forward pass)
                 loss_function: Literal["quantile", "pinball"] = "quantile",
                 ):
 
@@ -707,6 +763,7 @@ class NewsvendorDLAgent(NVBaseAgent):
             agent_name=agent_name,
             test_batch_size=test_batch_size,
             receive_batch_dim=receive_batch_dim,
+            network_summary=network_summary,
             loss_function=loss_function,
         )
         
@@ -715,14 +772,14 @@ class NewsvendorDLAgent(NVBaseAgent):
         """Set the model for the agent to an MLP"""
 
         # flatten time dim of input
-        print("input shape", input_shape)
+        logging.debug("input shape: %s", input_shape)
         input_size = np.prod(input_shape)
         output_size = output_shape[0]
 
         from ddopai.approximators import MLP
         self.model = MLP(input_size=input_size, output_size=output_size, **self.model_params)
 
-# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 37
+# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 41
 class BaseMetaAgent():
 
     def set_meta_dataloader(
@@ -738,7 +795,7 @@ class BaseMetaAgent():
 
         self.dataloader = torch.utils.data.DataLoader(dataset, **dataloader_params)
 
-# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 38
+# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 42
 class NewsvendorlERMMetaAgent(NewsvendorlERMAgent, BaseMetaAgent):
 
     """
@@ -769,6 +826,7 @@ class NewsvendorlERMMetaAgent(NewsvendorlERMAgent, BaseMetaAgent):
                 agent_name: str | None = "lERMMeta",
                 test_batch_size: int = 1024,
                 receive_batch_dim: bool = False,
+                network_summary: Literal["light", "torchinfo"] = "light", # "torchinfo" logs the full torchinfo summary (requires a forward pass)
                 loss_function: Literal["quantile", "pinball"] = "quantile",
                 ):
 
@@ -790,10 +848,11 @@ class NewsvendorlERMMetaAgent(NewsvendorlERMAgent, BaseMetaAgent):
             agent_name=agent_name,
             test_batch_size=test_batch_size,
             receive_batch_dim = receive_batch_dim,
+            network_summary=network_summary,
             loss_function=loss_function,
         )
 
-# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 39
+# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 43
 class NewsvendorDLMetaAgent(NewsvendorDLAgent, BaseMetaAgent):
 
     """
@@ -825,6 +884,7 @@ class NewsvendorDLMetaAgent(NewsvendorDLAgent, BaseMetaAgent):
                 agent_name: str | None = "DLNV",
                 test_batch_size: int = 1024,
                 receive_batch_dim: bool = False,
+                network_summary: Literal["light", "torchinfo"] = "light", # "torchinfo" logs the full torchinfo summary (requires a forward pass)
                 loss_function: Literal["quantile", "pinball"] = "quantile",
                 ):
 
@@ -848,11 +908,12 @@ class NewsvendorDLMetaAgent(NewsvendorDLAgent, BaseMetaAgent):
             agent_name=agent_name,
             test_batch_size=test_batch_size,
             receive_batch_dim=receive_batch_dim,
+            network_summary=network_summary,
             loss_function=loss_function,
         )
 
 
-# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 40
+# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 44
 class NewsvendorDLTransformerAgent(NVBaseAgent):
 
     """
@@ -880,6 +941,7 @@ class NewsvendorDLTransformerAgent(NVBaseAgent):
                 agent_name: str | None = "DLNV",
                 test_batch_size: int = 1024,
                 receive_batch_dim: bool = False,
+                network_summary: Literal["light", "torchinfo"] = "light", # "torchinfo" logs the full torchinfo summary (requires a forward pass)
                 loss_function: Literal["quantile", "pinball"] = "quantile",
                 ):
 
@@ -917,6 +979,7 @@ class NewsvendorDLTransformerAgent(NVBaseAgent):
             agent_name=agent_name,
             test_batch_size=test_batch_size,
             receive_batch_dim=receive_batch_dim,
+            network_summary=network_summary,
             loss_function=loss_function,
         )
          
@@ -932,7 +995,7 @@ class NewsvendorDLTransformerAgent(NVBaseAgent):
         from ddopai.approximators import Transformer
         self.model = Transformer(input_size=input_shape, output_size=output_size, **self.model_params)
 
-# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 41
+# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 45
 class NewsvendorDLTransformerMetaAgent(NewsvendorDLTransformerAgent, BaseMetaAgent):
 
     """
@@ -964,6 +1027,7 @@ class NewsvendorDLTransformerMetaAgent(NewsvendorDLTransformerAgent, BaseMetaAge
                 agent_name: str | None = "DLNV",
                 test_batch_size: int = 1024,
                 receive_batch_dim: bool = False,
+                network_summary: Literal["light", "torchinfo"] = "light", # "torchinfo" logs the full torchinfo summary (requires a forward pass)
                 loss_function: Literal["quantile", "pinball"] = "quantile",
                 ):
 
@@ -987,6 +1051,7 @@ class NewsvendorDLTransformerMetaAgent(NewsvendorDLTransformerAgent, BaseMetaAge
             agent_name=agent_name,
             test_batch_size=test_batch_size,
             receive_batch_dim=receive_batch_dim,
+            network_summary=network_summary,
             loss_function=loss_function,
         )
 
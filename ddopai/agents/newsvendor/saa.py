@@ -3,7 +3,8 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/30_agents/41_NV_agents/10_NV_saa_agents.ipynb.
 
 # %% auto 0
-__all__ = ['BaseSAAagent', 'NewsvendorSAAagent', 'BasewSAAagent', 'NewsvendorRFwSAAagent']
+__all__ = ['BaseSAAagent', 'NewsvendorSAAagent', 'BasewSAAagent', 'NewsvendorRFwSAAagent', 'QuantileSketch',
+           'NewsvendorOnlineSAAagent']
 
 # %% ../../../nbs/30_agents/41_NV_agents/10_NV_saa_agents.ipynb 3
 import logging
@@ -19,8 +20,7 @@ from ..base import BaseAgent
 from ...utils import MDPInfo
 from ..obsprocessors import FlattenTimeDimNumpy
 
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.utils.validation import check_array
+# sklearn is only imported by the agents that need it to keep the import of the plain SAA agent light
 
 # %% ../../../nbs/30_agents/41_NV_agents/10_NV_saa_agents.ipynb 4
 class BaseSAAagent(BaseAgent):
@@ -85,6 +85,8 @@ class BaseSAAagent(BaseAgent):
         
         """Validate X data before prediction"""
 
+        from sklearn.utils.validation import check_array
+
         X = check_array(X)
 
         n_features = X.shape[1]
@@ -432,6 +434,8 @@ class NewsvendorRFwSAAagent(BasewSAAagent):
 
         """
 
+        from sklearn.ensemble import RandomForestRegressor
+
         model = RandomForestRegressor(
             criterion=self.criterion,
             n_estimators=self.n_estimators,
@@ -477,3 +481,340 @@ class NewsvendorRFwSAAagent(BasewSAAagent):
         weightsPos = weights[weightPosIndex]
 
         return (weightsPos, weightPosIndex)
+
+# %% ../../../nbs/30_agents/41_NV_agents/10_NV_saa_agents.ipynb 29
+class QuantileSketch():
+
+    """
+    Mergeable quantile sketch of a stream of (weighted) values, following the merging t-digest. Values are
+    collected in a buffer and, once the buffer is full, merged into about ``compression/2`` centroids (mean and
+    weight). The k1 scale function keeps the centroids small at the tails, where service-level quantiles are typically
+    located. Until the first merge, the sketch holds all values and its quantiles are exact.
+    """
+
+    def __init__(self,
+                 compression: int = 200, # controls the number of centroids (about compression/2) and thereby accuracy and memory
+                 buffer_size: int | None = None, # number of centroids and buffered values that triggers a merge, defaults to 10*compression
+                 ):
+
+        if compression < 2:
+            raise ValueError("compression must be at least 2")
+
+        self.compression = compression
+        self.buffer_size = buffer_size or 10*compression
+
+        self.means = np.empty(0) # sorted centroid means
+        self.weights = np.empty(0) # centroid weights
+        self._buffer_means, self._buffer_weights = [], []
+        self._n_buffered = 0
+        self._cumulative_weights = None # cached for queries, reset by every update
+
+    def __len__(self):
+        return len(self.means)+self._n_buffered
+
+    @property
+    def total_weight(self) -> float:
+        return float(self.weights.sum()+sum(weights.sum() for weights in self._buffer_weights))
+
+    def update(self,
+               values: np.ndarray, # new values
+               weights: np.ndarray | float | None = None, # weights of the new values, 1 if None
+               ):
+
+        """
+        Add values to the buffer in O(len(values)). When the buffer is full, it is sorted and merged into the
+        centroids, which costs amortized O(log buffer_size) per value.
+        """
+
+        values = np.asarray(values, dtype=float).reshape(-1)
+        weights = np.ones_like(values) if weights is None else np.broadcast_to(np.asarray(weights, dtype=float), values.shape).copy()
+
+        self._buffer_means.append(values)
+        self._buffer_weights.append(weights)
+        self._n_buffered += len(values)
+        self._cumulative_weights = None
+
+        if len(self) > self.buffer_size:
+            self.compress()
+
+        return self
+
+    def scale(self,
+              factor: float, # factor all weights are multiplied with, e.g., for exponential decay
+              ):
+
+        """ Scale the weights of all values seen so far """
+
+        self.weights = self.weights*factor
+        self._buffer_weights = [weights*factor for weights in self._buffer_weights]
+        self._cumulative_weights = None
+
+        return self
+
+    def merge(self,
+              other: "QuantileSketch", # sketch to be merged into this one, it is not modified
+              ):
+
+        """ Merge another sketch (e.g., of another shard of the data) by adding its centroids and buffered values as weighted values """
+
+        means = np.concatenate([other.means, *other._buffer_means]) # the buffer of other is read without sorting it into its centroids
+        weights = np.concatenate([other.weights, *other._buffer_weights])
+        return self.update(means, weights)
+
+    def centroids(self) -> tuple[np.ndarray, np.ndarray]: # sorted means and weights
+
+        """ Sort the buffered values into the centroids (without merging) and return the centroids """
+
+        if self._n_buffered > 0:
+            means = np.concatenate([self.means, *self._buffer_means])
+            weights = np.concatenate([self.weights, *self._buffer_weights])
+            order = np.argsort(means, kind="stable")
+            self.means, self.weights = means[order], weights[order]
+            self._buffer_means, self._buffer_weights = [], []
+            self._n_buffered = 0
+
+        return self.means, self.weights
+
+    def compress(self):
+
+        """
+        Merge neighboring centroids such that each centroid spans at most one unit of the
+        k1 scale function k(q) = compression/(2*pi)*arcsin(2q-1).
+        """
+
+        means, weights = self.centroids()
+        keep = weights > 0 # values whose weight decayed to zero are dropped
+        means, weights = means[keep], weights[keep]
+
+        if len(means) > 1:
+            cumulative_weights = np.cumsum(weights)
+            q_left = (cumulative_weights-weights)/cumulative_weights[-1]
+            k = self.compression/(2*np.pi)*np.arcsin(np.clip(2*q_left-1, -1, 1))
+            groups = np.floor(k+self.compression/4).astype(np.int64) # k(0) = -compression/4
+            _, groups = np.unique(groups, return_inverse=True)
+            merged_weights = np.bincount(groups, weights=weights)
+            means = np.bincount(groups, weights=weights*means)/merged_weights
+            weights = merged_weights
+
+        self.means, self.weights = means, weights
+        self._cumulative_weights = None
+
+    def quantile(self,
+                 q: float | np.ndarray, # quantile level(s) in [0, 1]
+                 ) -> float | np.ndarray:
+
+        """
+        Smallest centroid mean at which the cumulative weight reaches q of the total weight, i.e., the
+        empirical quantile as long as no values have been merged. The first query after an update sorts the
+        buffer into the centroids, further queries take O(log k) for k centroids until the sketch is updated.
+        """
+
+        if self._cumulative_weights is None:
+            self.centroids()
+            self._cumulative_weights = np.cumsum(self.weights)
+        if len(self.means) == 0:
+            raise ValueError("The sketch is empty")
+
+        total_weight = self._cumulative_weights[-1]
+        target = np.asarray(q, dtype=float)*total_weight*(1-1e-12) # tolerance for rounding errors in q*total_weight
+        index = np.searchsorted(self._cumulative_weights, target, side="left")
+
+        return self.means[np.minimum(index, len(self.means)-1)]
+
+# %% ../../../nbs/30_agents/41_NV_agents/10_NV_saa_agents.ipynb 34
+class NewsvendorOnlineSAAagent(BaseSAAagent):
+
+    """
+    Newsvendor agent based on Sample Average Approximation that can be updated online. Instead of the
+    demand history, it keeps one mergeable ```QuantileSketch``` per SKU, such that new demand is added with
+    ```partial_fit``` in amortized O(log buffer_size) per datapoint, and quantiles for arbitrary service levels are
+    answered in O(log k) for k centroids. The quantiles at the service level are only recomputed when an action
+    is drawn after an update, such that frequent small updates do not sort the sketches each time. Old demand can be down-weighted with exponential decay. Agents fitted on
+    different shards of the data (e.g., one per store) can be combined with ```merge```.
+    """
+
+    def __init__(self,
+                environment_info: MDPInfo,
+                cu: float | np.ndarray, # underage cost
+                co: float | np.ndarray, # overage cost
+                compression: int = 200, # compression of the quantile sketches, see QuantileSketch
+                decay: float | None = None, # if set, the weight of each datapoint is multiplied by decay with every newer datapoint
+                obsprocessors: list[object] | None = None,
+                agent_name: str = "OnlineSAA",
+                ):
+
+            cu = self.convert_to_numpy_array(cu)
+            co = self.convert_to_numpy_array(co)
+
+            if decay is not None and not 0 < decay <= 1:
+                raise ValueError("decay must be in (0, 1]")
+
+            self.sl = cu / (cu + co)
+            self.compression = compression
+            self.decay = decay
+            self.sketches = None
+            self._quantiles = None
+            self.fitted = False
+
+            super().__init__(environment_info = environment_info, obsprocessors = obsprocessors, agent_name = agent_name)
+
+    @property
+    def quantiles(self) -> np.ndarray:
+
+        """ Quantiles at the service level, computed at the first query after an update """
+
+        if self._quantiles is None:
+            self._quantiles = self.quantile(self.sl)
+        return self._quantiles
+
+    def fit(self,
+            X: np.ndarray, # features will be ignored
+            Y: np.ndarray) -> None:
+
+        """
+
+        Fit the agent from scratch on the data, discarding all previously seen demand (see ```partial_fit```).
+
+        """
+
+        self.sketches = None
+        self.partial_fit(Y)
+
+    def partial_fit(self,
+            Y_new: np.ndarray, # new demand of shape (datapoints, SKUs) or (datapoints,)
+            ) -> None:
+
+        """
+
+        Add new demand to the sketches without revisiting the demand seen before. With decay, the weights of
+        the previous demand are multiplied by decay for each new datapoint.
+
+        """
+
+        Y_new = np.asarray(Y_new, dtype=float)
+        if Y_new.ndim == 1:
+            Y_new = Y_new.reshape(-1, 1)
+
+        if self.sketches is None:
+            self.sketches = [QuantileSketch(self.compression) for _ in range(Y_new.shape[1])]
+        elif Y_new.shape[1] != len(self.sketches):
+            raise ValueError(f"Y_new must have {len(self.sketches)} SKUs, got {Y_new.shape[1]}")
+
+        n_new = len(Y_new)
+        if n_new == 0:
+            return
+
+        weights = None
+        if self.decay is not None and self.decay < 1:
+            weights = self.decay ** np.arange(n_new-1, -1, -1, dtype=float) # the latest datapoint has weight 1
+
+        for i, sketch in enumerate(self.sketches):
+            if weights is not None:
+                sketch.scale(self.decay ** n_new)
+            sketch.update(Y_new[:, i], weights)
+
+        self._quantiles = None # recomputed lazily in draw_action_
+        self.fitted = True
+
+    def quantile(self,
+            sl: float | np.ndarray, # service level(s), a scalar or one per SKU
+            ) -> np.ndarray:
+
+        """
+
+        Quantiles of the (weighted) empirical demand distribution of each SKU for arbitrary service levels.
+
+        """
+
+        if self.sketches is None:
+            raise ValueError("Agent has not been fitted yet")
+
+        sl = np.broadcast_to(np.asarray(sl, dtype=float).reshape(-1), (len(self.sketches),))
+        return np.array([sketch.quantile(level) for sketch, level in zip(self.sketches, sl)])
+
+    def merge(self,
+            other: "NewsvendorOnlineSAAagent", # agent fitted on another shard, it is not modified
+            ) -> "NewsvendorOnlineSAAagent":
+
+        """
+
+        Merge the sketches of another agent into this agent, e.g., to combine agents fitted per store.
+
+        """
+
+        if other.sketches is None:
+            return self
+        if self.sketches is None:
+            self.sketches = [QuantileSketch(self.compression) for _ in other.sketches]
+        elif len(other.sketches) != len(self.sketches):
+            raise ValueError(f"Cannot merge agents with {len(self.sketches)} and {len(other.sketches)} SKUs")
+
+        for sketch, other_sketch in zip(self.sketches, other.sketches):
+            sketch.merge(other_sketch)
+
+        self._quantiles = None
+        self.fitted = True
+
+        return self
+
+    def draw_action_(self, 
+                    observation: np.ndarray) -> np.ndarray: #
+        """
+
+        Draw an action from the quantile of the (weighted) empirical distribution.
+
+        """
+
+        if self.fitted == False:
+            return np.array([0.0])
+
+        return self.quantiles
+
+    def save(self,
+                path: str, # The directory where the file will be saved.
+                overwrite: bool=True): # Allow overwriting; if False, a FileExistsError will be raised if the file exists.
+        
+        """
+        Save the centroids of the sketches to a file in the specified directory.
+
+        """
+
+        if not self.fitted:
+            raise ValueError("Agent has not been fitted yet")
+
+        os.makedirs(path, exist_ok=True)
+        
+        full_path = os.path.join(path, "online_saa_sketches.npz")
+        
+        if os.path.exists(full_path):
+            if not overwrite:
+                raise FileExistsError(f"The file {full_path} already exists and will not be overwritten.")
+            else:
+                logging.warning(f"Overwriting file {full_path}")
+
+        centroids = {}
+        for i, sketch in enumerate(self.sketches):
+            centroids[f"means_{i}"], centroids[f"weights_{i}"] = sketch.centroids()
+        np.savez(full_path, **centroids)
+
+    def load(self, path: str): # Only the path to the folder is needed, not the file itself
+
+        """
+        Load the centroids of the sketches from a file.
+
+        """
+
+        full_path = os.path.join(path, "online_saa_sketches.npz")
+        
+        if not os.path.exists(full_path):
+            raise FileNotFoundError(f"The file {full_path} does not exist.")
+        
+        try:
+            with np.load(full_path) as centroids:
+                n_SKUs = len([key for key in centroids.files if key.startswith("means_")])
+                self.sketches = [QuantileSketch(self.compression).update(centroids[f"means_{i}"], centroids[f"weights_{i}"]) for i in range(n_SKUs)]
+            self._quantiles = None
+            self.fitted = True
+            logging.info(f"Sketches loaded successfully from {full_path}")
+        except Exception as e:
+            raise ValueError(f"An error occurred while loading the file: {e}")
@@ -9,11 +9,7 @@ __all__ = ['BaseProcessor', 'FlattenTimeDimNumpy', 'ConvertDictSpace', 'AddParam
 from typing import Union, Optional, List, Tuple, Dict
 
 import numpy as np
-from ..utils import Parameter, check_parameter_types
-
-import torch
-import torch.nn as nn
-import torch.nn.functional as F
+from ..utils import Parameter, check_parameter_types, get_default_dtype
 
 # %% ../../nbs/30_agents/11_obsprocessors.ipynb 4
 class BaseProcessor():
@@ -182,14 +178,14 @@ class ConvertDictSpace(BaseProcessor):
             obs_2d = np.concatenate(obs_2d, axis=0)
             obs_1d = np.concatenate(obs_1d, axis=0)
             if flatten:
-                return np.concatenate([obs_2d.flatten(), obs_1d], axis=0)
+                return np.concatenate([obs_2d.flatten(), obs_1d], axis=0, dtype=get_default_dtype())
             else:
-                return [obs_2d, obs_1d]
+                return [obs_2d.astype(get_default_dtype(), copy=False), obs_1d.astype(get_default_dtype(), copy=False)]
         else:
             if obs[0].ndim == 1:
-                return np.concatenate(obs, axis=0)
+                return np.concatenate(obs, axis=0, dtype=get_default_dtype())
             else:
-                return np.concatenate(obs, axis=1)
+                return np.concatenate(obs, axis=1, dtype=get_default_dtype())
 
             return np.concatenate(obs, axis=0)
 
@@ -385,5 +381,5 @@ class AddParamsToFeatures(BaseProcessor):
                 else:
                     raise ValueError(f"Expected input to have the same shape as features, but got {value.shape} instead (feature shape: {features.shape}).")
 
-        return features
+        return features.astype(get_default_dtype(), copy=False) # no copy if all inputs are already in the default dtype
             
@@ -17,7 +17,11 @@ import numpy as np
 import os
 
 from ..base import BaseAgent
+from ..obsprocessors import FlattenTimeDimNumpy
+from .replay_memory import ArrayReplayMemory, IndexReplayMemory
+from ...dataloaders.base import BaseDataLoader
 from ...utils import MDPInfo, Parameter
+from ...checkpointing import state_dict_to_cpu, atomic_torch_save
 
 import torch
 import torch.nn.functional as F
@@ -92,6 +96,27 @@ class MushroomBaseAgent(BaseAgent):
         else:
             raise ValueError(f"Optimizer {optimizer} not supported")
 
+    def set_replay_memory(self,
+                replay_memory: str, # "array", "index" or "mushroom"
+                initial_replay_size: int,
+                max_replay_size: int,
+                dataloader: Optional[BaseDataLoader] = None, # dataloader of the environment, required for "index"
+                ):
+
+        """
+        Replace the replay memory of off-policy MushroomRL agents (e.g., SAC, TD3) by the preallocated ArrayReplayMemory
+        or by the IndexReplayMemory that rebuilds the features of the states from the dataloader.
+        """
+
+        if replay_memory == "array":
+            self.agent._replay_memory = ArrayReplayMemory(initial_replay_size, max_replay_size)
+        elif replay_memory == "index":
+            if dataloader is None:
+                raise ValueError("replay_memory 'index' requires the dataloader of the environment")
+            self.agent._replay_memory = IndexReplayMemory(initial_replay_size, max_replay_size, dataloader)
+        elif replay_memory != "mushroom":
+            raise ValueError("replay_memory must be 'array', 'index' or 'mushroom'")
+
     def draw_action_(self, observation: np.ndarray) -> np.ndarray: #
         
         """ 
@@ -130,6 +155,66 @@ class MushroomBaseAgent(BaseAgent):
         else:
             raise ValueError("Model is in train mode. Use draw_action method instead.")
 
+    def draw_action_batch(self, observations: np.ndarray | dict[str, np.ndarray]) -> np.ndarray: #
+
+        """
+        Predict the actions for a stacked block of observations (e.g., a full val or test horizon or the
+        observations of several environments) with a single forward pass. Only available in eval mode.
+        """
+
+        if self.mode != "eval":
+            raise ValueError("Batched prediction is only available in eval mode.")
+
+        observations = self.apply_preprocessors_batch(observations)
+
+        return self.predict_(observations)
+
+    def apply_preprocessors_batch(self, observations: np.ndarray | dict[str, np.ndarray]) -> np.ndarray | List[np.ndarray]: #
+
+        """
+        Apply the preprocessors of the MushroomRL agent to a batch of observations. Preprocessors that
+        flatten the time dimension are applied to the full batch at once, all other preprocessors
+        (which expect a single observation) are applied observation by observation and the results stacked.
+        """
+
+        for preprocessor in self.agent.preprocessors:
+            if isinstance(preprocessor, FlattenTimeDimNumpy) and not preprocessor.batch_dim_included:
+                observations = FlattenTimeDimNumpy(allow_2d=preprocessor.allow_2d, batch_dim_included=True)(observations)
+            else:
+                outputs = [preprocessor(observation) for observation in self.split_batch(observations)]
+                observations = self.stack_batch(outputs)
+
+        return observations
+
+    @staticmethod
+    def split_batch(observations: np.ndarray | dict[str, np.ndarray] | List[np.ndarray]) -> List: #
+
+        """ Split a batch of observations into a list of single observations """
+
+        if isinstance(observations, np.ndarray):
+            return list(observations)
+        elif isinstance(observations, dict):
+            batch_size = len(next(iter(observations.values())))
+            return [{key: value[i] for key, value in observations.items()} for i in range(batch_size)]
+        elif isinstance(observations, list):
+            return [list(observation) for observation in zip(*observations)]
+        else:
+            raise TypeError("Observations must be a numpy array, a dictionary of numpy arrays or a list of numpy arrays.")
+
+    @staticmethod
+    def stack_batch(observations: List) -> np.ndarray | dict[str, np.ndarray] | List[np.ndarray]: #
+
+        """ Stack a list of single observations into a batch (inverse of split_batch) """
+
+        if isinstance(observations[0], np.ndarray):
+            return np.stack(observations)
+        elif isinstance(observations[0], dict):
+            return {key: np.stack([observation[key] for observation in observations]) for key in observations[0]}
+        elif isinstance(observations[0], list):
+            return [np.stack(parts) for parts in zip(*observations)]
+        else:
+            raise TypeError("Observations must be numpy arrays, dictionaries of numpy arrays or lists of numpy arrays.")
+
     def predict_(self, observation: np.ndarray) -> np.ndarray: #
         """ Do one forward pass of the model directly and return the prediction
         Overwrite for agents that have additional steps such as SAC"""
@@ -168,16 +253,37 @@ class MushroomBaseAgent(BaseAgent):
 
         """
         
+        self.write_checkpoint(path, self.get_checkpoint(), overwrite=overwrite)
+
+    def get_checkpoint(self) -> dict: #
+
+        """
+        Return a copy of the state_dicts of all networks on the CPU, keyed by the file name they are saved to.
+        The copy can be written to disk later (e.g., by a background thread) while training continues.
+        """
+
         if not hasattr(self, 'network_list') or self.network_list is None:
             raise AttributeError("Cannot find networks.")
 
+        return {f"network_{network_number}.pth": state_dict_to_cpu(network.state_dict()) for network_number, network in enumerate(self.network_list)}
+
+    def write_checkpoint(self,
+                path: str, # The directory where the file will be saved.
+                checkpoint: dict, # Checkpoint as returned by get_checkpoint
+                overwrite: bool=True): # Allow overwriting; if False, a FileExistsError will be raised if the file exists.
+
+        """
+        Write a checkpoint to the specified directory. Each file is first written to a temporary
+        file and then renamed, such that an interrupted write never leaves a corrupt network file behind.
+        """
+
         # Create the directory path if it does not exist
         os.makedirs(path, exist_ok=True)
 
         # Construct the file path using os.path.join for better cross-platform compatibility
 
-        for network_number, network in enumerate(self.network_list):
-            full_path = os.path.join(path, f"network_{network_number}.pth")
+        for file_name, state_dict in checkpoint.items():
+            full_path = os.path.join(path, file_name)
 
             if os.path.exists(full_path):
                 if not overwrite:
@@ -186,9 +292,18 @@ class MushroomBaseAgent(BaseAgent):
                     logging.debug(f"Overwriting file {full_path}") # Only log with info as during training we will continuously overwrite the model
             
             # Save the model's state_dict using torch.save
-            torch.save(network.state_dict(), full_path)
+            atomic_torch_save(state_dict, full_path)
         logging.debug(f"Model saved successfully to {full_path}")
 
+    def load_checkpoint(self, checkpoint: dict): #
+
+        """
+        Load a checkpoint as returned by get_checkpoint from memory.
+        """
+
+        for network_number, network in enumerate(self.network_list):
+            network.load_state_dict(checkpoint[f"network_{network_number}.pth"])
+
     def load(self, path: str):
         """
         Load the PyTorch models from files in the specified directory.
@@ -280,6 +395,12 @@ class MushroomBaseAgent(BaseAgent):
 
         """ Hand the fit mehtod to the mushroom agent """
 
+        # the IndexReplayMemory needs the index of each step, which the environment provides in the step info
+        if isinstance(getattr(self.agent, "_replay_memory", None), IndexReplayMemory):
+            if "index" not in dataset_info:
+                raise ValueError("replay_memory 'index' requires an environment that provides the index in the step info")
+            self.agent._replay_memory.set_indices(dataset_info["index"])
+
         self.agent.fit(dataset, **dataset_info)
 
     def stop(self):
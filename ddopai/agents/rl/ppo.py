@@ -12,7 +12,7 @@ import logging
 logging.basicConfig(level=logging.INFO)
 
 from abc import ABC, abstractmethod
-from typing import Union, Optional, List, Tuple
+from typing import Union, Optional, List, Tuple, Literal
 import numpy as np
 import os
 
@@ -31,9 +31,8 @@ from mushroom_rl.policy import GaussianTorchPolicy
 import torch
 import torch.optim as optim
 import torch.nn.functional as F
-from torchinfo import summary
+from ..ml_utils import log_network_summary, log_torchinfo_summary
 
-import time
 
 # %% ../../../nbs/30_agents/51_RL_agents/10_PPO_agents.ipynb 5
 class PPOAgent(MushroomBaseAgent):
@@ -69,6 +68,7 @@ class PPOAgent(MushroomBaseAgent):
                 obsprocessors: list | None = None,      # default: []
                 device: str = "cpu", # "cuda" or "cpu"
                 agent_name: str | None = "SAC",
+                network_summary: Literal["light", "torchinfo"] = "light", # "torchinfo" logs the full torchinfo summary (requires a forward pass)
                 ):
 
         self.n_steps_per_fit=n_steps_per_fit
@@ -150,16 +150,22 @@ class PPOAgent(MushroomBaseAgent):
             agent_name=agent_name
         )
 
+        if network_summary not in ["light", "torchinfo"]:
+            raise ValueError("network_summary must be 'light' or 'torchinfo'")
+
         logging.info("Actor network:")
-        if logging.getLogger().isEnabledFor(logging.INFO):
+        if network_summary == "torchinfo": # the full torchinfo summary needs a forward pass with random inputs
             input_size = self.add_batch_dimension_for_shape(input_shape)
-            print(summary(self.actor, input_size=input_size))
-            time.sleep(.2)
+            log_torchinfo_summary(self.actor, input_size=input_size)
+        else:
+            log_network_summary(self.actor)
 
         logging.info("Critic network:")
-        if logging.getLogger().isEnabledFor(logging.INFO):
+        if network_summary == "torchinfo":
             input_size = self.add_batch_dimension_for_shape(input_shape)
-            print(summary(self.critic, input_size=input_size))
+            log_torchinfo_summary(self.critic, input_size=input_size)
+        else:
+            log_network_summary(self.critic)
 
     def get_network_list(self, set_actor_critic_attributes: bool = True):
         """ Get the list of networks in the agent for the save and load functions
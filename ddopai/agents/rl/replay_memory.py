@@ -0,0 +1,341 @@
+"""Replay memory for off-policy RL agents (SAC, TD3) based on preallocated arrays"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/30_agents/51_RL_agents/11_replay_memory.ipynb.
+
+# %% auto 0
+__all__ = ['ArrayReplayMemory', 'IndexReplayMemory']
+
+# %% ../../../nbs/30_agents/51_RL_agents/11_replay_memory.ipynb 3
+from typing import List, Tuple
+import numpy as np
+
+from mushroom_rl.core import Serializable
+
+from ...dataloaders.base import BaseDataLoader
+
+# %% ../../../nbs/30_agents/51_RL_agents/11_replay_memory.ipynb 4
+class ArrayReplayMemory(Serializable):
+
+    """
+    Replay memory with the same interface as the MushroomRL ```ReplayMemory``` that stores transitions
+    in preallocated contiguous arrays instead of lists of Python objects. The arrays are allocated when the
+    first transition is added (such that the shapes can be inferred from the data), insertion is done for
+    the whole dataset at once in a ring buffer and mini-batches are sampled with a single fancy-indexing
+    operation per array.
+    """
+
+    def __init__(self,
+                    initial_size: int, # number of transitions before the memory is used for training
+                    max_size: int, # maximum number of transitions stored
+                    dtype: np.dtype = np.float32, # dtype of states, actions and rewards
+                    ):
+
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self._initial_size = initial_size
+        self._max_size = max_size
+        self._dtype = dtype
+
+        self.reset()
+
+        self._add_save_attr(
+            _initial_size='primitive',
+            _max_size='primitive',
+            _dtype='pickle',
+            _idx='primitive!',
+            _full='primitive!',
+            _states='numpy!',
+            _actions='numpy!',
+            _rewards='numpy!',
+            _next_states='numpy!',
+            _absorbing='numpy!',
+            _last='numpy!'
+        )
+
+    def reset(self):
+
+        """
+        Reset the replay memory (the arrays are allocated again on the next call of ```add```).
+        """
+
+        self._idx = 0
+        self._full = False
+        self._states = None
+        self._actions = None
+        self._rewards = None
+        self._next_states = None
+        self._absorbing = None
+        self._last = None
+
+    def _allocate(self, state: np.ndarray, action: np.ndarray):
+
+        """ Allocate the arrays based on the shape of a single state and action """
+
+        state_shape = np.shape(state)
+        action_shape = np.shape(action)
+
+        self._states = np.zeros((self._max_size, *state_shape), dtype=self._dtype)
+        self._next_states = np.zeros((self._max_size, *state_shape), dtype=self._dtype)
+        self._actions = np.zeros((self._max_size, *action_shape), dtype=self._dtype)
+        self._rewards = np.zeros(self._max_size, dtype=self._dtype)
+        self._absorbing = np.zeros(self._max_size, dtype=bool)
+        self._last = np.zeros(self._max_size, dtype=bool)
+
+    @staticmethod
+    def get_transitions(dataset: List, # list of (state, action, reward, next_state, absorbing, last) tuples
+                        n_steps_return: int = 1, # number of steps to consider for computing n-step return
+                        gamma: float = 1., # discount factor for n-step return
+                        ) -> Tuple[List[int], List[int], List[float]]:
+
+        """
+        Determine for each transition the index of the first and last step in the dataset and the
+        (n-step) reward, following the logic of the MushroomRL ```ReplayMemory```.
+        """
+
+        if n_steps_return < 1:
+            raise ValueError("n_steps_return must be at least 1")
+
+        if n_steps_return == 1:
+            indices = list(range(len(dataset)))
+            return indices, indices, [sample[2] for sample in dataset]
+
+        start, end, rewards = [], [], []
+        i = 0
+        while i < len(dataset) - n_steps_return + 1:
+            reward = dataset[i][2]
+            j = 0
+            while j < n_steps_return - 1:
+                if dataset[i + j][5]:
+                    i += j + 1
+                    break
+                j += 1
+                reward += gamma ** j * dataset[i + j][2]
+            else:
+                start.append(i)
+                end.append(i + j)
+                rewards.append(reward)
+                i += 1
+
+        return start, end, rewards
+
+    def add(self,
+            dataset: List, # list of (state, action, reward, next_state, absorbing, last) tuples
+            n_steps_return: int = 1, # number of steps to consider for computing n-step return
+            gamma: float = 1., # discount factor for n-step return
+            ):
+
+        """
+        Add the transitions of a dataset to the replay memory, overwriting the oldest transitions
+        once the memory is full.
+        """
+
+        start, end, rewards = self.get_transitions(dataset, n_steps_return, gamma)
+
+        if len(start) == 0:
+            return
+
+        # only the last max_size transitions can be kept
+        if len(start) > self._max_size:
+            start, end, rewards = start[-self._max_size:], end[-self._max_size:], rewards[-self._max_size:]
+
+        if self._states is None:
+            self._allocate(dataset[start[0]][0], dataset[start[0]][1])
+
+        n_transitions = len(start)
+        positions = (self._idx + np.arange(n_transitions)) % self._max_size
+
+        self._store_states(positions, dataset, start, end)
+        self._actions[positions] = np.stack([dataset[i][1] for i in start])
+        self._rewards[positions] = rewards
+        self._absorbing[positions] = [dataset[i][4] for i in end]
+        self._last[positions] = [dataset[i][5] for i in end]
+
+        if self._idx + n_transitions >= self._max_size:
+            self._full = True
+        self._idx = (self._idx + n_transitions) % self._max_size
+
+    def _store_states(self, positions: np.ndarray, dataset: List, start: List[int], end: List[int]):
+
+        """ Write the states and next states of the transitions to the given positions """
+
+        self._states[positions] = np.stack([dataset[i][0] for i in start])
+        self._next_states[positions] = np.stack([dataset[i][3] for i in end])
+
+    def _load_states(self, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+
+        """ Return the states and next states stored at the given positions """
+
+        return self._states[indices], self._next_states[indices]
+
+    def get(self,
+            n_samples: int, # number of transitions to sample
+            ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+
+        """
+        Sample transitions uniformly (with replacement) from the replay memory. Returns states, actions,
+        rewards, next_states, absorbing and last flags as arrays with the samples in the first dimension.
+        """
+
+        indices = np.random.randint(self.size, size=n_samples)
+
+        states, next_states = self._load_states(indices)
+
+        return states, self._actions[indices], self._rewards[indices], next_states,\
+            self._absorbing[indices], self._last[indices]
+
+    @property
+    def initialized(self) -> bool:
+        """ Whether the replay memory contains enough transitions to be used """
+        return self.size > self._initial_size
+
+    @property
+    def size(self) -> int:
+        """ Number of transitions in the replay memory """
+        return self._idx if not self._full else self._max_size
+
+    @property
+    def nbytes(self) -> int:
+        """ Memory allocated by the arrays in bytes """
+        if self._states is None:
+            return 0
+        return sum(array.nbytes for array in [self._states, self._actions, self._rewards, self._next_states, self._absorbing, self._last])
+
+    def _post_load(self):
+        if self._full is None:
+            self.reset()
+
+# %% ../../../nbs/30_agents/51_RL_agents/11_replay_memory.ipynb 14
+class IndexReplayMemory(ArrayReplayMemory):
+
+    """
+    Replay memory that stores for each state only its index in the dataloader and the dynamic part of the
+    state (e.g., inventory, order pipeline or drawn service level) instead of the full state. When sampling,
+    the features of all states and next states of a mini-batch are retrieved with a single call of the
+    dataloader's ```get_X_batch```. This requires that the (preprocessed) states are vectors starting with
+    the flattened features of the dataloader, as it is the case for ```FlattenTimeDimNumpy``` and
+    ```ConvertDictSpace``` without time dimension. The indices of the steps must be set with ```set_indices```
+    before each call of ```add``` (the ```MushroomBaseAgent``` takes them from the step info of the environment).
+    The dataloader is not saved with the replay memory and must be set again after loading.
+    """
+
+    def __init__(self,
+                    initial_size: int, # number of transitions before the memory is used for training
+                    max_size: int, # maximum number of transitions stored
+                    dataloader: BaseDataLoader, # dataloader of the environment (in train mode while sampling)
+                    dtype: np.dtype = np.float32, # dtype of the dynamic states, actions and rewards
+                    ):
+
+        self._dataloader = dataloader
+        self._pending_indices = None
+
+        super().__init__(initial_size, max_size, dtype)
+
+        self._add_save_attr(
+            _dataloader='none',
+            _pending_indices='none',
+            _n_features='primitive!',
+            _indices='numpy!',
+            _next_indices='numpy!'
+        )
+
+    def reset(self):
+
+        """
+        Reset the replay memory (the arrays are allocated again on the next call of ```add```).
+        """
+
+        super().reset()
+        self._n_features = None
+        self._indices = None
+        self._next_indices = None
+
+    def set_dataloader(self, dataloader: BaseDataLoader):
+
+        """ Set the dataloader used to retrieve the features (e.g., after loading the replay memory) """
+
+        self._dataloader = dataloader
+
+    def set_indices(self,
+                    indices: List[int] | np.ndarray, # index of the environment for each step of the dataset
+                    ):
+
+        """ Set the dataloader indices of the states of the dataset that is added next """
+
+        self._pending_indices = np.asarray(indices, dtype=np.int64)
+
+    def _check_layout(self, state: np.ndarray, index: int) -> int:
+
+        """ Check that the state starts with the flattened features at the given index and return the number of features """
+
+        state = np.asarray(state)
+        features = self._dataloader.get_X_batch(np.array([index]))[0].flatten()
+
+        if state.ndim != 1 or state.size < features.size or \
+            not np.allclose(state[:features.size], features, rtol=1e-5, atol=1e-6, equal_nan=True):
+            raise ValueError("The states must be vectors starting with the flattened features of the dataloader "
+                             "(e.g., using FlattenTimeDimNumpy or ConvertDictSpace without time dimension)")
+
+        return features.size
+
+    def _allocate(self, state: np.ndarray, action: np.ndarray):
+
+        """ Allocate the arrays for the indices and the dynamic part of the states """
+
+        super()._allocate(np.zeros(np.size(state) - self._n_features), action)
+
+        self._indices = np.zeros(self._max_size, dtype=np.int64)
+        self._next_indices = np.zeros(self._max_size, dtype=np.int64)
+
+    def add(self,
+            dataset: List, # list of (state, action, reward, next_state, absorbing, last) tuples
+            n_steps_return: int = 1, # number of steps to consider for computing n-step return
+            gamma: float = 1., # discount factor for n-step return
+            ):
+
+        """
+        Add the transitions of a dataset to the replay memory, overwriting the oldest transitions
+        once the memory is full. The indices of the steps must be set with ```set_indices``` before.
+        """
+
+        if self._pending_indices is None:
+            raise ValueError("The indices of the states must be set with set_indices before adding a dataset")
+        if len(self._pending_indices) != len(dataset):
+            raise ValueError(f"Got {len(self._pending_indices)} indices for a dataset with {len(dataset)} steps")
+
+        try:
+            if self._states is None and len(dataset) > 0:
+                self._n_features = self._check_layout(dataset[0][0], self._pending_indices[0])
+            super().add(dataset, n_steps_return, gamma)
+        finally:
+            self._pending_indices = None
+
+    def _store_states(self, positions: np.ndarray, dataset: List, start: List[int], end: List[int]):
+
+        """ Write the indices and the dynamic part of the states and next states to the given positions """
+
+        self._indices[positions] = self._pending_indices[start]
+        self._next_indices[positions] = self._pending_indices[end] + 1 # the next state is the observation of the following period
+        self._states[positions] = np.stack([np.asarray(dataset[i][0])[self._n_features:] for i in start])
+        self._next_states[positions] = np.stack([np.asarray(dataset[i][3])[self._n_features:] for i in end])
+
+    def _load_states(self, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+
+        """ Rebuild the states and next states at the given positions with one batched gather from the dataloader """
+
+        n_samples = len(indices)
+
+        dataloader_indices = np.concatenate([self._indices[indices], self._next_indices[indices]])
+        features = self._dataloader.get_X_batch(dataloader_indices).reshape(2*n_samples, -1).astype(self._dtype, copy=False)
+
+        states = np.concatenate([features[:n_samples], self._states[indices]], axis=1)
+        next_states = np.concatenate([features[n_samples:], self._next_states[indices]], axis=1)
+
+        return states, next_states
+
+    @property
+    def nbytes(self) -> int:
+        """ Memory allocated by the arrays in bytes (excluding the dataloader) """
+        if self._states is None:
+            return 0
+        return super().nbytes + self._indices.nbytes + self._next_indices.nbytes
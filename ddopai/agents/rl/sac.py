@@ -12,7 +12,7 @@ import logging
 logging.basicConfig(level=logging.INFO)
 
 from abc import ABC, abstractmethod
-from typing import Union, Optional, List, Tuple, Callable, Any
+from typing import Union, Optional, List, Tuple, Callable, Any, Literal
 import numpy as np
 import os
 
@@ -29,12 +29,10 @@ from mushroom_rl.algorithms.actor_critic.deep_actor_critic import SAC
 
 import torch
 import torch.nn.functional as F
-from torchinfo import summary
-from IPython import get_ipython
+from ..ml_utils import log_network_summary, log_torchinfo_summary
 
 from copy import deepcopy
 
-import time
 
 # %% ../../../nbs/30_agents/51_RL_agents/10_SAC_agents.ipynb 5
 class SACBaseAgent(MushroomBaseAgent):
@@ -52,6 +50,8 @@ class SACBaseAgent(MushroomBaseAgent):
                 learning_rate_critic: float | None = None, # If none, then it is set to learning_rate_actor
                 initial_replay_size: int = 64,
                 max_replay_size: int = 50000,
+                replay_memory: Literal["array", "index", "mushroom"] = "mushroom", # "array" for the preallocated ArrayReplayMemory, "index" for the IndexReplayMemory, "mushroom" for the MushroomRL ReplayMemory
+                dataloader: Optional[BaseDataLoader] = None, # dataloader of the environment, required for replay_memory="index"
                 batch_size: int = 64,
                 warmup_transitions: int = 100,
                 lr_alpha: float = 3e-4,
@@ -70,6 +70,7 @@ class SACBaseAgent(MushroomBaseAgent):
                 obsprocessors: list | None = None,      # default: []
                 device: str = "cpu", # "cuda" or "cpu"
                 agent_name: str | None = "SAC",
+                network_summary: Literal["light", "torchinfo"] = "light", # "torchinfo" logs the full torchinfo summary (requires a forward pass)
 
                 network_actor_mu_params: dict = None,
                 network_actor_sigma_params: dict = None,
@@ -149,6 +150,8 @@ class SACBaseAgent(MushroomBaseAgent):
             critic_fit_params=None
         )
 
+        self.set_replay_memory(replay_memory, initial_replay_size, max_replay_size, dataloader)
+
         super().__init__(
             environment_info=environment_info,
             obsprocessors=obsprocessors,
@@ -156,9 +159,12 @@ class SACBaseAgent(MushroomBaseAgent):
             agent_name=agent_name
         )
 
+        if network_summary not in ["light", "torchinfo"]:
+            raise ValueError("network_summary must be 'light' or 'torchinfo'")
+
         batch_dim = 1
         logging.info("Actor network (mu network):")
-        if logging.getLogger().isEnabledFor(logging.INFO):
+        if network_summary == "torchinfo": # the full torchinfo summary needs a forward pass with random inputs
             input_size = self.add_batch_dimension_for_shape(actor_mu_params["input_shape"], batch_dim=batch_dim)
             input_size = self.convert_recursively_to_int(input_size)
             if isinstance(input_size, list):
@@ -169,15 +175,13 @@ class SACBaseAgent(MushroomBaseAgent):
             else:
                 input_tensor = torch.randn(batch_dim, *actor_mu_params["input_shape"]).to(self.device)
             input_tuple = (input_tensor,)
-            if get_ipython() is not None:
-                print(summary(self.actor, input_data=input_tuple, device=self.device))
-            else:
-                summary(self.actor, input_data=input_tuple, device=self.device)
-            time.sleep(0.2)
+            log_torchinfo_summary(self.actor, self.device, input_data=input_tuple)
+        else:
+            log_network_summary(self.actor)
 
         logging.info("################################################################################")
         logging.info("Critic network:")
-        if logging.getLogger().isEnabledFor(logging.INFO):
+        if network_summary == "torchinfo":
             input_size = self.add_batch_dimension_for_shape(critic_params["input_shape"])
             input_size = self.convert_recursively_to_int(input_size)
             action_sample = torch.randn(batch_dim, *critic_params["input_shape"][1]).to(self.device)
@@ -189,11 +193,9 @@ class SACBaseAgent(MushroomBaseAgent):
                     state_mlp_sample = torch.randn(batch_dim, *critic_params["input_shape"][0][1]).to(self.device)
                     state_sample = torch.cat((state_sample, state_mlp_sample), dim=1)
             input_tuple = (state_sample, action_sample)
-            if get_ipython() is not None:
-                print(summary(self.critic, input_data=input_tuple, device=self.device))
-            else:
-                summary(self.critic, input_data=input_tuple, device=self.device)
-            # print(summary(self.critic, input_data=input_tuple, device=self.device))
+            log_torchinfo_summary(self.critic, self.device, input_data=input_tuple)
+        else:
+            log_network_summary(self.critic)
 
     def get_network_list(self, set_actor_critic_attributes: bool = True):
         """ Get the list of networks in the agent for the save and load functions
@@ -248,6 +250,8 @@ class SACAgent(SACBaseAgent):
                 learning_rate_critic: float | None = None, # If none, then it is set to learning_rate_actor
                 initial_replay_size: int = 64,
                 max_replay_size: int = 50000,
+                replay_memory: Literal["array", "index", "mushroom"] = "mushroom", # "array" for the preallocated ArrayReplayMemory, "index" for the IndexReplayMemory, "mushroom" for the MushroomRL ReplayMemory
+                dataloader: Optional[BaseDataLoader] = None, # dataloader of the environment, required for replay_memory="index"
                 batch_size: int = 64,
                 warmup_transitions: int = 100,
                 lr_alpha: float = 3e-4,
@@ -266,6 +270,7 @@ class SACAgent(SACBaseAgent):
                 obsprocessors: list | None = None,      # default: []
                 device: str = "cpu", # "cuda" or "cpu"
                 agent_name: str | None = "SAC",
+                network_summary: Literal["light", "torchinfo"] = "light", # "torchinfo" logs the full torchinfo summary (requires a forward pass)
                 observation_space_shape = None, # optional when it cannot be inferred from environment_info (e.g. for dict spaces)
                 action_space_shape = None, # optional when it cannot be inferred from environment_info (e.g. for dict spaces)
                 ):
@@ -325,6 +330,8 @@ class SACAgent(SACBaseAgent):
             learning_rate_critic=learning_rate_critic,
             initial_replay_size=initial_replay_size,
             max_replay_size=max_replay_size,
+            replay_memory=replay_memory,
+            dataloader=dataloader,
             batch_size=batch_size,
             warmup_transitions=warmup_transitions,
             lr_alpha=lr_alpha,
@@ -343,13 +350,14 @@ class SACAgent(SACBaseAgent):
             obsprocessors=obsprocessors,
             device=device,
             agent_name=agent_name,
+            network_summary=network_summary,
 
             network_actor_mu_params=network_actor_mu_params,
             network_actor_sigma_params=network_actor_sigma_params,
             network_critic_params=network_critic_params,
         ) 
 
-# %% ../../../nbs/30_agents/51_RL_agents/10_SAC_agents.ipynb 9
+# %% ../../../nbs/30_agents/51_RL_agents/10_SAC_agents.ipynb 11
 class SACRNNAgent(SACBaseAgent):
 
     """
@@ -364,6 +372,7 @@ class SACRNNAgent(SACBaseAgent):
                 hidden_layers_RNN: int = 1, # Initial RNN layers
                 num_hidden_units_RNN: int = 64, # Initial number of hidden units in RNN layers
                 RNN_cell: str = "GRU", # "LSTM", "GRU", "RNN"
+                stateful_rollout: bool = False, # during training rollouts, carry the hidden state of the actor between steps and only feed the newest timestep
                 hidden_layers_MLP: List = None, # MLP layers behind RNN: if None, then default is [64, 64]
                 hidden_layers_input_MLP: List = None, # MLP layers for  non-time features. Default is None
                 activation: str = "relu", # "relu", "sigmoid", "tanh", "leakyrelu", "elu"
@@ -372,6 +381,7 @@ class SACRNNAgent(SACBaseAgent):
                 learning_rate_critic: float | None = None, # If none, then it is set to learning_rate_actor
                 initial_replay_size: int = 64,
                 max_replay_size: int = 50000,
+                replay_memory: Literal["array", "mushroom"] = "mushroom", # "array" for the preallocated ArrayReplayMemory, "mushroom" for the MushroomRL ReplayMemory
                 batch_size: int = 64,
                 warmup_transitions: int = 100,
                 lr_alpha: float = 3e-4,
@@ -390,6 +400,7 @@ class SACRNNAgent(SACBaseAgent):
                 obsprocessors: list | None = None,      # default: []
                 device: str = "cpu", # "cuda" or "cpu"
                 agent_name: str | None = "SAC",
+                network_summary: Literal["light", "torchinfo"] = "light", # "torchinfo" logs the full torchinfo summary (requires a forward pass)
                 observation_space_shape = None, # optional when it cannot be inferred from environment_info (e.g. for dict spaces)
                 action_space_shape = None, # optional when it cannot be inferred from environment_info (e.g. for dict spaces)
                 ):
@@ -478,6 +489,7 @@ class SACRNNAgent(SACBaseAgent):
             learning_rate_critic=learning_rate_critic,
             initial_replay_size=initial_replay_size,
             max_replay_size=max_replay_size,
+            replay_memory=replay_memory,
             batch_size=batch_size,
             warmup_transitions=warmup_transitions,
             lr_alpha=lr_alpha,
@@ -496,8 +508,45 @@ class SACRNNAgent(SACBaseAgent):
             obsprocessors=obsprocessors,
             device=device,
             agent_name=agent_name,
+            network_summary=network_summary,
 
             network_actor_mu_params=network_actor_mu_params,
             network_actor_sigma_params=network_actor_sigma_params,
             network_critic_params=network_critic_params,
         ) 
+
+        self.stateful_rollout = stateful_rollout
+
+    @property
+    def actor_networks(self) -> List[RNNActor]:
+        """ The RNN networks of the policy (mean and standard deviation) """
+        policy = self.agent.policy
+        return [policy._mu_approximator.model.network, policy._sigma_approximator.model.network]
+
+    def draw_action_(self, observation: np.ndarray) -> np.ndarray: #
+
+        """
+        Draw an action. With ```stateful_rollout```, the actor networks carry their hidden state between
+        the steps of an episode in train mode, such that only the newest timestep of the lag window is
+        processed. As the networks are trained on the full lag window, the actions are then drawn from an
+        approximation of the trained policy, which is sufficient for the off-policy data collection.
+        Evaluation always uses the full lag window.
+        """
+
+        if not (self.stateful_rollout and self.mode == "train"):
+            return super().draw_action_(observation)
+
+        for network in self.actor_networks:
+            network.stateful = True
+        try:
+            return super().draw_action_(observation)
+        finally:
+            for network in self.actor_networks:
+                network.stateful = False
+
+    def episode_start(self):
+
+        """ Reset the hidden states of the actor networks at the start of an episode """
+
+        for network in self.actor_networks:
+            network.reset_state()
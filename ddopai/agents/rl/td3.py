@@ -12,7 +12,7 @@ import logging
 logging.basicConfig(level=logging.INFO)
 
 from abc import ABC, abstractmethod
-from typing import Union, Optional, List, Tuple
+from typing import Union, Optional, List, Tuple, Literal
 import numpy as np
 import os
 
@@ -31,9 +31,8 @@ from mushroom_rl.policy import OrnsteinUhlenbeckPolicy
 import torch
 import torch.optim as optim
 import torch.nn.functional as F
-from torchinfo import summary
+from ..ml_utils import log_network_summary, log_torchinfo_summary
 
-import time
 
 # %% ../../../nbs/30_agents/51_RL_agents/10_TD3_agents.ipynb 4
 class TD3Agent(MushroomBaseAgent):
@@ -51,6 +50,8 @@ class TD3Agent(MushroomBaseAgent):
                 learning_rate_critic: float | None = None, # If none, then it is set to learning_rate_actor
                 initial_replay_size: int = 1024,
                 max_replay_size: int = 50000,
+                replay_memory: Literal["array", "index", "mushroom"] = "mushroom", # "array" for the preallocated ArrayReplayMemory, "index" for the IndexReplayMemory, "mushroom" for the MushroomRL ReplayMemory
+                dataloader: Optional[BaseDataLoader] = None, # dataloader of the environment, required for replay_memory="index"
                 batch_size: int = 64,
                 hidden_layers: List = None, # if None, then default is [64, 64]
                 activation: str = "relu", # "relu", "sigmoid", "tanh", "leakyrelu", "elu"
@@ -70,6 +71,7 @@ class TD3Agent(MushroomBaseAgent):
                 obsprocessors: list | None = None,      # default: []
                 device: str = "cpu", # "cuda" or "cpu"
                 agent_name: str | None = "SAC",
+                network_summary: Literal["light", "torchinfo"] = "light", # "torchinfo" logs the full torchinfo summary (requires a forward pass)
                 ):
 
         # The standard TD3 agent needs a 2D input, so we need to flatten the time dimension
@@ -151,6 +153,8 @@ class TD3Agent(MushroomBaseAgent):
             critic_fit_params=None
         )
 
+        self.set_replay_memory(replay_memory, initial_replay_size, max_replay_size, dataloader)
+
         super().__init__(
             environment_info=environment_info,
             obsprocessors=obsprocessors,
@@ -158,16 +162,22 @@ class TD3Agent(MushroomBaseAgent):
             agent_name=agent_name
         )
 
+        if network_summary not in ["light", "torchinfo"]:
+            raise ValueError("network_summary must be 'light' or 'torchinfo'")
+
         logging.info("Actor network:")
-        if logging.getLogger().isEnabledFor(logging.INFO):
+        if network_summary == "torchinfo": # the full torchinfo summary needs a forward pass with random inputs
             input_size = self.add_batch_dimension_for_shape(actor_input_shape)
-            print(summary(self.actor, input_size=input_size))
-            time.sleep(.2)
+            log_torchinfo_summary(self.actor, input_size=input_size)
+        else:
+            log_network_summary(self.actor)
 
         logging.info("Critic network:")
-        if logging.getLogger().isEnabledFor(logging.INFO):
+        if network_summary == "torchinfo":
             input_size = self.add_batch_dimension_for_shape([actor_input_shape, actor_output_shape])
-            print(summary(self.critic, input_size=input_size))
+            log_torchinfo_summary(self.critic, input_size=input_size)
+        else:
+            log_network_summary(self.critic)
 
     def get_network_list(self, set_actor_critic_attributes: bool = True):
         """ Get the list of networks in the agent for the save and load functions
@@ -0,0 +1,167 @@
+"""Helpers to snapshot and write model checkpoints without blocking the training loop."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/00_utils/23_checkpointing.ipynb.
+
+# %% auto 0
+__all__ = ['state_dict_to_cpu', 'atomic_torch_save', 'CheckpointWriter']
+
+# %% ../nbs/00_utils/23_checkpointing.ipynb 3
+import logging
+import os
+import threading
+from typing import Literal, Dict, Callable
+
+# %% ../nbs/00_utils/23_checkpointing.ipynb 5
+def state_dict_to_cpu(state_dict: Dict) -> Dict: # state_dict of a PyTorch module
+
+    """
+    Create a detached copy of a state_dict on the CPU. The copy is independent of the
+    module, such that training can continue while the copy is written to disk.
+    """
+
+    import torch # imported here such that the CheckpointWriter can be used without torch
+
+    return {key: value.detach().to("cpu", copy=True) if isinstance(value, torch.Tensor) else value for key, value in state_dict.items()}
+
+# %% ../nbs/00_utils/23_checkpointing.ipynb 7
+def atomic_torch_save(obj: object, # object to be saved, typically a state_dict
+                        full_path: str, # path of the target file
+                        ) -> None:
+
+    """
+    Save an object with torch.save to a temporary file and then rename it to the target path.
+    The rename is atomic, such that the target file is never left in a partially written state.
+    """
+
+    import torch # imported here such that the CheckpointWriter can be used without torch
+
+    tmp_path = f"{full_path}.tmp"
+    torch.save(obj, tmp_path)
+    os.replace(tmp_path, full_path)
+
+# %% ../nbs/00_utils/23_checkpointing.ipynb 10
+class CheckpointWriter():
+
+    """
+    Writes agent checkpoints without blocking the training loop. The agent state is copied to
+    CPU memory on the calling thread via ```agent.get_checkpoint()``` and then written via
+    ```agent.write_checkpoint()```. Only the latest submitted checkpoint is kept: if a new checkpoint is
+    submitted before the previous one has been written, the previous one is dropped.
+
+    In mode ```"async"``` the checkpoint is written by a background thread. In mode ```"memory"```
+    the checkpoint is only kept in memory and written to disk when ```flush``` is called, e.g., at
+    the end of an experiment. Agents that do not provide ```get_checkpoint``` (such as SAA or XGB agents)
+    are saved directly via ```agent.save()```.
+    """
+
+    def __init__(self,
+                    mode: Literal["async", "memory"] = "async", # "async" writes in a background thread, "memory" only on flush
+                    ):
+
+        if mode not in ["async", "memory"]:
+            raise ValueError("mode must be 'async' or 'memory'")
+
+        self.mode = mode
+
+        self.latest = None # (path, checkpoint) of the latest submitted checkpoint
+        self._pending = None # (write_function, path, checkpoint) still to be written
+        self._writing = False
+        self._error = None
+        self._closed = False
+        self._condition = threading.Condition()
+
+        if self.mode == "async":
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        else:
+            self._thread = None
+
+    def submit(self,
+                agent: object, # agent inheriting from BaseAgent
+                path: str, # directory to save the checkpoint to
+                ) -> None:
+
+        """
+        Snapshot the state of the agent and schedule it to be written to path.
+        """
+
+        self._raise_error()
+
+        if not hasattr(agent, "get_checkpoint"):
+            agent.save(path)
+            return
+
+        checkpoint = agent.get_checkpoint()
+        self.latest = (path, checkpoint)
+
+        with self._condition:
+            if self._pending is not None:
+                logging.debug(f"Dropping unwritten checkpoint for {self._pending[1]}")
+            self._pending = (agent.write_checkpoint, path, checkpoint)
+            self._condition.notify_all()
+
+    def flush(self):
+
+        """
+        Block until the latest submitted checkpoint has been written to disk.
+        """
+
+        if self.mode == "memory":
+            with self._condition:
+                pending, self._pending = self._pending, None
+            if pending is not None:
+                write_function, path, checkpoint = pending
+                write_function(path, checkpoint)
+        else:
+            with self._condition:
+                while (self._pending is not None or self._writing) and self._error is None:
+                    self._condition.wait()
+
+        self._raise_error()
+
+    def close(self):
+
+        """
+        Flush the latest checkpoint and stop the background thread.
+        """
+
+        try:
+            self.flush()
+        finally:
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+            if self._thread is not None:
+                self._thread.join()
+
+    def _run(self):
+
+        """ Loop of the background thread """
+
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    self._condition.wait()
+                if self._pending is None and self._closed:
+                    return
+                pending, self._pending = self._pending, None
+                self._writing = True
+
+            write_function, path, checkpoint = pending
+            try:
+                write_function(path, checkpoint)
+            except Exception as e:
+                logging.error(f"Failed to write checkpoint to {path}: {e}")
+                self._error = e
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+
+    def _raise_error(self):
+
+        """ Re-raise an error of the background thread on the calling thread """
+
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError(f"An error occurred while writing a checkpoint: {error}")
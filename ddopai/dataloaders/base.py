@@ -157,8 +157,20 @@ class BaseDataLoader(ABC):
         else:
             self.dataset_type = "test"
 
+    def get_X_batch(self,
+                indices: np.ndarray, # indices of the samples (interpreted as in __getitem__)
+                ) -> np.ndarray:
 
-# %% ../../nbs/10_dataloaders/10_base_dataloader.ipynb 19
+        """
+        Returns the features for a batch of indices as one array with the samples in the first dimension.
+        The indices are interpreted according to the current dataset type, as in ```__getitem__```.
+        Dataloaders that store their features in arrays should overwrite this function with a vectorized version.
+        """
+
+        return np.stack([self[idx][0] for idx in indices])
+
+
+# %% ../../nbs/10_dataloaders/10_base_dataloader.ipynb 20
 class DummyDataLoader(BaseDataLoader):
    
     """
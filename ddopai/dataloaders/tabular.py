@@ -3,11 +3,10 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/10_dataloaders/12_tabular_dataloaders.ipynb.
 
 # %% auto 0
-__all__ = ['XYDataLoader', 'MultiShapeLoader']
+__all__ = ['XYDataLoader', 'one_hot_columns', 'ArrayScaler', 'MultiShapeLoader', 'AvailabilitySampler']
 
 # %% ../../nbs/10_dataloaders/12_tabular_dataloaders.ipynb 3
 import logging
-logging.basicConfig(level=logging.INFO)
 
 import numpy as np
 from abc import ABC, abstractmethod
@@ -16,10 +15,37 @@ import pandas as pd
 import math
 
 from .base import BaseDataLoader
+from ..utils import get_default_dtype
 
-from sklearn.preprocessing import StandardScaler, MinMaxScaler
+# sklearn scalers are imported when the features are normalized to keep the import of the dataloaders light
 
 # %% ../../nbs/10_dataloaders/12_tabular_dataloaders.ipynb 4
+def _append_rows(obj, # object holding the array as attribute
+                 name: str, # name of the attribute
+                 new_rows: np.ndarray, # rows to append along the first dimension
+                 ):
+
+    """
+    Append rows to the array stored as attribute ``name`` of ``obj`` in amortized O(len(new_rows)). The attribute
+    is replaced by a view on a buffer that is over-allocated by a factor of two whenever it needs to grow.
+    """
+
+    array = getattr(obj, name)
+    buffers = obj.__dict__.setdefault("_row_buffers", {})
+    buffer, view = buffers.get(name, (None, None))
+    n, n_new = len(array), len(new_rows)
+
+    # the buffer is only reused if the attribute is still the view handed out last time
+    if array is not view or n + n_new > len(buffer):
+        buffer = np.empty((2*(n+n_new),) + array.shape[1:], dtype=array.dtype)
+        buffer[:n] = array
+    buffer[n:n+n_new] = new_rows
+    view = buffer[:n+n_new]
+
+    buffers[name] = (buffer, view)
+    setattr(obj, name, view)
+
+# %% ../../nbs/10_dataloaders/12_tabular_dataloaders.ipynb 5
 class XYDataLoader(BaseDataLoader):
 
     """
@@ -40,6 +66,9 @@ class XYDataLoader(BaseDataLoader):
         normalize_features: Union[dict] = None, # default: {'normalize': True, 'ignore_one_hot': True}
     ):
 
+        # store data in the global default dtype (float32 unless changed with set_default_dtype)
+        X = np.asarray(X, dtype=get_default_dtype())
+        Y = np.asarray(Y, dtype=get_default_dtype())
         self.X = X
         self.Y = Y
 
@@ -89,6 +118,8 @@ class XYDataLoader(BaseDataLoader):
 
         if normalize:
 
+            from sklearn.preprocessing import StandardScaler
+
             scaler = StandardScaler()
 
             if initial_normalization:
@@ -144,7 +175,7 @@ class XYDataLoader(BaseDataLoader):
             if self.lag_window is not None and self.lag_window > 0:
 
                 # add lag features as dimention 2 to X (making it dimension (datapoints, sequence_length, features))
-                X_lag = np.zeros((self.X.shape[0], self.lag_window+1, self.X.shape[1]))
+                X_lag = np.zeros((self.X.shape[0], self.lag_window+1, self.X.shape[1]), dtype=self.X.dtype)
                 for i in range(self.lag_window+1):
                     if i == 0:
                         features = self.X
@@ -199,6 +230,84 @@ class XYDataLoader(BaseDataLoader):
 
         return self.X[idx], self.Y[idx]
 
+    def get_X_batch(self,
+                indices: np.ndarray, # indices of the samples (interpreted as in __getitem__)
+                ) -> np.ndarray:
+
+        """ get the features for a batch of indices with a single gather, depending on the dataset type (train, val, test)"""
+
+        indices = np.asarray(indices)
+
+        if self.dataset_type == "train":
+            offset, index_end = 0, self.train_index_end+1
+        elif self.dataset_type == "val":
+            offset, index_end = self.val_index_start, self.test_index_start
+        elif self.dataset_type == "test":
+            offset, index_end = self.test_index_start, len(self.X)
+        else:
+            raise ValueError('dataset_type not set')
+
+        indices = indices + offset
+
+        if indices.size > 0 and indices.max() >= index_end:
+            raise IndexError(f'index {indices.max()} out of range{index_end}')
+
+        return self.X[indices]
+
+    def append(self,
+        X_new: np.ndarray, # new features of shape (datapoints, features), directly following the existing data
+        Y_new: np.ndarray, # new targets of shape (datapoints, units) or (datapoints,)
+        shift_indices: bool = True, # if True, val and test set keep their length and move forward such that the training set grows. Otherwise, the new datapoints extend the test set.
+        ):
+
+        """
+        Append new datapoints (e.g., the latest day of data) without rebuilding the dataloader. X and Y are
+        extended in amortized O(new datapoints) by keeping spare capacity as in a growable buffer. If lag features
+        are pre-calculated, only the lag windows of the new datapoints are built, taking the history from the last
+        window of the existing data.
+
+        """
+
+        X_new = np.asarray(X_new, dtype=self.X.dtype)
+        Y_new = np.asarray(Y_new, dtype=self.Y.dtype)
+        if len(X_new.shape) == 1:
+            X_new = X_new.reshape(-1, 1)
+        if len(Y_new.shape) == 1:
+            Y_new = Y_new.reshape(-1, 1)
+
+        if len(X_new) != len(Y_new):
+            raise ValueError('X_new and Y_new must have the same length')
+        if Y_new.shape[1:] != self.Y.shape[1:]:
+            raise ValueError(f'Y_new must have shape (datapoints, {self.num_units}), got {Y_new.shape}')
+
+        n_new = len(X_new)
+        if n_new == 0:
+            return
+
+        if self.include_y:
+            # lag-1 demand of the new datapoints, the first one is the last target already stored
+            X_new = np.concatenate((X_new, np.concatenate((self.Y[-1:], Y_new[:-1]), axis=0)), axis=1)
+
+        if self.lag_window is not None and self.lag_window > 0:
+            # the last window contains the features of the last lag_window+1 datapoints
+            history = np.concatenate((self.X[-1, 1:], X_new), axis=0)
+            X_new = np.lib.stride_tricks.sliding_window_view(history, self.lag_window+1, axis=0).transpose(0, 2, 1)
+
+        if X_new.shape[1:] != self.X.shape[1:]:
+            raise ValueError(f'X_new does not match the number of features of X (expected {self.X.shape[1:]}, got {X_new.shape[1:]})')
+
+        _append_rows(self, "X", X_new)
+        _append_rows(self, "Y", Y_new)
+
+        if shift_indices:
+            if self.val_index_start is not None:
+                self.val_index_start += n_new
+            if self.test_index_start is not None:
+                self.test_index_start += n_new
+            self.train_index_end += n_new
+        elif self.val_index_start is None and self.test_index_start is None:
+            self.train_index_end += n_new # without val and test set, all data is used for training
+
     def __len__(self):
         return len(self.X)
     
@@ -267,7 +376,110 @@ class XYDataLoader(BaseDataLoader):
             raise ValueError('dataset_type not recognized')
         
 
-# %% ../../nbs/10_dataloaders/12_tabular_dataloaders.ipynb 18
+# %% ../../nbs/10_dataloaders/12_tabular_dataloaders.ipynb 24
+def one_hot_columns(values: np.ndarray # 2D array of shape (samples, columns)
+                    ) -> np.ndarray: # boolean array of shape (columns,)
+
+    """
+    Vectorized check which columns of a 2D array only contain the values 0 and 1.
+    """
+
+    values = np.asarray(values)
+    if values.shape[0] == 0:
+        return np.ones(values.shape[1], dtype=bool)
+    # min/max reductions rule out most continuous columns before the elementwise check
+    candidates = (values.min(axis=0) >= 0) & (values.max(axis=0) <= 1)
+    if np.any(candidates):
+        subset = values[:, candidates]
+        candidates[candidates] = np.all((subset == 0) | (subset == 1), axis=0)
+    return candidates
+
+class ArrayScaler():
+
+    """
+    Column-wise standard or min-max scaler that keeps its statistics as small numpy arrays
+    (``center_`` and ``scale_``, one entry per column) such that they can be stored and reapplied
+    to new data. Columns that shall not be scaled get a center of 0 and a scale of 1. Zero
+    scales (constant columns) are replaced by 1, mirroring sklearn's behavior.
+    """
+
+    def __init__(self,
+                 method: Literal['standard', 'minmax'] = 'standard', # standard (mean, std) or minmax (min, max-min)
+                 ):
+
+        if method not in ['standard', 'minmax']:
+            raise ValueError('method must be either "standard" or "minmax"')
+        self.method = method
+        self.center_ = None
+        self.scale_ = None
+
+    def fit(self,
+            X: np.ndarray, # 2D array of shape (samples, columns)
+            columns: np.ndarray | None = None, # boolean array of columns to scale, all if None
+            ):
+
+        """ Compute the statistics of all columns in one reduction over the samples """
+
+        X = np.asarray(X, dtype=float)
+        if self.method == 'standard':
+            center = X.mean(axis=0)
+            scale = X.std(axis=0)
+            # variance that is only due to rounding errors is treated as zero (as in sklearn)
+            n = X.shape[0]
+            eps = np.finfo(X.dtype).eps
+            constant = scale**2 <= n * eps * scale**2 + (n * center * eps)**2
+        else:
+            center = X.min(axis=0)
+            scale = X.max(axis=0) - center
+            constant = np.zeros_like(scale, dtype=bool)
+        scale[constant | (scale < 10 * np.finfo(X.dtype).eps)] = 1.0
+
+        if columns is not None:
+            columns = np.asarray(columns, dtype=bool)
+            center = np.where(columns, center, 0.0)
+            scale = np.where(columns, scale, 1.0)
+
+        self.center_, self.scale_ = center, scale
+        return self
+
+    def transform(self,
+                  X: np.ndarray, # 2D array with the same columns as during fitting
+                  ) -> np.ndarray:
+
+        if self.center_ is None:
+            raise ValueError('Scaler must be fitted before transforming data')
+        return (np.asarray(X, dtype=float) - self.center_) / self.scale_
+
+    def inverse_transform(self,
+                          X: np.ndarray, # 2D array with the same columns as during fitting
+                          ) -> np.ndarray:
+
+        if self.center_ is None:
+            raise ValueError('Scaler must be fitted before transforming data')
+        return np.asarray(X, dtype=float) * self.scale_ + self.center_
+
+    def transform_frame(self,
+                        df: pd.DataFrame,
+                        ) -> pd.DataFrame:
+
+        """ Transform a DataFrame and return a new DataFrame with the same index, columns and dtype """
+
+        values = df.to_numpy()
+        return pd.DataFrame(self.transform(values).astype(values.dtype, copy=False), index=df.index, columns=df.columns)
+
+    def fit_transform_frame(self,
+                            df: pd.DataFrame,
+                            n_fit: int | None = None, # fit on the first n_fit rows only (e.g., the training timesteps), all rows if None
+                            columns: np.ndarray | None = None, # boolean array of columns to scale, all if None
+                            ) -> pd.DataFrame:
+
+        """ Fit on the first ``n_fit`` rows of a DataFrame and transform all rows """
+
+        values = df.to_numpy()
+        self.fit(values if n_fit is None else values[:n_fit], columns=columns)
+        return pd.DataFrame(self.transform(values).astype(values.dtype, copy=False), index=df.index, columns=df.columns)
+
+# %% ../../nbs/10_dataloaders/12_tabular_dataloaders.ipynb 30
 class MultiShapeLoader(BaseDataLoader):
 
     """
@@ -308,7 +520,8 @@ class MultiShapeLoader(BaseDataLoader):
         demand_unit_size: float | None = None, # use same convention as for other dataloaders and enviornments, but here only full decimal values are allowed
         provide_additional_target: bool = False, # follows ICL convention by providing actual demand to token, with the last token receiving 0
         permutate_inputs: bool = False, # if the inputs shall be permutated during training for meta-learning
-        max_feature_dim: int | None = None
+        max_feature_dim: int | None = None,
+        skip_unavailable: bool = False, # if meta_learn_units, (SKU, time) pairs where the SKU is not available according to the mask are left out of the training index
     ):
      
         logging.info("Setting main env attributes")
@@ -321,14 +534,15 @@ class MultiShapeLoader(BaseDataLoader):
         self.mask = mask
         self.permutate_inputs = permutate_inputs
 
-        # convert dtypes to float
-        self.demand = self.demand.astype(float)
-        self.time_features = self.time_features.astype(float)
-        self.time_SKU_features = self.time_SKU_features.astype(float)
+        # convert dtypes to the global default dtype (float32 unless changed with set_default_dtype)
+        dtype = get_default_dtype()
+        self.demand = self.demand.astype(dtype)
+        self.time_features = self.time_features.astype(dtype)
+        self.time_SKU_features = self.time_SKU_features.astype(dtype)
         if self.SKU_features is not None:
-            self.SKU_features = self.SKU_features.astype(float)
+            self.SKU_features = self.SKU_features.astype(dtype)
         if self.mask is not None:
-            self.mask = self.mask.astype(float)
+            self.mask = self.mask.astype(dtype)
 
         self.max_feature_dim = max_feature_dim
 
@@ -343,6 +557,7 @@ class MultiShapeLoader(BaseDataLoader):
         # Set further training parameters
         self.include_non_available = include_non_available
         self.meta_learn_units = meta_learn_units
+        self.skip_unavailable = skip_unavailable
         train_subset, train_subset_SKUs = self.set_train_subset(train_subset, train_subset_SKUs) # set the attributes train_subset and train_subset_SKUs
         self.lag_demand_normalization = lag_demand_normalization if lag_demand_normalization is not None else demand_normalization
         self.demand_normalization = demand_normalization
@@ -468,12 +683,12 @@ class MultiShapeLoader(BaseDataLoader):
         self.mask_indices = self.save_indices(self.mask) if self.mask is not None else None
 
         logging.info("--Converting to numpy - in sample")
-        self.demand = self.demand.to_numpy()
-        self.demand_lag = self.demand_lag.to_numpy()
-        self.SKU_features = self.SKU_features.to_numpy() if self.SKU_features is not None else None
-        self.time_features = self.time_features.to_numpy()
-        self.time_SKU_features = self.time_SKU_features.to_numpy()
-        self.mask = self.mask.to_numpy() if self.mask is not None else None
+        self.demand = self.demand.to_numpy(dtype=dtype)
+        self.demand_lag = self.demand_lag.to_numpy(dtype=dtype)
+        self.SKU_features = self.SKU_features.to_numpy(dtype=dtype) if self.SKU_features is not None else None
+        self.time_features = self.time_features.to_numpy(dtype=dtype)
+        self.time_SKU_features = self.time_SKU_features.to_numpy(dtype=dtype)
+        self.mask = self.mask.to_numpy(dtype=dtype) if self.mask is not None else None
 
         # check if all values are finite
         logging.info("--Checking that all values are finite")
@@ -514,11 +729,11 @@ class MultiShapeLoader(BaseDataLoader):
             self.mask_out_of_sample_val_indices = self.save_indices(self.mask_out_of_sample_val) if self.mask_out_of_sample_val is not None else None
         
             logging.info("--Converting to numpy - out of sample val")
-            self.demand_out_of_sample_val = self.demand_out_of_sample_val.to_numpy()
-            self.demand_lag_out_of_sample_val = self.demand_lag_out_of_sample_val.to_numpy()
-            self.SKU_features_out_of_sample_val = self.SKU_features_out_of_sample_val.to_numpy() if self.SKU_features_out_of_sample_val is not None else None
-            self.time_SKU_features_out_of_sample_val = self.time_SKU_features_out_of_sample_val.to_numpy()
-            self.mask_out_of_sample_val = self.mask_out_of_sample_val.to_numpy() if self.mask_out_of_sample_val is not None else None
+            self.demand_out_of_sample_val = self.demand_out_of_sample_val.to_numpy(dtype=dtype)
+            self.demand_lag_out_of_sample_val = self.demand_lag_out_of_sample_val.to_numpy(dtype=dtype)
+            self.SKU_features_out_of_sample_val = self.SKU_features_out_of_sample_val.to_numpy(dtype=dtype) if self.SKU_features_out_of_sample_val is not None else None
+            self.time_SKU_features_out_of_sample_val = self.time_SKU_features_out_of_sample_val.to_numpy(dtype=dtype)
+            self.mask_out_of_sample_val = self.mask_out_of_sample_val.to_numpy(dtype=dtype) if self.mask_out_of_sample_val is not None else None
 
             self.demand_out_of_sample_test_indices = self.save_indices(self.demand_out_of_sample_test)
             self.SKU_features_out_of_sample_test_indices = self.save_indices(self.SKU_features_out_of_sample_test) if self.SKU_features_out_of_sample_test is not None else None
@@ -526,22 +741,22 @@ class MultiShapeLoader(BaseDataLoader):
             self.mask_out_of_sample_test_indices = self.save_indices(self.mask_out_of_sample_test) if self.mask_out_of_sample_test is not None else None
 
             logging.info("--Converting to numpy - out of sample test")
-            self.demand_out_of_sample_test = self.demand_out_of_sample_test.to_numpy()
-            self.demand_lag_out_of_sample_test = self.demand_lag_out_of_sample_test.to_numpy()
-            self.SKU_features_out_of_sample_test = self.SKU_features_out_of_sample_test.to_numpy() if self.SKU_features_out_of_sample_test is not None else None
-            self.time_SKU_features_out_of_sample_test = self.time_SKU_features_out_of_sample_test.to_numpy()
-            self.mask_out_of_sample_test = self.mask_out_of_sample_test.to_numpy() if self.mask_out_of_sample_test is not None else None
+            self.demand_out_of_sample_test = self.demand_out_of_sample_test.to_numpy(dtype=dtype)
+            self.demand_lag_out_of_sample_test = self.demand_lag_out_of_sample_test.to_numpy(dtype=dtype)
+            self.SKU_features_out_of_sample_test = self.SKU_features_out_of_sample_test.to_numpy(dtype=dtype) if self.SKU_features_out_of_sample_test is not None else None
+            self.time_SKU_features_out_of_sample_test = self.time_SKU_features_out_of_sample_test.to_numpy(dtype=dtype)
+            self.mask_out_of_sample_test = self.mask_out_of_sample_test.to_numpy(dtype=dtype) if self.mask_out_of_sample_test is not None else None
 
         ############ final params ############
         self.len_train_time = self.train_index_end-self.train_index_start+1
 
-        print("len_train_time:", self.len_train_time)
-        print("num_units:", self.num_units)
-        print("len train_SKU_indices:", len(self.train_SKUs_indices))
+        logging.debug(f"len_train_time: {self.len_train_time}")
+        logging.debug(f"num_units: {self.num_units}")
+        logging.debug(f"len train_SKU_indices: {len(self.train_SKUs_indices)}")
 
         if self.meta_learn_units:
             logging.info("--Creating time-SKU index for training data")
-            self.sku_time_index = [(i, j) for i in self.train_SKUs_indices for j in range(self.len_train_time)]
+            self.sku_time_index = self.build_sku_time_index()
 
         self.set_return_sku("in_sample")
 
@@ -564,7 +779,7 @@ class MultiShapeLoader(BaseDataLoader):
                 if train_subset != len(train_subset_SKUs):
                     raise ValueError('train_subset_SKUs must have the same length as train_subset')
 
-        print("setting train_subset:", train_subset, "train_subset_SKUs:", train_subset_SKUs)
+        logging.debug(f"setting train_subset: {train_subset}, train_subset_SKUs: {train_subset_SKUs}")
         
         return train_subset, train_subset_SKUs
 
@@ -585,7 +800,7 @@ class MultiShapeLoader(BaseDataLoader):
                         missing_SKUs += 1
                         names.append(i)
                 
-                print(names)
+                logging.error(f"SKUs not found in demand: {names}")
             
 
                 raise ValueError('in_sample_val_test_SKUs must be a subset of all SKUs')
@@ -595,7 +810,7 @@ class MultiShapeLoader(BaseDataLoader):
     def identify_train_SKUs(self, train_subset, train_subset_SKUs):
         """ determine which SKUs are used for training, validation and testing """
 
-        print("train_subset:", train_subset)
+        logging.debug(f"train_subset: {train_subset}")
         
         if train_subset is not None:
 
@@ -642,32 +857,41 @@ class MultiShapeLoader(BaseDataLoader):
         if out_of_sample_test_SKUs is None:
             out_of_sample_test_SKUs = []
 
+        # Column masks and positions are computed once and each data block is split with a single take
+        demand_SKUs = self.demand.columns
+        time_SKU_features_SKUs = self.time_SKU_features.columns.get_level_values(1)
+        time_SKU_features_names = self.time_SKU_features.columns.get_level_values(0).unique()
+
         for sku, attr_suffix in [(out_of_sample_val_SKUs, 'val'), (out_of_sample_test_SKUs, 'test')]:
-            if sku is not None:
-                logging.info(f"--Setting out-of-sample {attr_suffix} SKUs")
-                # Set attributes for out-of-sample SKUs
-                setattr(self, f'demand_out_of_sample_{attr_suffix}', self.demand.loc[:, sku])
-                if self.SKU_features is not None:
-                    setattr(self, f'SKU_features_out_of_sample_{attr_suffix}', self.SKU_features.loc[sku])
-                setattr(self, f'time_SKU_features_out_of_sample_{attr_suffix}', # here SKU are in columns on index level 2
-                        self.time_SKU_features.loc[:, pd.IndexSlice[:, sku]]) 
-                if self.mask is not None:
-                    setattr(self, f'mask_out_of_sample_{attr_suffix}', self.mask.loc[:, sku])
-                    # time_features are independent of SKU, so no need to set them
+            logging.info(f"--Setting out-of-sample {attr_suffix} SKUs")
+            demand_positions = demand_SKUs.get_indexer(sku)
+            if np.any(demand_positions < 0):
+                raise ValueError(f'out-of-sample {attr_suffix} SKUs not found in demand: {list(np.asarray(sku)[demand_positions < 0])}')
+            # time-SKU features are stored feature-major (all SKUs of the first feature, then the second, ...)
+            time_SKU_features_positions = self.time_SKU_features.columns.get_indexer(pd.MultiIndex.from_product([time_SKU_features_names, sku]))
+            if np.any(time_SKU_features_positions < 0):
+                raise ValueError(f'out-of-sample {attr_suffix} SKUs are missing time-SKU features')
+
+            # Set attributes for out-of-sample SKUs
+            setattr(self, f'demand_out_of_sample_{attr_suffix}', self.demand.iloc[:, demand_positions])
+            if self.SKU_features is not None:
+                setattr(self, f'SKU_features_out_of_sample_{attr_suffix}', self.SKU_features.loc[sku])
+            setattr(self, f'time_SKU_features_out_of_sample_{attr_suffix}', self.time_SKU_features.iloc[:, time_SKU_features_positions])
+            # time_features are independent of SKU, so no need to set them
+            setattr(self, f'mask_out_of_sample_{attr_suffix}', self.mask.iloc[:, demand_positions] if self.mask is not None else None)
 
         # unique values of uniion of both lists
         skus_to_remove = list(set(out_of_sample_val_SKUs).union(out_of_sample_test_SKUs))
         if skus_to_remove:
             logging.info(f"--Removing {len(skus_to_remove)} out-of-sample SKUs from in-sample data")
             # Remove out-of-sample SKUs from in-sample data
-            self.demand.drop(columns=skus_to_remove, inplace=True)
+            in_sample_demand = ~demand_SKUs.isin(skus_to_remove)
+            self.demand = self.demand.loc[:, in_sample_demand]
             if self.SKU_features is not None:
-                self.SKU_features.drop(index=skus_to_remove, inplace=True)
-            for single_sku in skus_to_remove:
-                columns_to_drop = self.time_SKU_features.columns.get_loc_level(single_sku, level=1)
-                self.time_SKU_features.drop(columns=self.time_SKU_features.columns[columns_to_drop[0]], inplace=True)
+                self.SKU_features = self.SKU_features.loc[~self.SKU_features.index.isin(skus_to_remove)]
+            self.time_SKU_features = self.time_SKU_features.loc[:, ~time_SKU_features_SKUs.isin(skus_to_remove)]
             if self.mask is not None:
-                self.mask.drop(columns=skus_to_remove, inplace=True)
+                self.mask = self.mask.loc[:, in_sample_demand]
 
         return out_of_sample_val_SKUs, out_of_sample_test_SKUs
 
@@ -757,6 +981,7 @@ class MultiShapeLoader(BaseDataLoader):
 
         """
         Normalize features using a standard scaler. If ignore_one_hot is true, one-hot encoded features are not normalized.
+        All statistics are computed in one reduction over the training timesteps and stored in ``ArrayScaler`` objects.
         """
 
         if normalize:
@@ -764,43 +989,36 @@ class MultiShapeLoader(BaseDataLoader):
             if self.normalized_in_sample_SKUs:
                 raise ValueError('Features already normalized')
 
-            if self.demand_normalization == 'minmax':
-                self.scaler_demand = MinMaxScaler()
-                self.scaler_out_of_sample_val_demand = MinMaxScaler()
-                self.scaler_out_of_sample_test_demand = MinMaxScaler()
-            elif self.demand_normalization == 'standard':
-                self.scaler_demand = StandardScaler()
-                self.scaler_out_of_sample_val_demand = StandardScaler()
-                self.scaler_out_of_sample_test_demand = StandardScaler()
-            elif self.demand_normalization == 'no_normalization':
+            if self.demand_normalization == 'no_normalization':
                 self.scaler_demand = None
                 self.scaler_out_of_sample_val_demand = None
                 self.scaler_out_of_sample_test_demand = None
+            elif self.demand_normalization in ['minmax', 'standard']:
+                self.scaler_demand = ArrayScaler(self.demand_normalization)
+                self.scaler_out_of_sample_val_demand = ArrayScaler(self.demand_normalization)
+                self.scaler_out_of_sample_test_demand = ArrayScaler(self.demand_normalization)
             else:
                 raise ValueError('demand_normalization must be either "minmax", "standard", or "no_normalization"')
             
             # If demand data used for lag feautures is normalized differently
             if self.lag_demand_normalization != self.demand_normalization:
-                if self.lag_demand_normalization == 'minmax':
-                    self.scaler_demand_lag = MinMaxScaler()
-                    self.scaler_out_of_sample_val_demand_lag = MinMaxScaler()
-                    self.scaler_out_of_sample_test_demand_lag = MinMaxScaler()
-                elif self.lag_demand_normalization == 'standard':
-                    self.scaler_demand_lag = StandardScaler()
-                    self.scaler_out_of_sample_val_demand_lag = StandardScaler()
-                    self.scaler_out_of_sample_test_demand_lag = StandardScaler()
-                elif self.lag_demand_normalization == 'no_normalization':
+                if self.lag_demand_normalization == 'no_normalization':
                     self.scaler_demand_lag = None
                     self.scaler_out_of_sample_val_demand_lag = None
                     self.scaler_out_of_sample_test_demand_lag = None
+                elif self.lag_demand_normalization in ['minmax', 'standard']:
+                    self.scaler_demand_lag = ArrayScaler(self.lag_demand_normalization)
+                    self.scaler_out_of_sample_val_demand_lag = ArrayScaler(self.lag_demand_normalization)
+                    self.scaler_out_of_sample_test_demand_lag = ArrayScaler(self.lag_demand_normalization)
                 else:
                     raise ValueError('lag_demand_normalization must be either "minmax", "standard", or "no_normalization"')
             
-            self.scaler_SKU_features = StandardScaler() if self.SKU_features is not None else None # only one since out of sample uses the same fit on known  skus
-            self.scaler_time_features = StandardScaler() # only one since time-features are shared between in-sample and out-of-sample SKUs
-            self.scaler_time_SKU_features= [StandardScaler() for _ in range(self.num_time_SKU_features)]
-            self.scaler_out_of_sample_val_SKU_features = [StandardScaler() for _ in range(self.num_time_SKU_features)]
-            self.scaler_out_of_sample_test_SKU_features = [StandardScaler() for _ in range(self.num_time_SKU_features)]
+            self.scaler_SKU_features = ArrayScaler() if self.SKU_features is not None else None # only one since out of sample uses the same fit on known  skus
+            self.scaler_time_features = ArrayScaler() # only one since time-features are shared between in-sample and out-of-sample SKUs
+            # one scaler for all time-SKU features, holding one statistic per (feature, SKU) column
+            self.scaler_time_SKU_features = ArrayScaler()
+            self.scaler_out_of_sample_val_SKU_features = ArrayScaler()
+            self.scaler_out_of_sample_test_SKU_features = ArrayScaler()
 
             if initial_normalization:
 
@@ -812,11 +1030,7 @@ class MultiShapeLoader(BaseDataLoader):
                 # Normalize demand targets
                 if self.demand_normalization != 'no_normalization':
                     # Normalizing per SKU on time dimension
-
-                    print(self.demand)
-                    self.scaler_demand.fit(self.demand[:self.train_index_end+1])
-                    transformed_demand = self.scaler_demand.transform(self.demand)
-                    self.demand.iloc[:,:] = transformed_demand
+                    self.demand = self.scaler_demand.fit_transform_frame(self.demand, self.train_index_end+1)
 
                 # Set unit size for demand targets
                 if self.demand_unit_size != None:
@@ -825,10 +1039,8 @@ class MultiShapeLoader(BaseDataLoader):
                 # If separate normalization for lag demand, normalize it
                 if self.lag_demand_normalization != self.demand_normalization:
                     if self.lag_demand_normalization != 'no_normalization':
-                        self.demand_lag = self.demand.copy() # if lag demand shall be normalized, build on the normalized demand (to account for slight variations due to rounding)
-                        self.scaler_demand_lag.fit(self.demand_lag[:self.train_index_end+1])
-                        transformed_demand_lag = self.scaler_demand_lag.transform(self.demand_lag)
-                        self.demand_lag.iloc[:,:] = transformed_demand_lag
+                        # if lag demand shall be normalized, build on the normalized demand (to account for slight variations due to rounding)
+                        self.demand_lag = self.scaler_demand_lag.fit_transform_frame(self.demand, self.train_index_end+1)
                 
                 # If lag demand shall be normalized the same way, then copy the normalized demand
                 else:
@@ -837,36 +1049,27 @@ class MultiShapeLoader(BaseDataLoader):
                 if self.SKU_features is not None:
                     logging.info("--Normalizing SKU features")
                     # Normalizing across SKUs, no time dimension present
-                    continuous_features = [col for col in self.SKU_features.columns if not self.is_one_hot(self.SKU_features[col])] if ignore_one_hot else self.SKU_features.columns
-                    self.SKU_features_to_fit = continuous_features
-                    if len(continuous_features) > 0:
-                        self.scaler_SKU_features.fit(self.SKU_features[continuous_features]) # SKU features are already calculated based on training index
-                        transformed_SKU_features = self.scaler_SKU_features.transform(self.SKU_features[continuous_features])
-                        self.SKU_features[continuous_features] = transformed_SKU_features
+                    to_fit = ~one_hot_columns(self.SKU_features.to_numpy()) if ignore_one_hot else np.ones(self.SKU_features.shape[1], dtype=bool)
+                    self.SKU_features_to_fit = self.SKU_features.columns[to_fit]
+                    # SKU features are already calculated based on training index
+                    self.SKU_features = self.scaler_SKU_features.fit_transform_frame(self.SKU_features, columns=to_fit)
 
                 logging.info("--Normalizing time features")
                 # Normalizting time features (no SKU dimension)
-                continuous_features = [col for col in self.time_features.columns if not self.is_one_hot(self.time_features[col])] if ignore_one_hot else self.time_features.columns
-                self.time_features_to_fit = continuous_features
-                if len(continuous_features) > 0:
-                    self.scaler_time_features.fit(self.time_features.loc[:, continuous_features].iloc[:self.train_index_end+1, :])
-                    transformed_time_features = self.scaler_time_features.transform(self.time_features.loc[:,continuous_features])
-                    self.time_features.loc[:,continuous_features] = transformed_time_features
+                to_fit = ~one_hot_columns(self.time_features.to_numpy()) if ignore_one_hot else np.ones(self.time_features.shape[1], dtype=bool)
+                self.time_features_to_fit = self.time_features.columns[to_fit]
+                self.time_features = self.scaler_time_features.fit_transform_frame(self.time_features, self.train_index_end+1, columns=to_fit)
 
                 logging.info("--Normalizing time-SKU features")
-                # Normalize time-SKU features (double-indexed)
-                self.time_SKU_features_to_fit = dict()
-                for i, feature in enumerate(self.time_SKU_features.columns.get_level_values(0).unique()):
-                    # Select all columns corresponding to the current feature in level 0
-                    feature_df = self.time_SKU_features.xs(key=feature, axis=1, level=0)
-
-                    should_scale = not ignore_one_hot or (not self.is_one_hot_across_skus(feature_df) if ignore_one_hot else False)
-                    self.time_SKU_features_to_fit.update({feature: should_scale})
-                    if should_scale:
-                        self.scaler_time_SKU_features[i].fit(feature_df[:self.train_index_end+1])
-                        transformed_feature_df = self.scaler_time_SKU_features[i].transform(feature_df)
-                        self.time_SKU_features.loc[:, (feature, slice(None))] = transformed_feature_df
-
+                # Normalize time-SKU features (double-indexed). A feature is only treated as one-hot if it is one-hot for all SKUs.
+                feature_codes, features = pd.factorize(self.time_SKU_features.columns.get_level_values(0))
+                if ignore_one_hot:
+                    not_one_hot = ~one_hot_columns(self.time_SKU_features.to_numpy())
+                    should_scale = np.bincount(feature_codes, weights=not_one_hot, minlength=len(features)) > 0
+                else:
+                    should_scale = np.ones(len(features), dtype=bool)
+                self.time_SKU_features_to_fit = dict(zip(features, should_scale.tolist()))
+                self.time_SKU_features = self.scaler_time_SKU_features.fit_transform_frame(self.time_SKU_features, self.train_index_end+1, columns=should_scale[feature_codes])
             
                 self.normalized_in_sample_SKUs = True
 
@@ -903,14 +1106,8 @@ class MultiShapeLoader(BaseDataLoader):
                 # Normalize demand targets
                 if self.demand_normalization != 'no_normalization':
                     # Normalizing per SKU on time dimension
-
-                    self.scaler_out_of_sample_test_demand.fit(self.demand_out_of_sample_test[:self.train_index_end+1])
-                    transformed_demand = self.scaler_out_of_sample_test_demand.transform(self.demand_out_of_sample_test)
-                    self.demand_out_of_sample_test.iloc[:,:] = transformed_demand
-
-                    self.scaler_out_of_sample_val_demand.fit(self.demand_out_of_sample_val[:self.train_index_end+1])
-                    transformed_demand = self.scaler_out_of_sample_val_demand.transform(self.demand_out_of_sample_val)
-                    self.demand_out_of_sample_val.iloc[:,:] = transformed_demand
+                    self.demand_out_of_sample_test = self.scaler_out_of_sample_test_demand.fit_transform_frame(self.demand_out_of_sample_test, self.train_index_end+1)
+                    self.demand_out_of_sample_val = self.scaler_out_of_sample_val_demand.fit_transform_frame(self.demand_out_of_sample_val, self.train_index_end+1)
                 
                 # Set unit size for demand targets
                 if self.demand_unit_size != None:
@@ -920,19 +1117,8 @@ class MultiShapeLoader(BaseDataLoader):
                 # If separate normalization for lag demand, normalize it
                 if self.lag_demand_normalization != self.demand_normalization:
                     if self.lag_demand_normalization != 'no_normalization':
-                        
-                        self.demand_lag_out_of_sample_test = self.demand_out_of_sample_test.copy()
-                        
-                        self.demand_lag_out_of_sample_test = self.demand_out_of_sample_test.copy()
-                        self.scaler_out_of_sample_test_demand_lag.fit(self.demand_lag_out_of_sample_test[:self.train_index_end+1])
-                        transformed_demand_lag = self.scaler_out_of_sample_test_demand_lag.transform(self.demand_lag_out_of_sample_test)
-                        self.demand_lag_out_of_sample_test.iloc[:,:] = transformed_demand_lag
-                        
-                        self.demand_lag_out_of_sample_val = self.demand_out_of_sample_val.copy()
-                        self.demand_lag_out_of_sample_val = self.demand_out_of_sample_val.copy()
-                        self.scaler_out_of_sample_val_demand_lag.fit(self.demand_lag_out_of_sample_val[:self.train_index_end+1])
-                        transformed_demand_lag = self.scaler_out_of_sample_val_demand_lag.transform(self.demand_lag_out_of_sample_val)
-                        self.demand_lag_out_of_sample_val.iloc[:,:] = transformed_demand_lag
+                        self.demand_lag_out_of_sample_test = self.scaler_out_of_sample_test_demand_lag.fit_transform_frame(self.demand_out_of_sample_test, self.train_index_end+1)
+                        self.demand_lag_out_of_sample_val = self.scaler_out_of_sample_val_demand_lag.fit_transform_frame(self.demand_out_of_sample_val, self.train_index_end+1)
                     
                 # If lag demand shall be normalized the same way, then copy the normalized demand
                 else:
@@ -941,37 +1127,17 @@ class MultiShapeLoader(BaseDataLoader):
                     
                 if self.SKU_features is not None:
                     logging.info("--Normalizing SKU features")
-                    # Normalizing across SKUs, no time dimension present
-                    continuous_features = self.SKU_features_to_fit
-                    if len(continuous_features) > 0:
-                        transformed_SKU_features = self.scaler_SKU_features.transform(self.SKU_features_out_of_sample_test[continuous_features])
-                        self.SKU_features_out_of_sample_test[continuous_features] = transformed_SKU_features
-                    
-                    if len(continuous_features) > 0:
-                        transformed_SKU_features = self.scaler_SKU_features.transform(self.SKU_features_out_of_sample_val[continuous_features])
-                        self.SKU_features_out_of_sample_val[continuous_features] = transformed_SKU_features
+                    # Normalizing across SKUs with the statistics fitted on the in-sample SKUs
+                    self.SKU_features_out_of_sample_test = self.scaler_SKU_features.transform_frame(self.SKU_features_out_of_sample_test)
+                    self.SKU_features_out_of_sample_val = self.scaler_SKU_features.transform_frame(self.SKU_features_out_of_sample_val)
 
                 logging.info("--Normalizing time-SKU features")
                 
-                for i, feature in enumerate(self.time_SKU_features_out_of_sample_test.columns.get_level_values(0).unique()):
-                    # Select all columns corresponding to the current feature in level 0
-                    feature_df = self.time_SKU_features_out_of_sample_test.xs(key=feature, axis=1, level=0)
-
-                    should_scale = self.time_SKU_features_to_fit[feature]
-                    if should_scale:
-                        self.scaler_out_of_sample_test_SKU_features[i].fit(feature_df[:self.train_index_end+1])
-                        transformed_feature_df = self.scaler_out_of_sample_test_SKU_features[i].transform(feature_df)
-                        self.time_SKU_features_out_of_sample_test.loc[:, (feature, slice(None))] = transformed_feature_df
-                
-                for i, feature in enumerate(self.time_SKU_features_out_of_sample_val.columns.get_level_values(0).unique()):
-                    # Select all columns corresponding to the current feature in level 0
-                    feature_df = self.time_SKU_features_out_of_sample_val.xs(key=feature, axis=1, level=0)
-
-                    should_scale = self.time_SKU_features_to_fit[feature]
-                    if should_scale:
-                        self.scaler_out_of_sample_val_SKU_features[i].fit(feature_df[:self.train_index_end+1])
-                        transformed_feature_df = self.scaler_out_of_sample_val_SKU_features[i].transform(feature_df)
-                        self.time_SKU_features_out_of_sample_val.loc[:, (feature, slice(None))] = transformed_feature_df
+                for scaler, attr in [(self.scaler_out_of_sample_test_SKU_features, 'time_SKU_features_out_of_sample_test'),
+                                     (self.scaler_out_of_sample_val_SKU_features, 'time_SKU_features_out_of_sample_val')]:
+                    time_SKU_features = getattr(self, attr)
+                    should_scale = time_SKU_features.columns.get_level_values(0).map(self.time_SKU_features_to_fit).to_numpy(dtype=bool)
+                    setattr(self, attr, scaler.fit_transform_frame(time_SKU_features, self.train_index_end+1, columns=should_scale))
             
                 self.normalized_out_of_sample_SKUs = True
 
@@ -988,6 +1154,150 @@ class MultiShapeLoader(BaseDataLoader):
 
         # Problem: updating lag_features naively would shorten the dataset each time it is called
 
+    def append(self,
+        demand: pd.DataFrame, # new demand of shape new_time x SKU, including the out-of-sample SKUs
+        time_features: pd.DataFrame, # new time features of shape new_time x time_features
+        time_SKU_features: pd.DataFrame, # new time-SKU features of shape new_time x (time_SKU_features*SKU) with double index
+        mask: pd.DataFrame = None, # new mask of shape new_time x SKU, required if the dataloader has a mask
+        shift_indices: bool = True, # if True, val and test set keep their length and move forward such that the training set grows. Otherwise, the new timesteps extend the test set.
+        ):
+
+        """
+        Append new timesteps (e.g., the latest day of data) without rebuilding the dataloader. The new data is split into
+        in-sample and out-of-sample SKUs with the stored column indices and normalized with the scalers fitted during
+        initialization, which stay frozen (as do the SKU features, including engineered ones). The arrays are extended in
+        amortized O(new timesteps) by keeping spare capacity as in a growable buffer. Lag features are sliced from the
+        stored arrays in ``__getitem__`` and therefore directly cover the new timesteps.
+        """
+
+        n_new = len(demand)
+        if len(time_features) != n_new or len(time_SKU_features) != n_new or (mask is not None and len(mask) != n_new):
+            raise ValueError('demand, time_features, time_SKU_features and mask must have the same number of timesteps')
+        if self.mask is not None and mask is None:
+            raise ValueError('mask must be provided as the dataloader has been initialized with a mask')
+        if n_new == 0:
+            return
+
+        logging.info("Normalizing new timesteps with the fitted scalers")
+        new_data = {}
+
+        ############ in sample data ############
+        scaler_demand_lag = self.scaler_demand_lag if self.lag_demand_normalization != self.demand_normalization else None
+        new_data["demand"], new_data["demand_lag"] = self.normalize_new_demand(
+            self.take_columns(demand, self.demand_indices["columns"], "demand"), self.scaler_demand, scaler_demand_lag)
+        new_data["time_features"] = self.scaler_time_features.transform(
+            self.take_columns(time_features, self.time_features_indices["columns"], "time_features"))
+        new_data["time_SKU_features"] = self.scaler_time_SKU_features.transform(
+            self.take_columns(time_SKU_features, self.time_SKU_features_indices["columns"], "time_SKU_features"))
+        if self.mask is not None:
+            new_data["mask"] = self.take_columns(mask, self.mask_indices["columns"], "mask")
+
+        ############ out of sample data ############
+        if self.out_of_sample:
+            for attr_suffix in ['val', 'test']:
+                scaler_demand = getattr(self, f'scaler_out_of_sample_{attr_suffix}_demand')
+                scaler_demand_lag = getattr(self, f'scaler_out_of_sample_{attr_suffix}_demand_lag') if self.lag_demand_normalization != self.demand_normalization else None
+                demand_indices = getattr(self, f'demand_out_of_sample_{attr_suffix}_indices')
+                new_data[f'demand_out_of_sample_{attr_suffix}'], new_data[f'demand_lag_out_of_sample_{attr_suffix}'] = self.normalize_new_demand(
+                    self.take_columns(demand, demand_indices["columns"], "demand"), scaler_demand, scaler_demand_lag)
+                time_SKU_features_indices = getattr(self, f'time_SKU_features_out_of_sample_{attr_suffix}_indices')
+                new_data[f'time_SKU_features_out_of_sample_{attr_suffix}'] = getattr(self, f'scaler_out_of_sample_{attr_suffix}_SKU_features').transform(
+                    self.take_columns(time_SKU_features, time_SKU_features_indices["columns"], "time_SKU_features"))
+                mask_indices = getattr(self, f'mask_out_of_sample_{attr_suffix}_indices')
+                if mask_indices is not None:
+                    new_data[f'mask_out_of_sample_{attr_suffix}'] = self.take_columns(mask, mask_indices["columns"], "mask")
+
+        # check all new data before changing any attribute
+        for name, values in new_data.items():
+            if not np.all(np.isfinite(values)):
+                raise ValueError(f'new {name} contains non-finite values')
+
+        logging.info("Appending new timesteps")
+        for name, values in new_data.items():
+            _append_rows(self, name, values)
+
+        self.demand_indices["rows"] = self.demand_indices["rows"].append(demand.index)
+        self.time_features_indices["rows"] = self.time_features_indices["rows"].append(time_features.index)
+        self.time_SKU_features_indices["rows"] = self.time_SKU_features_indices["rows"].append(time_SKU_features.index)
+        if self.mask is not None:
+            self.mask_indices["rows"] = self.mask_indices["rows"].append(mask.index)
+
+        ############ indices ############
+        if shift_indices:
+            if self.val_index_start is not None:
+                self.val_index_start += n_new
+            if self.test_index_start is not None:
+                self.test_index_start += n_new
+            self.train_index_end += n_new
+        elif self.val_index_start is None and self.test_index_start is None:
+            self.train_index_end += n_new # without val and test set, all timesteps are used for training
+
+        self.len_train_time = self.train_index_end-self.train_index_start+1
+        if self.meta_learn_units:
+            self.sku_time_index = self.build_sku_time_index()
+
+    def normalize_new_demand(self,
+        demand: np.ndarray, # new demand of shape new_time x SKU
+        scaler_demand: ArrayScaler | None, # fitted scaler for the demand targets
+        scaler_demand_lag: ArrayScaler | None, # fitted scaler for the lag demand if it is normalized differently
+        ) -> Tuple[np.ndarray, np.ndarray]:
+
+        """
+        Normalize new demand with fitted scalers, following the same steps as during initialization. Returns the
+        demand targets and the demand used for lag features.
+        """
+
+        dtype = get_default_dtype()
+        demand_lag = demand # original demand values for lag demand
+
+        if self.demand_normalization != 'no_normalization':
+            demand = scaler_demand.transform(demand).astype(dtype)
+
+        if self.demand_unit_size != None:
+            demand = np.round(demand, self.demand_unit_size)
+
+        if self.lag_demand_normalization != self.demand_normalization:
+            if self.lag_demand_normalization != 'no_normalization':
+                demand_lag = scaler_demand_lag.transform(demand).astype(dtype)
+        else:
+            demand_lag = demand
+
+        return demand, demand_lag
+
+    @staticmethod
+    def take_columns(df: pd.DataFrame,
+                     columns: pd.Index, # columns to select, in this order
+                     name: str, # name of the data for error messages
+                     ) -> np.ndarray:
+
+        """
+        Select columns of a DataFrame by label and return them as numpy array in the default dtype.
+        """
+
+        positions = df.columns.get_indexer(columns)
+        if np.any(positions < 0):
+            raise ValueError(f'{name} is missing the columns {list(columns[positions < 0])}')
+        return df.to_numpy(dtype=get_default_dtype())[:, positions]
+
+    def build_sku_time_index(self):
+
+        """
+        Build the training index for meta_learn_units. A training sample is identified by the flat integer
+        ``sku_position*len_train_time + time_position`` that is decoded with divmod in ``get_time_SKU_idx``.
+        If all (SKU, time) pairs are used, the index is implicit (None) and needs no memory. If skip_unavailable
+        is set, the index is an integer array holding only the flat indices of available pairs.
+        """
+
+        if not self.skip_unavailable:
+            return None
+        if self.mask is None:
+            raise ValueError('skip_unavailable requires a mask')
+
+        available = self.mask[self.train_index_start:self.train_index_end+1, self.train_SKUs_indices] > 0
+        flat_index = np.flatnonzero(available.T) # transposed to order the pairs by SKU, then time
+        dtype = np.int32 if available.size <= np.iinfo(np.int32).max else np.int64
+        return flat_index.astype(dtype)
+
     def get_time_SKU_idx(self, idx):
 
         """ get time and SKU index by index, depending on the dataset type (train, val, test) """
@@ -998,10 +1308,11 @@ class MultiShapeLoader(BaseDataLoader):
 
             if self.meta_learn_units:
 
-                if idx >= len(self.sku_time_index):
-                    raise IndexError(f'index {idx} out of range{len(self.sku_time_index)}')
-                idx_sku, idx_time, = self.sku_time_index[idx]
-                idx_skus = [idx_sku]
+                if idx >= self.len_train:
+                    raise IndexError(f'index {idx} out of range{self.len_train}')
+                flat_idx = idx if self.sku_time_index is None else self.sku_time_index[idx]
+                idx_sku, idx_time = divmod(int(flat_idx), self.len_train_time)
+                idx_skus = [self.train_SKUs_indices[idx_sku]]
 
             else:
                 if idx+self.train_index_start > self.train_index_end:
@@ -1097,9 +1408,9 @@ class MultiShapeLoader(BaseDataLoader):
         demand = demand[idx_time, idx_skus]
         
         if self.max_feature_dim is not None:
-            item = np.zeros((1,lag_window+1, self.max_feature_dim, num_skus))
+            item = np.zeros((1,lag_window+1, self.max_feature_dim, num_skus), dtype=get_default_dtype())
         else:
-            item = np.zeros((1,lag_window+1, self.num_features, num_skus))
+            item = np.zeros((1,lag_window+1, self.num_features, num_skus), dtype=get_default_dtype())
 
         if include_y:
             assert idx_time-1-lag_window >= 0
@@ -1135,7 +1446,7 @@ class MultiShapeLoader(BaseDataLoader):
         item[:,:,len_SKU_features:(len_SKU_features+len_time_features),:] = np.expand_dims(time_features, axis=0)
 
         extra_info = sum([self.include_non_available, include_y, self.provide_additional_target])
-        additional_info = np.empty((1,lag_window+1, extra_info, num_skus))
+        additional_info = np.empty((1,lag_window+1, extra_info, num_skus), dtype=item.dtype)
 
         current_index = 0
 
@@ -1201,7 +1512,10 @@ class MultiShapeLoader(BaseDataLoader):
     @property
     def len_train(self):
         if self.meta_learn_units:
-            return len(self.sku_time_index) # sku_time_index contains only timesteps that are in the training set and skus in the training set.
+            # the index contains only timesteps that are in the training set and skus in the training set.
+            if self.sku_time_index is None:
+                return len(self.train_SKUs_indices)*self.len_train_time
+            return len(self.sku_time_index)
         else:
             return self.len_train_time
 
@@ -1228,7 +1542,7 @@ class MultiShapeLoader(BaseDataLoader):
         Return either the train, val, test, or all data.
         """
 
-        print("mode of dataloader when getting item:", self.dataset_type)
+        logging.debug(f"mode of dataloader when getting item: {self.dataset_type}")
 
         if dataset_type == 'train':
 
@@ -1257,7 +1571,7 @@ class MultiShapeLoader(BaseDataLoader):
         Return either the train, val, test, or all data.
         """
 
-        print("mode of dataloader when getting item:", self.dataset_type)
+        logging.debug(f"mode of dataloader when getting item: {self.dataset_type}")
         if dataset_type == 'train':
             return self.demand[self.train_index_start:self.val_index_start, self.train_SKUs_indices]
         elif dataset_type == 'val':
@@ -1271,20 +1585,15 @@ class MultiShapeLoader(BaseDataLoader):
 
     @staticmethod
     def is_one_hot(column):
-        return set(column.unique()) <= {0, 1}
+        return bool(one_hot_columns(np.asarray(column, dtype=float).reshape(-1, 1))[0])
 
     @staticmethod
     def is_one_hot_across_skus(feature_df):
         """
-        Check if the set of unique values in a feature across all SKU_ids is {0, 1}.
+        Check if all values of a feature across all SKU_ids are in {0, 1}.
         feature_df: DataFrame slice for a specific feature with SKU_ids as columns.
         """
-        flattened_values = feature_df.values.flatten()
-        
-        # Check if the unique values in this flattened array are exactly {0, 1}
-        unique_values = set(flattened_values)
-        
-        return unique_values <= {0, 1}
+        return bool(np.all(one_hot_columns(feature_df.to_numpy())))
 
     @staticmethod
     def save_indices(df):
@@ -1306,3 +1615,90 @@ class MultiShapeLoader(BaseDataLoader):
         """
 
         self.return_SKU_type = sku_type
+
+# %% ../../nbs/10_dataloaders/12_tabular_dataloaders.ipynb 37
+class AvailabilitySampler():
+
+    """
+    Sampler for the training set of a ```MultiShapeLoader``` with ```meta_learn_units=True``` that only draws
+    informative (SKU, time) pairs. The valid index set is precomputed once from the availability mask and an
+    optional demand threshold. Samples can be drawn uniformly (a random permutation of all valid indices per epoch)
+    or weighted, either by recency (exponential decay with a given half-life) or such that each SKU is drawn
+    equally often. The sampler yields dataset indices and can be passed as ```sampler``` in the dataloader_params
+    of the agents (without ```shuffle```). It does not depend on torch.
+    """
+
+    def __init__(self,
+        dataloader: MultiShapeLoader, # dataloader with meta_learn_units=True
+        use_mask: bool = True, # if pairs where the SKU is not available according to the mask are skipped
+        min_demand: float | None = None, # if set, only pairs with (stored, possibly normalized) demand >= min_demand are drawn
+        weighting: Literal["uniform", "recency", "balanced_SKU"] = "uniform", # how valid pairs are weighted
+        recency_half_life: float | None = None, # half-life in timesteps for recency weighting
+        num_samples: int | None = None, # number of samples per epoch, defaults to the number of valid pairs
+        replacement: bool | None = None, # sample with replacement, defaults to True for weighted and False for uniform sampling
+        seed: int | None = None, # seed of the random number generator
+        ):
+
+        if not getattr(dataloader, "meta_learn_units", False):
+            raise ValueError('AvailabilitySampler requires a dataloader with meta_learn_units=True')
+        if weighting not in ["uniform", "recency", "balanced_SKU"]:
+            raise ValueError('weighting must be either "uniform", "recency", or "balanced_SKU"')
+        if weighting == "recency" and (recency_half_life is None or recency_half_life <= 0):
+            raise ValueError('recency weighting requires a positive recency_half_life')
+
+        self.weighting = weighting
+        self.replacement = replacement if replacement is not None else weighting != "uniform"
+        self.rng = np.random.default_rng(seed)
+
+        sku_positions, time_positions, dataset_indices = self.decode_training_index(dataloader)
+        time_indices = time_positions + dataloader.train_index_start
+        sku_indices = np.asarray(dataloader.train_SKUs_indices)[sku_positions]
+
+        valid = np.ones(len(dataset_indices), dtype=bool)
+        if use_mask and dataloader.mask is not None:
+            valid &= dataloader.mask[time_indices, sku_indices] > 0
+        if min_demand is not None:
+            valid &= dataloader.demand[time_indices, sku_indices] >= min_demand
+
+        self.indices = dataset_indices[valid]
+        if len(self.indices) == 0:
+            raise ValueError('No valid (SKU, time) pairs to sample from')
+        sku_positions, time_positions = sku_positions[valid], time_positions[valid]
+
+        if weighting == "uniform":
+            self.weights = None
+        elif weighting == "recency":
+            age = dataloader.len_train_time - 1 - time_positions
+            self.weights = 0.5 ** (age / recency_half_life)
+        else:
+            counts = np.bincount(sku_positions)
+            self.weights = 1 / counts[sku_positions]
+        if self.weights is not None:
+            self.weights = self.weights / self.weights.sum()
+
+        self.num_samples = num_samples if num_samples is not None else len(self.indices)
+        if not self.replacement and self.num_samples > len(self.indices):
+            raise ValueError('num_samples must not exceed the number of valid pairs when sampling without replacement')
+
+    @staticmethod
+    def decode_training_index(dataloader: MultiShapeLoader):
+
+        """ Return SKU positions, time positions and dataset indices of all training samples of the dataloader """
+
+        if dataloader.sku_time_index is None:
+            flat_index = np.arange(dataloader.len_train)
+        else:
+            flat_index = np.asarray(dataloader.sku_time_index)
+        sku_positions, time_positions = np.divmod(flat_index, dataloader.len_train_time)
+        dataset_indices = np.arange(len(flat_index), dtype=flat_index.dtype)
+        return sku_positions, time_positions, dataset_indices
+
+    def __iter__(self):
+        if self.weights is None and not self.replacement:
+            selection = self.rng.permutation(len(self.indices))[:self.num_samples]
+        else:
+            selection = self.rng.choice(len(self.indices), size=self.num_samples, replace=self.replacement, p=self.weights)
+        return iter(self.indices[selection].tolist())
+
+    def __len__(self):
+        return self.num_samples
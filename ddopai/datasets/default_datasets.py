@@ -3,20 +3,36 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/90_datasets/default_datasets.ipynb.
 
 # %% auto 0
-__all__ = ['get_all_release_tags', 'get_release_tag', 'get_dataset_url', 'get_asset_url', 'download_file_from_github',
-           'unzip_file', 'load_data_from_directory', 'DatasetLoader']
+__all__ = ['MANIFEST_FILE', 'get_all_release_tags', 'get_release_tag', 'get_dataset_url', 'get_asset_url', 'download_file',
+           'download_file_from_github', 'unzip_file', 'load_data_from_directory', 'sha256sum', 'fetch_file',
+           'read_mirror_manifest', 'DatasetRegistry', 'add_to_mirror', 'DatasetLoader']
 
 # %% ../../nbs/90_datasets/default_datasets.ipynb 3
 import numpy as np
 import logging
-import requests
 import os
 import re
 import pandas as pd
 import zipfile
-
-
-# %% ../../nbs/90_datasets/default_datasets.ipynb 6
+import importlib.util
+import hashlib
+import json
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import urllib.parse
+import urllib.request
+from typing import Literal, List
+
+from ..utils import LazyModule, get_default_dtype
+
+# %% ../../nbs/90_datasets/default_datasets.ipynb 4
+requests = LazyModule("requests") # only imported when a dataset is downloaded
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None # optional, for multithreaded csv parsing
+
+# %% ../../nbs/90_datasets/default_datasets.ipynb 7
 def get_all_release_tags(token=None):
     url = "https://api.github.com/repos/d3group/ddopai/releases"
     headers = {'Authorization': f'Bearer {token}'} if token else {}
@@ -72,52 +88,323 @@ def get_asset_url(dataset_type, dataset_number, version="latest", token=None):
     asset_url = get_dataset_url(dataset_type, dataset_number, release_tag, token)
     return asset_url
 
+def download_file(url: str, # http(s) URL of the file
+                  output_path: str, # where to store the file
+                  token: str | None = None, # GitHub token
+                  expected_sha256: str | None = None, # if set, the download is validated against this checksum
+                  chunk_size: int = 1 << 20, # bytes written at once
+                  max_retries: int = 3, # retries on connection errors and incomplete transfers
+                  backoff: float = 1.0, # seconds to wait before the first retry, doubled for every further retry
+                  timeout: float = 60, # seconds without response before a retry
+                  ) -> None:
+
+    """
+    Download a file in large buffered chunks into ```{output_path}.part```. Interrupted transfers are
+    resumed with an HTTP Range request, also across calls. The partial file is only renamed to
+    ```output_path``` once it is complete and, if given, matches the expected checksum.
+    """
+
+    partial_path = f"{output_path}.part"
+    auth_headers = {'Authorization': f'Bearer {token}'} if token else {}
+
+    for attempt in range(max_retries+1):
+        resume_from = os.path.getsize(partial_path) if os.path.exists(partial_path) else 0
+        headers = dict(auth_headers, **({"Range": f"bytes={resume_from}-"} if resume_from > 0 else {}))
+        try:
+            with requests.get(url, headers=headers, stream=True, timeout=timeout) as response:
+                if response.status_code == 416: # requested range not satisfiable: the partial file is already complete
+                    break
+                if response.status_code not in [200, 206]:
+                    raise ValueError(f"Failed to download file {url}: {response.status_code}")
+                if response.status_code == 200:
+                    resume_from = 0 # server ignored the range request, start over
+                content_length = response.headers.get("Content-Length")
+                expected_size = resume_from + int(content_length) if content_length is not None else None
+
+                with open(partial_path, "ab" if resume_from > 0 else "wb") as file:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        file.write(chunk)
+
+            if expected_size is not None and os.path.getsize(partial_path) < expected_size:
+                raise requests.exceptions.ConnectionError(f"Incomplete download of {url}")
+            break
+
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+            if attempt == max_retries:
+                raise
+            logging.warning(f"Download of {url} interrupted ({e}), retrying ({attempt+1}/{max_retries})")
+            time.sleep(backoff * 2**attempt)
+
+    if expected_sha256 is not None:
+        sha256 = sha256sum(partial_path)
+        if sha256 != expected_sha256:
+            os.remove(partial_path)
+            raise ValueError(f"Checksum mismatch for {url}: expected {expected_sha256}, got {sha256}")
+
+    os.replace(partial_path, output_path)
+    logging.debug(f"File downloaded successfully: {output_path}")
+
 def download_file_from_github(url, output_path, token=None):
-    headers = {'Authorization': f'Bearer {token}'} if token else {}
-    response = requests.get(url, headers=headers, stream=True)
-    if response.status_code == 200:
-        with open(output_path, 'wb') as file:
-            for chunk in response.iter_content(chunk_size=1024):
-                if chunk:
-                    file.write(chunk)
-        logging.debug(f"File downloaded successfully: {output_path}")
-    else:
-        logging.error(f"Failed to download file: {response.status_code}")
+    download_file(url, output_path, token=token)
 
 def unzip_file(zip_file_path, output_dir, delete_zip_file=True):
-    with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
-        zip_ref.extractall(output_dir)
-
-    # check if the output directory contains "__MACOSX" directory and remove it
-    macosx_dir = os.path.join(output_dir, "__MACOSX")
-    if os.path.exists(macosx_dir):
-        for file in os.listdir(macosx_dir):
-            file_path = os.path.join(macosx_dir, file)
-            if os.path.isfile(file_path):
-                os.remove(file_path)
-        os.rmdir(macosx_dir)
+
+    """
+    Extract an archive into a temporary directory next to output_dir and rename it to output_dir once
+    the extraction is complete, such that output_dir never holds a partially extracted dataset.
+    """
+
+    parent_dir = os.path.dirname(os.path.abspath(output_dir))
+    os.makedirs(parent_dir, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix=".extract_", dir=parent_dir)
+    try:
+        with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
+            zip_ref.extractall(tmp_dir)
+
+        # remove the "__MACOSX" directory if the archive contains one
+        shutil.rmtree(os.path.join(tmp_dir, "__MACOSX"), ignore_errors=True)
+
+        if os.path.exists(output_dir):
+            # directories cannot be replaced directly, move the old one away first
+            old_dir = tempfile.mkdtemp(prefix=".old_", dir=parent_dir)
+            os.replace(output_dir, os.path.join(old_dir, "dataset"))
+            os.replace(tmp_dir, output_dir)
+            shutil.rmtree(old_dir)
+        else:
+            os.replace(tmp_dir, output_dir)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
 
     if delete_zip_file:
         os.remove(zip_file_path)
 
-def load_data_from_directory(dir):
+def _file_dtype(dtype, key):
+    """ Select the dtype schema of a file: a dict keyed by file names holds one schema per file """
+    if isinstance(dtype, dict) and key in dtype:
+        return dtype[key]
+    if isinstance(dtype, dict) and any(isinstance(value, dict) for value in dtype.values()):
+        return None # schema only given for other files
+    return dtype
+
+def _to_numpy(df: pd.DataFrame):
+    """ Convert a DataFrame to a numpy array in the default dtype, as expected by the dataloaders """
+    return df.to_numpy(dtype=get_default_dtype())
+
+def _read_csv(path, dtype=None, chunksize=None, as_numpy=False, engine="pandas"):
+
+    """ Read a csv file with an optional explicit dtype schema, either in chunks or with the multithreaded pyarrow reader """
+
+    if engine == "pyarrow":
+        if not PYARROW_AVAILABLE:
+            raise ImportError("engine='pyarrow' requires pyarrow to be installed")
+        import pyarrow.csv
+        convert_options = None
+        if dtype is not None:
+            import pyarrow as pa
+            if isinstance(dtype, dict):
+                column_types = {column: pa.from_numpy_dtype(np.dtype(column_dtype)) for column, column_dtype in dtype.items()}
+                convert_options = pyarrow.csv.ConvertOptions(column_types=column_types)
+            else:
+                # one dtype for all columns, pyarrow needs the column names for that
+                columns = pd.read_csv(path, nrows=0).columns
+                convert_options = pyarrow.csv.ConvertOptions(column_types={column: pa.from_numpy_dtype(np.dtype(dtype)) for column in columns})
+        table = pyarrow.csv.read_csv(path, read_options=pyarrow.csv.ReadOptions(use_threads=True), convert_options=convert_options)
+        df = table.to_pandas()
+        return _to_numpy(df) if as_numpy else df
+
+    elif engine == "pandas":
+        if chunksize is None:
+            df = pd.read_csv(path, dtype=dtype)
+            return _to_numpy(df) if as_numpy else df
+        # each chunk is converted directly, so at most one chunk is held as DataFrame
+        chunks = [_to_numpy(chunk) if as_numpy else chunk for chunk in pd.read_csv(path, dtype=dtype, chunksize=chunksize)]
+        return np.concatenate(chunks, axis=0) if as_numpy else pd.concat(chunks)
+
+    else:
+        raise ValueError(f"engine must be either 'pandas' or 'pyarrow', got {engine}")
+
+def load_data_from_directory(dir,
+        dtype: str | type | dict | None = None, # dtype schema for csv files: one dtype for all columns, a dict column -> dtype, or a dict file name (without extension) -> dtype/dict. If None, types are inferred
+        chunksize: int | None = None, # if set, csv files are parsed in chunks of chunksize rows
+        as_numpy: bool = False, # if tabular files (csv, pkl, parquet) are converted to numpy arrays in the default dtype, as expected by the XYDataLoader
+        engine: Literal["pandas", "pyarrow"] = "pandas", # csv parser, pyarrow parses multithreaded (requires pyarrow)
+        ) -> dict:
+
+    """
+    Load all files of a directory into a dict keyed by the file names (without extension). Supported are
+    csv, pkl, npy, parquet and npz files. The arrays of an npz archive are added under their own names.
+    """
+
     data = dict()
-    for file in os.listdir(dir):
-        if file.endswith(".csv"):
-            key = os.path.splitext(file)[0]
-            data[key] = pd.read_csv(os.path.join(dir, file))
-        elif file.endswith(".pkl"):
-            key = os.path.splitext(file)[0]
-            data[key] = pd.read_pickle(os.path.join(dir, file))
-        elif file.endswith(".npy"):
-            key = os.path.splitext(file)[0]
-            data[key] = np.load(os.path.join(dir, file))
+    for file in sorted(os.listdir(dir)):
+        key, extension = os.path.splitext(file)
+        path = os.path.join(dir, file)
+        if extension == ".csv":
+            data[key] = _read_csv(path, dtype=_file_dtype(dtype, key), chunksize=chunksize, as_numpy=as_numpy, engine=engine)
+        elif extension == ".pkl":
+            data[key] = pd.read_pickle(path)
+            if as_numpy and isinstance(data[key], pd.DataFrame):
+                data[key] = _to_numpy(data[key])
+        elif extension == ".parquet":
+            data[key] = pd.read_parquet(path) # requires pyarrow or fastparquet
+            if as_numpy:
+                data[key] = _to_numpy(data[key])
+        elif extension == ".npy":
+            data[key] = np.load(path)
+        elif extension == ".npz":
+            with np.load(path) as archive:
+                for name in archive.files:
+                    if name in data:
+                        raise ValueError(f"Array {name} in {file} clashes with another file of the same name")
+                    data[name] = archive[name]
         else:
-            raise ValueError(f"File {file} is not a valid file type (csv, pkl, or npy)")
+            raise ValueError(f"File {file} is not a valid file type (csv, pkl, npy, npz, or parquet)")
     
     return data
 
-# %% ../../nbs/90_datasets/default_datasets.ipynb 8
+# %% ../../nbs/90_datasets/default_datasets.ipynb 13
+MANIFEST_FILE = "manifest.json"
+
+def sha256sum(path: str, # path of the file
+              chunk_size: int = 1 << 20, # bytes read at once
+              ) -> str:
+
+    """ Compute the SHA-256 checksum of a file """
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _write_json_atomic(obj, path):
+    """ Write json to a temporary file first and rename it, such that readers never see a partial manifest """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as file:
+        json.dump(obj, file, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def _is_url(location: str) -> bool:
+    return urllib.parse.urlparse(location).scheme in ["http", "https"]
+
+def _local_path(location: str) -> str:
+    """ Convert a file:// URL to a path, other locations are returned unchanged """
+    parsed = urllib.parse.urlparse(location)
+    return urllib.request.url2pathname(parsed.path) if parsed.scheme == "file" else location
+
+def fetch_file(source: str, # http(s) URL, file:// URL or local path
+               output_path: str, # where to store the file
+               token: str | None = None, # GitHub token (only used for http(s) sources)
+               ) -> None:
+
+    """ Fetch a file from a remote or local source """
+
+    if _is_url(source):
+        download_file_from_github(source, output_path, token=token)
+    else:
+        shutil.copyfile(_local_path(source), output_path)
+
+def read_mirror_manifest(mirror: str, # local directory, file:// URL or http(s) URL of the mirror
+                         ) -> dict:
+
+    """ Read the manifest of a mirror """
+
+    location = f"{mirror.rstrip('/')}/{MANIFEST_FILE}"
+    if _is_url(mirror):
+        response = requests.get(location)
+        if response.status_code != 200:
+            raise ValueError(f"Failed to fetch mirror manifest {location}: {response.status_code}")
+        return response.json()
+    with open(_local_path(location)) as file:
+        return json.load(file)
+
+class DatasetRegistry():
+
+    """
+    Local registry of downloaded datasets, stored as ```manifest.json``` in the cache directory.
+    Entries are keyed by ```{dataset_type}/{dataset_number}/{version}```.
+    """
+
+    def __init__(self,
+                 cache_dir: str = "data", # directory in which datasets are stored
+                 ):
+
+        self.cache_dir = cache_dir
+        self.manifest_path = os.path.join(cache_dir, MANIFEST_FILE)
+        self._lock = threading.Lock() # datasets may be registered concurrently by DatasetLoader.load_datasets
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path) as file:
+                self.manifest = json.load(file)
+        else:
+            self.manifest = {"datasets": {}}
+
+    @staticmethod
+    def key(dataset_type: str, dataset_number: int, version: str = "latest") -> str:
+        return f"{dataset_type}/{dataset_number}/{version}"
+
+    def dataset_dir(self, dataset_type: str, dataset_number: int, version: str = "latest") -> str:
+
+        """ Directory of a dataset. The latest version keeps the path used before the registry existed """
+
+        name = f"{dataset_type}_dataset_{dataset_number}"
+        if version != "latest":
+            name = f"{name}_{version}"
+        return os.path.join(self.cache_dir, name)
+
+    def get(self, dataset_type: str, dataset_number: int, version: str = "latest") -> dict | None:
+
+        """ Return the entry of a dataset if it is registered and present in the cache directory """
+
+        entry = self.manifest["datasets"].get(self.key(dataset_type, dataset_number, version))
+        if entry is None or not os.path.isdir(os.path.join(self.cache_dir, entry["path"])):
+            return None
+        return entry
+
+    def register(self,
+                 dataset_type: str,
+                 dataset_number: int,
+                 version: str,
+                 path: str, # directory of the dataset
+                 sha256: str | None = None, # checksum of the downloaded archive
+                 release_tag: str | None = None, # resolved release tag
+                 source: str | None = None, # where the archive has been downloaded from
+                 ) -> dict:
+
+        """ Add or update an entry and write the manifest """
+
+        entry = dict(path=os.path.relpath(path, self.cache_dir), sha256=sha256, release_tag=release_tag, source=source)
+        with self._lock:
+            self.manifest["datasets"][self.key(dataset_type, dataset_number, version)] = entry
+            os.makedirs(self.cache_dir, exist_ok=True)
+            _write_json_atomic(self.manifest, self.manifest_path)
+        return entry
+
+def add_to_mirror(mirror_dir: str, # local directory of the mirror
+                  dataset_type: str,
+                  dataset_number: int,
+                  version: str, # version under which the dataset is served, e.g., "latest" or "v1.0"
+                  zip_path: str, # archive of the dataset
+                  release_tag: str | None = None, # release tag the archive belongs to
+                  ) -> dict:
+
+    """ Copy a dataset archive into a mirror directory and add it with its checksum to the mirror manifest """
+
+    os.makedirs(mirror_dir, exist_ok=True)
+    manifest_path = os.path.join(mirror_dir, MANIFEST_FILE)
+    manifest = {"datasets": {}}
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as file:
+            manifest = json.load(file)
+
+    file_name = f"{dataset_type}_dataset_{dataset_number}_{version}.zip"
+    shutil.copyfile(zip_path, os.path.join(mirror_dir, file_name))
+    entry = dict(file=file_name, sha256=sha256sum(zip_path), release_tag=release_tag)
+    manifest["datasets"][DatasetRegistry.key(dataset_type, dataset_number, version)] = entry
+    _write_json_atomic(manifest, manifest_path)
+    return entry
+
+# %% ../../nbs/90_datasets/default_datasets.ipynb 17
 class DatasetLoader():
 
     """
@@ -135,8 +422,15 @@ class DatasetLoader():
         "bakery",
     ]
     
-    def __init__(self):
-        pass
+    def __init__(self,
+        cache_dir: str = "data", # directory in which datasets are stored together with the registry manifest
+        mirror: str | None = None, # local directory, file:// or http(s) URL of a mirror with a manifest.json. If set, the GitHub API is not used
+        offline: bool = False, # if True, only datasets in the registry are loaded and no network call is made
+        ):
+        self.cache_dir = cache_dir
+        self.mirror = mirror
+        self.offline = offline
+        self.registry = DatasetRegistry(cache_dir)
     
     def show_dataset_types(self,
             show_num_datasets_per_type=False # Whether to show the number of datasets per type
@@ -160,7 +454,11 @@ class DatasetLoader():
         dataset_number: int,
         overwrite: bool = False, # Whether to overwrite the dataset if it already exists
         version: str = "latest", # Which version of the dataset to load, "latest" or a specific version,
-        token: str = None # GitHub token to enable more requests (otherwise limited to 60 requests per hour)
+        token: str = None, # GitHub token to enable more requests (otherwise limited to 60 requests per hour)
+        dtype: str | type | dict | None = None, # dtype schema for csv files, see load_data_from_directory
+        chunksize: int | None = None, # if set, csv files are parsed in chunks of chunksize rows
+        as_numpy: bool = False, # if tabular files are converted to numpy arrays in the default dtype
+        engine: Literal["pandas", "pyarrow"] = "pandas", # csv parser, pyarrow parses multithreaded (requires pyarrow)
     ):
 
         """ Load a dataset from the GitHub repository."""
@@ -168,31 +466,60 @@ class DatasetLoader():
         if dataset_type not in self.dataset_types_univariate and dataset_type not in self.dataset_types_multivariate:
             raise ValueError(f"Dataset type {dataset_type} is not valid. Use the function show_dataset_types() to see valid dataset types.")
 
-        asset_url = get_asset_url(dataset_type, dataset_number, version=version, token=token)
-
-
-        # check if folder "data" exists, if not create it
-        if not os.path.exists("data"):
-            os.makedirs("data")
+        output_file_path = self.registry.dataset_dir(dataset_type, dataset_number, version)
 
-        output_file_path = f"data/{dataset_type}_dataset_{dataset_number}"
+        # Datasets in the registry (or downloaded before the registry existed) are loaded without any network call
+        entry = self.registry.get(dataset_type, dataset_number, version)
+        if entry is None and os.path.isdir(output_file_path):
+            entry = self.registry.register(dataset_type, dataset_number, version, output_file_path)
 
-        download = False
-        # check if the dataset has already been downloaded
-        if os.path.exists(output_file_path):
+        if entry is not None:
             logging.warning(f"Dataset {dataset_type}_dataset_{dataset_number} has already been downloaded.")
             if overwrite:
                 logging.warning("Overwriting dataset.")
-                download = True
             else:
                 logging.warning("Keeping existing dataset.")
+                return load_data_from_directory(os.path.join(self.cache_dir, entry["path"]), dtype=dtype, chunksize=chunksize, as_numpy=as_numpy, engine=engine)
+
+        if self.offline:
+            raise ValueError(f"Dataset {self.registry.key(dataset_type, dataset_number, version)} is not in the registry at {self.cache_dir} and offline is set.")
+
+        # Resolve the archive and its expected checksum
+        if self.mirror is not None:
+            mirror_entry = read_mirror_manifest(self.mirror)["datasets"].get(self.registry.key(dataset_type, dataset_number, version))
+            if mirror_entry is None:
+                raise ValueError(f"Dataset {self.registry.key(dataset_type, dataset_number, version)} is not available on the mirror {self.mirror}.")
+            source = f"{self.mirror.rstrip('/')}/{mirror_entry['file']}"
+            expected_sha256, release_tag = mirror_entry.get("sha256"), mirror_entry.get("release_tag")
         else:
-            download = True
+            release_tag = get_release_tag(dataset_type, version, token)
+            source = get_dataset_url(dataset_type, dataset_number, release_tag, token)
+            expected_sha256 = None
 
-        if download:
-            download_file_from_github(asset_url, output_file_path+".zip", token=token)
-            unzip_file(output_file_path+".zip", output_file_path)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fetch_file(source, output_file_path+".zip", token=token)
 
-        data = load_data_from_directory(output_file_path)
+        sha256 = sha256sum(output_file_path+".zip")
+        if expected_sha256 is not None and sha256 != expected_sha256:
+            os.remove(output_file_path+".zip")
+            raise ValueError(f"Checksum mismatch for {source}: expected {expected_sha256}, got {sha256}")
+
+        unzip_file(output_file_path+".zip", output_file_path)
+        self.registry.register(dataset_type, dataset_number, version, output_file_path, sha256=sha256, release_tag=release_tag, source=source)
+
+        data = load_data_from_directory(output_file_path, dtype=dtype, chunksize=chunksize, as_numpy=as_numpy, engine=engine)
 
         return data
+
+    def load_datasets(self,
+        dataset_type: str,
+        dataset_numbers: List[int], # dataset numbers to load
+        max_workers: int = 4, # number of datasets downloaded and extracted concurrently
+        **kwargs # further arguments of load_dataset
+    ) -> dict:
+
+        """ Load several datasets of one type concurrently with a thread pool. Returns a dict keyed by dataset number. """
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {dataset_number: executor.submit(self.load_dataset, dataset_type, dataset_number, **kwargs) for dataset_number in dataset_numbers}
+            return {dataset_number: future.result() for dataset_number, future in futures.items()}
@@ -11,10 +11,6 @@ from typing import Union, Optional
 import numpy as np
 from ..utils import Parameter, check_parameter_types
 
-import torch
-import torch.nn as nn
-import torch.nn.functional as F
-
 # %% ../../nbs/20_environments/10_actionprocessors.ipynb 4
 class ClipAction():
     """
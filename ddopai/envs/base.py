@@ -12,6 +12,7 @@ from typing import Union, List, Dict
 import numpy as np
 
 from ..utils import MDPInfo, Parameter, set_param
+from ..profiling import PROFILER
 import time
 
 # %% ../../nbs/20_environments/20_base_env/10_base_env.ipynb 5
@@ -88,7 +89,8 @@ class BaseEnvironment(gym.Env, ABC):
         for postprocessor in self.postprocessors:
             action = postprocessor(action)
 
-        observation, reward, terminated, truncated, info = self.step_(action)
+        with PROFILER.timer("env.step_"):
+            observation, reward, terminated, truncated, info = self.step_(action)
 
         return self.return_truncation_handler(observation, reward, terminated, truncated, info)
     
@@ -13,6 +13,7 @@ from ..base import BaseEnvironment
 from ...utils import Parameter, MDPInfo
 from ...dataloaders.base import BaseDataLoader
 from ...loss_functions import pinball_loss
+from ...profiling import PROFILER
 
 import gymnasium as gym
 
@@ -108,7 +109,8 @@ class BaseInventoryEnv(BaseEnvironment):
 
         """
 
-        X_item, Y_item = self.dataloader[self.index]
+        with PROFILER.timer("env.dataloader.__getitem__"):
+            X_item, Y_item = self.dataloader[self.index]
 
         return X_item, Y_item
     
@@ -9,15 +9,16 @@ __all__ = ['MultiPeriodEnv']
 from abc import ABC, abstractmethod
 from typing import Union, Tuple
 
-from ...utils import Parameter, MDPInfo, check_parameter_types
+from ...utils import Parameter, MDPInfo, check_parameter_types, get_default_dtype
 from ...dataloaders.base import BaseDataLoader
 from .base import BaseInventoryEnv
 from .inventory_utils import OrderPipeline
+from ...profiling import PROFILER
 
 import gymnasium as gym
 
 import numpy as np
-import time
+import logging
 
 # %% ../../../nbs/20_environments/21_envs_inventory/30_multi_period_envs.ipynb 4
 class MultiPeriodEnv(BaseInventoryEnv, ABC):
@@ -129,7 +130,7 @@ class MultiPeriodEnv(BaseInventoryEnv, ABC):
 
         terminated = False # in this problem there is no termination condition
         
-        info = {}
+        info = {"index": self.index} # index of the observation the action was taken on (used, e.g., by the IndexReplayMemory)
         if self.step_info_verbosity > 1:
             info["demand"] = self.demand.copy()
             info["action"] = action.copy()
@@ -156,11 +157,9 @@ class MultiPeriodEnv(BaseInventoryEnv, ABC):
 
             observation, self.demand = self.get_observation()
 
-            if self.print:
-                print("next_period:", self.index+1)
-                print("next observation:", observation)
-                print("next demand:", self.demand)
-                time.sleep(3)
+            logging.debug("next_period: %s", self.index+1)
+            logging.debug("next observation: %s", observation)
+            logging.debug("next demand: %s", self.demand)
 
             return observation, reward, terminated, truncated, info
         
@@ -172,12 +171,14 @@ class MultiPeriodEnv(BaseInventoryEnv, ABC):
 
         """
         
-        X_item, Y_item = self.dataloader[self.index]
+        with PROFILER.timer("env.dataloader.__getitem__"):
+            X_item, Y_item = self.dataloader[self.index]
 
+        # the inventory state is kept in full precision, the observation is served in the default dtype (as a copy of the state)
         observation = {
             "features": X_item,
-            "order_pipeline": self.order_pipeline.get_pipeline(),
-            "inventory:": self.inventory,
+            "order_pipeline": np.asarray(self.order_pipeline.get_pipeline(), dtype=get_default_dtype()),
+            "inventory:": np.array(self.inventory, dtype=get_default_dtype()),
         }
 
         return observation, Y_item
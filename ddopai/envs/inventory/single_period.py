@@ -9,15 +9,17 @@ __all__ = ['NewsvendorEnv', 'NewsvendorEnvVariableSL']
 from abc import ABC, abstractmethod
 from typing import Union, Tuple, Literal
 
-from ...utils import Parameter, MDPInfo
+from ...utils import Parameter, MDPInfo, get_default_dtype
 from ...dataloaders.base import BaseDataLoader
 from ...loss_functions import pinball_loss, quantile_loss
+from ...fast_loss_functions import pinball_loss_batch, quantile_loss_batch
 from .base import BaseInventoryEnv
+from ...profiling import PROFILER
 
 import gymnasium as gym
 
 import numpy as np
-import time
+import logging
 
 # %% ../../../nbs/20_environments/21_envs_inventory/20_single_period_envs.ipynb 4
 class NewsvendorEnv(BaseInventoryEnv, ABC):
@@ -93,7 +95,8 @@ class NewsvendorEnv(BaseInventoryEnv, ABC):
         info = dict(
             demand=self.demand.copy(),
             action=action.copy(),
-            cost_per_SKU=cost_per_SKU.copy()
+            cost_per_SKU=cost_per_SKU.copy(),
+            index=self.index # index of the observation the action was taken on (used, e.g., by the IndexReplayMemory)
         )
 
         # Set index will set the index and return True if the index is out of bounds
@@ -112,11 +115,9 @@ class NewsvendorEnv(BaseInventoryEnv, ABC):
 
             observation, self.demand = self.get_observation()
 
-            if self.print:
-                print("next_period:", self.index+1)
-                print("next observation:", observation)
-                print("next demand:", self.demand)
-                time.sleep(3)
+            logging.debug("next_period: %s", self.index+1)
+            logging.debug("next observation: %s", observation)
+            logging.debug("next demand: %s", self.demand)
 
             return observation, reward, terminated, truncated, info
 
@@ -127,6 +128,17 @@ class NewsvendorEnv(BaseInventoryEnv, ABC):
         # Compute the cost per SKU
         return pinball_loss(self.demand, action, self.underage_cost, self.overage_cost)
 
+    def determine_cost_batch(self,
+                demand: np.ndarray, # demand of shape (T, n_SKUs)
+                action: np.ndarray # actions of shape (T, n_SKUs)
+                ) -> np.ndarray:
+        """
+        Determine the cost per period and SKU for a full val or test episode at once. Since
+        the observations of the Newsvendor problem do not depend on previous actions, an episode
+        can be evaluated in a single call without stepping through the environment.
+        """
+        return pinball_loss_batch(demand, action, self.underage_cost, self.overage_cost)
+
     def update_cu_co(self, cu=None, co=None):
         # Check if the underage_cost and overage_cost are already set
         if not hasattr(self, "underage_cost") or not hasattr(self, "overage_cost"):
@@ -161,7 +173,7 @@ class NewsvendorEnv(BaseInventoryEnv, ABC):
             self.set_param("sl", sl, shape=(self.num_SKUs[0],))
 
 
-# %% ../../../nbs/20_environments/21_envs_inventory/20_single_period_envs.ipynb 17
+# %% ../../../nbs/20_environments/21_envs_inventory/20_single_period_envs.ipynb 18
 class NewsvendorEnvVariableSL(NewsvendorEnv, ABC):
     def __init__(self,
 
@@ -235,6 +247,20 @@ class NewsvendorEnvVariableSL(NewsvendorEnv, ABC):
             elif self.evaluation_metric == "quantile_loss":
                 return quantile_loss(self.demand, action, self.sl)
 
+    def determine_cost_batch(self,
+                demand: np.ndarray, # demand of shape (T, n_SKUs)
+                action: np.ndarray # actions of shape (T, n_SKUs)
+                ) -> np.ndarray: #
+        """
+        Determine the cost per period and SKU for a full val or test episode at once, using the
+        evaluation metric and the fixed service level of val and test mode.
+        """
+
+        if self.evaluation_metric == "pinball_loss":
+            return pinball_loss_batch(demand, action, self.underage_cost, self.overage_cost)
+        elif self.evaluation_metric == "quantile_loss":
+            return quantile_loss_batch(demand, action, self.sl)
+
     def set_observation_space(self,
                             shape: tuple, # shape of the dataloader features
                             low: Union[np.ndarray, float] = -np.inf, # lower bound of the observation space
@@ -296,36 +322,19 @@ class NewsvendorEnvVariableSL(NewsvendorEnv, ABC):
         is only an x,y pair. For more complex observations, this function should be overwritten.
         """
 
-        # print("env mode:", self.mode)
-        # print("dataloader mode:", self.dataloader.dataset_type)
-
-        X_item, Y_item = self.dataloader[self.index]
+        with PROFILER.timer("env.dataloader.__getitem__"):
+            X_item, Y_item = self.dataloader[self.index]
 
-        # check if any value in X_item is nan.
+        # check if any value in X_item or Y_item is nan or inf.
 
         if np.isnan(X_item).any():
-            print("X_item is nan")
-            # print index
-            print("total index:", self.index)
-            print("first nan encountered:", np.argwhere(np.isnan(X_item))[0])
+            logging.warning(f"X_item is nan at total index {self.index}, first nan encountered: {np.argwhere(np.isnan(X_item))[0]}")
         
         if np.isnan(Y_item).any():
-            print("Y_item is nan")
-            # print index
-            print("total index:", self.index)
-            print("first nan encountered:", np.argwhere(np.isnan(Y_item))[0])
-
-        # check if any value in X_item is inf.
+            logging.warning(f"Y_item is nan at total index {self.index}, first nan encountered: {np.argwhere(np.isnan(Y_item))[0]}")
 
         if np.isinf(X_item).any():
-            print("X_item is inf")
-            # print index
-            print("total index:", self.index)
-            print("first inf encountered:", np.argwhere(np.isinf(X_item))[0])
-
-            print(X_item)
-
-            raise ValueError("X_item contains inf values.")
+            raise ValueError(f"X_item contains inf values at total index {self.index}, first inf encountered: {np.argwhere(np.isinf(X_item))[0]}")
 
         if self.mode == "train":
             sl = self.draw_parameter(self.sl_distribution, self.sl_bound_low, self.sl_bound_high, samples = self.num_SKUs[0])
@@ -342,7 +351,7 @@ class NewsvendorEnvVariableSL(NewsvendorEnv, ABC):
         # print("demand in get observation:", Y_item.shape)
         # print("sl in get observation:", sl.shape)
 
-        return {"features": X_item, "service_level": sl}, Y_item
+        return {"features": X_item, "service_level": sl.astype(get_default_dtype())}, Y_item # served in the default dtype of the features
 
     def check_evaluation_metric(self): #
         if self.evaluation_metric not in ["pinball_loss", "quantile_loss"]:
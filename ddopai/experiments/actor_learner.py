@@ -0,0 +1,293 @@
+"""Multi-process sample collection for off-policy agents that are trained via environment interaction."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/40_experiments/11_actor_learner.ipynb.
+
+# %% auto 0
+__all__ = ['ActorLearnerCore']
+
+# %% ../../nbs/40_experiments/11_actor_learner.ipynb 3
+import logging
+import multiprocessing as mp
+import queue
+import time
+from collections import deque
+from typing import Literal, List
+
+import numpy as np
+import torch
+
+from ..envs.base import BaseEnvironment
+from ..agents.base import BaseAgent
+
+from mushroom_rl.core import Core
+
+# %% ../../nbs/40_experiments/11_actor_learner.ipynb 5
+class _StopActor(Exception):
+    """ Raised inside an actor process to leave the MushroomRL Core loop """
+    pass
+
+class _ActorAgent():
+
+    """
+    Agent used inside the actor processes. Actions are drawn by the local copy of the agent, while the
+    collected transitions are sent to the learner instead of fitting the agent. The policy weights are
+    copied from shared memory whenever the learner has published a new version.
+    """
+
+    def __init__(self,
+                    agent: BaseAgent, # local copy of the agent
+                    transition_queue: mp.Queue,
+                    shared_weights: mp.Array, # policy weights published by the learner
+                    weights_version: mp.Value, # incremented by the learner with each publication
+                    weights_lock: mp.Lock,
+                    stop_event: mp.Event,
+                    ):
+
+        self.agent = agent
+        self.transition_queue = transition_queue
+        self.shared_weights = shared_weights
+        self.weights_version = weights_version
+        self.weights_lock = weights_lock
+        self.stop_event = stop_event
+
+        self.local_version = -1
+        self.next_action = None
+
+    @property
+    def preprocessors(self):
+        return self.agent.preprocessors
+
+    def draw_action(self, state):
+        return self.agent.draw_action(state)
+
+    def episode_start(self):
+        self.agent.episode_start()
+
+    def stop(self):
+        pass
+
+    def sync_weights(self):
+
+        """ Copy the policy weights from shared memory if the learner published a new version """
+
+        if self.weights_version.value != self.local_version:
+            with self.weights_lock:
+                weights = np.frombuffer(self.shared_weights, dtype=np.float64).copy()
+                self.local_version = self.weights_version.value
+            self.agent.agent.policy.set_weights(weights)
+
+    def fit(self, dataset, **dataset_info):
+
+        """ Send the transitions to the learner and update the local policy """
+
+        while True:
+            if self.stop_event.is_set():
+                raise _StopActor()
+            try:
+                self.transition_queue.put((dataset, dict(dataset_info)), timeout=0.1)
+                break
+            except queue.Full:
+                continue
+
+        self.sync_weights()
+
+def _run_actor(agent: BaseAgent, # copy of the agent
+                env: BaseEnvironment, # copy of the environment
+                transition_queue: mp.Queue,
+                shared_weights: mp.Array,
+                weights_version: mp.Value,
+                weights_lock: mp.Lock,
+                stop_event: mp.Event,
+                batch_size: int, # number of steps sent to the learner at once
+                seed: int, # seed of the actor
+                ):
+
+    """ Entry point of the actor processes: collect transitions until the stop event is set """
+
+    np.random.seed(seed)
+    torch.manual_seed(seed)
+    torch.set_num_threads(1) # the cores are used by the actors, not by intra-op parallelism
+
+    agent.train()
+    env.train()
+    env.set_return_truncation(False) # For mushroom Core to work, the step function should not return the truncation flag
+
+    actor_agent = _ActorAgent(agent, transition_queue, shared_weights, weights_version, weights_lock, stop_event)
+    actor_agent.sync_weights()
+
+    core = Core(actor_agent, env)
+
+    try:
+        while not stop_event.is_set():
+            core.learn(n_steps=10_000*batch_size, n_steps_per_fit=batch_size, quiet=True)
+    except _StopActor:
+        pass
+
+# %% ../../nbs/40_experiments/11_actor_learner.ipynb 7
+class ActorLearnerCore():
+
+    """
+    Replacement of the MushroomRL ```Core``` for off-policy agents with a replay memory (e.g., SAC, TD3) that
+    splits sample collection and training. ```n_actors``` worker processes each own a copy of the environment
+    and of the agent and stream the collected transitions through a queue to the learner, which adds them to the
+    replay memory and updates the networks. Each actor sends ```batch_size``` transitions per queue put, which the
+    learner splits into fits of ```n_steps_per_fit``` transitions, such that the fits are the same as with the
+    MushroomRL ```Core``` while the queue overhead is paid once per batch. The policy weights are published to the
+    actors via shared memory every ```sync_freq``` fits and copied by the actors at most once per batch. With the "fork" start method, the dataloader of the environment is shared
+    copy-on-write by all processes instead of being copied.
+
+    The actors are started at the first call of ```learn``` and keep collecting transitions with the latest
+    published policy (also while the learner evaluates the agent) until ```close``` is called.
+    """
+
+    def __init__(self,
+                    agent: BaseAgent, # off-policy MushroomRL based agent
+                    env: BaseEnvironment,
+                    n_actors: int = 2, # number of actor processes
+                    sync_freq: int = 10, # number of fits after which the policy weights are published to the actors
+                    batch_size: int = 32, # number of transitions an actor sends at once, rounded up to a multiple of n_steps_per_fit
+                    queue_size: int = 64, # maximum number of transition batches waiting in the queue
+                    start_method: Literal["fork", "spawn", "forkserver"] = "fork", # start method of the actor processes
+                    seed: int = 0, # actor i is seeded with seed + i
+                    ):
+
+        if n_actors < 1:
+            raise ValueError("n_actors must be at least 1")
+        if sync_freq < 1:
+            raise ValueError("sync_freq must be at least 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if not hasattr(getattr(agent, "agent", None), "_replay_memory"):
+            raise ValueError("ActorLearnerCore requires an off-policy MushroomRL agent with a replay memory (e.g., SAC or TD3)")
+
+        self.agent = agent
+        self.env = env
+        self.n_actors = n_actors
+        self.sync_freq = sync_freq
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.seed = seed
+
+        self.context = mp.get_context(start_method)
+
+        self.actors = []
+        self.n_steps_per_fit = None
+        self.n_fits = 0
+        self._pending = deque() # fits of received batches that did not fit into the previous call of learn
+
+    def start(self,
+                n_steps_per_fit: int, # number of steps the actors send to the learner at once
+                ):
+
+        """ Publish the current policy weights and start the actor processes """
+
+        weights = self.agent.agent.policy.get_weights()
+
+        self.shared_weights = self.context.RawArray("d", len(weights))
+        self.weights_version = self.context.RawValue("l", 0)
+        self.weights_lock = self.context.Lock()
+        self.stop_event = self.context.Event()
+        self.transition_queue = self.context.Queue(maxsize=self.queue_size)
+
+        self.publish_weights()
+
+        self.n_steps_per_fit = n_steps_per_fit
+        batch_size = -(-self.batch_size // n_steps_per_fit) * n_steps_per_fit # whole fits per batch
+
+        for i in range(self.n_actors):
+            process = self.context.Process(
+                target=_run_actor,
+                args=(self.agent, self.env, self.transition_queue, self.shared_weights, self.weights_version,
+                      self.weights_lock, self.stop_event, batch_size, self.seed + i),
+                daemon=True,
+            )
+            process.start()
+            self.actors.append(process)
+
+        logging.info(f"Started {self.n_actors} actor processes")
+
+    def publish_weights(self):
+
+        """ Write the current policy weights to shared memory """
+
+        weights = self.agent.agent.policy.get_weights()
+
+        with self.weights_lock:
+            np.frombuffer(self.shared_weights, dtype=np.float64)[:] = weights
+            self.weights_version.value += 1
+
+    def get_transitions(self):
+
+        """ Get the next batch of transitions from the queue, raising an error if an actor died """
+
+        while True:
+            try:
+                return self.transition_queue.get(timeout=1.)
+            except queue.Empty:
+                for i, process in enumerate(self.actors):
+                    if not process.is_alive():
+                        raise RuntimeError(f"Actor {i} terminated unexpectedly with exit code {process.exitcode}")
+
+    def learn(self,
+                n_steps: int, # number of transitions to fit the agent on
+                n_steps_per_fit: int = 1, # number of transitions per fit
+                quiet: bool = True, # only for compatibility with the MushroomRL Core
+                ):
+
+        """
+        Fit the agent on ```n_steps``` transitions collected by the actors, using the same arguments as
+        ```Core.learn```.
+        """
+
+        if not self.actors:
+            self.start(n_steps_per_fit)
+        elif n_steps_per_fit != self.n_steps_per_fit:
+            raise ValueError("n_steps_per_fit cannot be changed while the actors are running")
+
+        n_fitted = 0
+
+        while n_fitted < n_steps:
+            if not self._pending:
+                dataset, dataset_info = self.get_transitions()
+                for start in range(0, len(dataset), n_steps_per_fit):
+                    self._pending.append((dataset[start:start+n_steps_per_fit],
+                                          {key: value[start:start+n_steps_per_fit] for key, value in dataset_info.items()}))
+            dataset, dataset_info = self._pending.popleft()
+            self.agent.fit(dataset, **dataset_info)
+            n_fitted += len(dataset)
+
+            self.n_fits += 1
+            if self.n_fits % self.sync_freq == 0:
+                self.publish_weights()
+
+    def close(self,
+                timeout: float = 10., # seconds to wait for the actors before terminating them
+                ):
+
+        """ Stop the actor processes """
+
+        if not self.actors:
+            return
+
+        self.stop_event.set()
+
+        deadline = time.time() + timeout
+        while any(process.is_alive() for process in self.actors) and time.time() < deadline:
+            # actors only exit once the transitions they put into the queue have been consumed
+            try:
+                while True:
+                    self.transition_queue.get_nowait()
+            except queue.Empty:
+                pass
+            for process in self.actors:
+                process.join(timeout=0.05)
+
+        for i, process in enumerate(self.actors):
+            if process.is_alive():
+                logging.warning(f"Actor {i} did not stop within {timeout} seconds and is terminated")
+                process.terminate()
+                process.join()
+
+        self.transition_queue.close()
+        self.actors = []
+        self._pending.clear()
@@ -0,0 +1,257 @@
+"""Rolling-origin backtests of direct-fit agents on a single dataloader, with the origins evaluated in parallel processes."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/40_experiments/22_backtesting.ipynb.
+
+# %% auto 0
+__all__ = ['rolling_origins', 'split_view', 'run_backtest']
+
+# %% ../../nbs/40_experiments/22_backtesting.ipynb 3
+import copy
+import inspect
+import logging
+import multiprocessing as mp
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Literal, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..dataloaders.tabular import XYDataLoader
+from ..fast_loss_functions import pinball_loss_batch, quantile_loss_batch
+from .sweeps import share_data, load_shared_data, limit_threads, _thread_env_variables
+
+# %% ../../nbs/40_experiments/22_backtesting.ipynb 5
+def rolling_origins(
+        n_datapoints: int, # length of the dataset, e.g., len(dataloader)
+        initial_train_size: int, # number of training datapoints at the first origin
+        horizon: int, # number of test datapoints after each origin
+        step: int | None = None, # distance between two origins, defaults to horizon (non-overlapping test windows)
+        n_origins: int | None = None, # if set, only the latest n_origins origins are kept
+        window: Literal["expanding", "sliding"] = "expanding", # expanding: training always starts at 0, sliding: training keeps initial_train_size datapoints
+        ) -> np.ndarray: # array of shape (n_origins, 3) with train_start, test_start and test_end (exclusive) per origin
+
+    """
+    Create the origins (cutoffs) of a rolling-origin backtest. At each origin, the agent is trained on
+    the datapoints in [train_start, test_start) and evaluated on the datapoints in [test_start, test_end).
+    """
+
+    if initial_train_size < 1 or horizon < 1:
+        raise ValueError("initial_train_size and horizon must be at least 1")
+    step = horizon if step is None else step
+    if step < 1:
+        raise ValueError("step must be at least 1")
+    if window not in ["expanding", "sliding"]:
+        raise ValueError("window must be 'expanding' or 'sliding'")
+
+    test_starts = np.arange(initial_train_size, n_datapoints-horizon+1, step)
+    if n_origins is not None:
+        if n_origins < 1:
+            raise ValueError("n_origins must be at least 1")
+        test_starts = test_starts[-n_origins:]
+    if len(test_starts) == 0:
+        raise ValueError(f"No origin fits into {n_datapoints} datapoints with initial_train_size={initial_train_size} and horizon={horizon}")
+
+    train_starts = np.zeros_like(test_starts) if window == "expanding" else test_starts-initial_train_size
+
+    return np.stack([train_starts, test_starts, test_starts+horizon], axis=1)
+
+# %% ../../nbs/40_experiments/22_backtesting.ipynb 9
+def split_view(
+        dataloader: XYDataLoader, # dataloader holding the full, already pre-processed dataset
+        train_start: int, # first training datapoint
+        test_start: int, # first test datapoint (the origin), training ends right before
+        test_end: int, # end of the test window (exclusive)
+        ) -> XYDataLoader:
+
+    """
+    Create a dataloader for one origin that shares the arrays of ```dataloader``` (basic slices, no copy).
+    Normalization and lag features are taken over as they are, such that the dataloader is neither rebuilt
+    nor renormalized for each origin. The view has no validation set, its training set is [train_start, test_start)
+    and its test set [test_start, test_end) of the original dataloader.
+    """
+
+    if not 0 <= train_start < test_start < test_end <= len(dataloader):
+        raise ValueError(f"Invalid split ({train_start}, {test_start}, {test_end}) for a dataloader of length {len(dataloader)}")
+
+    view = copy.copy(dataloader)
+    view.__dict__.pop("_row_buffers", None) # appending to the view must not affect the buffers of the original dataloader
+
+    view.X = dataloader.X[train_start:test_end]
+    view.Y = dataloader.Y[train_start:test_end]
+    view.train_index_end = test_start-train_start-1
+    view.val_index_start = test_start-train_start
+    view.test_index_start = test_start-train_start
+    view.dataset_type = "train"
+
+    return view
+
+# %% ../../nbs/40_experiments/22_backtesting.ipynb 14
+def _fit_agent(agent, # agent with a fit(X, Y) method
+               X: np.ndarray,
+               Y: np.ndarray,
+               warm_start: bool, # if the agent shall continue from its previous fit
+               ) -> bool: # whether the agent has been warm-started
+
+    """ Fit an agent, continuing from its previous fit if requested and supported by the agent's fit method """
+
+    warm_start = warm_start and getattr(agent, "fitted", False) and "warm_start" in inspect.signature(agent.fit).parameters
+    if warm_start:
+        agent.fit(X, Y, warm_start=True)
+    else:
+        agent.fit(X, Y)
+    return warm_start
+
+def _predict(agent, # fitted agent
+             X: np.ndarray, # features of the test window
+             shape: Tuple, # shape of the targets of the test window
+             ) -> np.ndarray:
+
+    """ Predict a full test window with one batched call. Constant predictions (e.g., of SAA) are broadcasted to the shape of the targets """
+
+    Y_pred = np.asarray(agent.draw_action_batch(X), dtype=float)
+    if Y_pred.ndim == 1 and len(Y_pred) == shape[0] and shape[1] == 1:
+        Y_pred = Y_pred.reshape(-1, 1)
+    return np.broadcast_to(Y_pred, shape)
+
+def _run_origins(
+        agent_factory: Callable,
+        origins: List[Tuple[int, int, int, int]], # (origin, train_start, test_start, test_end), evaluated in this order
+        dataloader: XYDataLoader, # full dataloader, or a copy without X and Y if data_paths is given
+        data_paths: Tuple | None, # paths of the shared X and Y
+        underage_cost: float | np.ndarray,
+        overage_cost: float | np.ndarray,
+        warm_start: bool,
+        threads_per_worker: int | None,
+        ) -> List[Dict]:
+
+    """ Evaluate a sequence of origins (in a worker process) and return one row of the results table per origin """
+
+    if threads_per_worker is not None:
+        limit_threads(threads_per_worker)
+
+    if data_paths is not None:
+        dataloader.X, dataloader.Y = load_shared_data(data_paths)
+
+    quantile = np.divide(underage_cost, np.add(underage_cost, overage_cost))
+
+    rows = []
+    agent = None
+    for origin, train_start, test_start, test_end in origins:
+
+        row = {"origin": origin, "train_start": train_start, "test_start": test_start, "test_end": test_end}
+        start = time.perf_counter()
+
+        try:
+            view = split_view(dataloader, train_start, test_start, test_end)
+            X_train, Y_train = view.X[:view.len_train], view.Y[:view.len_train]
+            X_test, Y_test = view.X[view.test_index_start:], view.Y[view.test_index_start:]
+
+            if agent is None or not warm_start:
+                agent = agent_factory()
+            agent.train()
+            row["warm_started"] = _fit_agent(agent, X_train, Y_train, warm_start)
+            row["fit_time"] = time.perf_counter()-start
+
+            agent.eval()
+            Y_pred = _predict(agent, X_test, Y_test.shape)
+
+            pinball_cost = pinball_loss_batch(Y_test, Y_pred, underage_cost, overage_cost)
+            row["pinball_cost"] = float(pinball_cost.sum())
+            row["mean_pinball_cost"] = float(pinball_cost.mean())
+            row["quantile_loss"] = float(quantile_loss_batch(Y_test, Y_pred, quantile).mean())
+            row["status"] = "finished"
+            row["error"] = None
+        except Exception as e:
+            logging.warning(f"Origin {origin} failed: {e!r}")
+            row["status"] = "failed"
+            row["error"] = repr(e)
+            agent = None # a failed fit is not continued at the next origin
+
+        row["duration"] = time.perf_counter()-start
+        rows.append(row)
+
+    return rows
+
+def run_backtest(
+        agent_factory: Callable, # called without arguments to create an agent with a fit(X, Y) method, e.g., functools.partial(NewsvendorSAAagent, mdp_info, cu=1., co=1.)
+        dataloader: XYDataLoader, # pre-processed dataset, shared by all origins
+        origins: np.ndarray, # origins as returned by rolling_origins
+        underage_cost: float | np.ndarray = 1., # underage cost of the pinball cost, scalar or one per SKU
+        overage_cost: float | np.ndarray = 1., # overage cost of the pinball cost, scalar or one per SKU
+        warm_start: bool = False, # if agents whose fit method accepts warm_start (e.g., XGB) continue from their fit at the previous origin
+        n_workers: int | None = None, # number of parallel processes, None: number of CPUs // threads_per_worker, 0: run in the calling process
+        threads_per_worker: int = 1, # BLAS/OpenMP/torch threads per worker
+        data_dir: str | None = None, # directory for the shared data, defaults to a temporary directory
+        start_method: Literal["fork", "spawn", "forkserver"] = "fork", # start method of the worker processes
+        results_path: str | None = None, # if given, the results table is also written to this csv file
+        ) -> pd.DataFrame:
+
+    """
+    Run a rolling-origin backtest. At each origin, an agent is fitted on the training window and predicts the
+    full test window in one batched call, which is scored with the pinball cost (underage and overage cost) and the
+    quantile loss (at the quantile cu/(cu+co)). The dataloader is pre-processed once: its arrays are written once with
+    ```share_data``` and every origin works on zero-copy views of the memory-mapped data (see ```split_view```).
+
+    The origins are evaluated in a process pool. Without warm starts, every origin is a separate task. With warm starts,
+    the origins are split into one contiguous block per worker and each worker refits its agent from one origin to the
+    next, which applies to agents whose fit method accepts ```warm_start``` (e.g., ```NewsvendorXGBAgent```). Other agents
+    (e.g., SAA or wSAA) are refitted from scratch at each origin. Note that warm-started XGB agents add trees at every
+    origin, so their ensemble grows linearly with the number of origins per worker; ```warm_start_estimators``` of the
+    agent limits the number of trees added per origin.
+
+    The results table contains one row per origin with the split, the fit time, the total and mean pinball cost, the mean
+    quantile loss, the status and the duration. A failing origin does not stop the backtest but is marked as failed.
+    The agent factory must be picklable (e.g., a ```functools.partial``` of an agent class or a module-level function).
+    """
+
+    origins = np.asarray(origins, dtype=int).reshape(-1, 3)
+
+    if n_workers is None:
+        n_workers = max(1, (os.cpu_count() or 1) // threads_per_worker)
+
+    origin_ids = np.arange(len(origins))
+    if warm_start:
+        blocks = [ids for ids in np.array_split(origin_ids, max(1, min(n_workers, len(origins)))) if len(ids) > 0]
+    else:
+        blocks = [[i] for i in origin_ids]
+    tasks = [[(int(i), *(int(index) for index in origins[i])) for i in block] for block in blocks]
+
+    rows = []
+    if n_workers == 0:
+        for task in tasks:
+            rows.extend(_run_origins(agent_factory, task, dataloader, None, underage_cost, overage_cost, warm_start, None))
+
+    else:
+        # the workers receive the dataloader without its arrays, which they memory-map instead
+        template = copy.copy(dataloader)
+        template.__dict__.pop("_row_buffers", None)
+        template.X, template.Y = None, None
+
+        tmp_dir = None
+        if data_dir is None:
+            tmp_dir = tempfile.TemporaryDirectory()
+            data_dir = tmp_dir.name
+
+        try:
+            data_paths = share_data((dataloader.X, dataloader.Y), data_dir)
+            logging.info(f"Running a backtest with {len(origins)} origins on {n_workers} workers and {threads_per_worker} threads per worker")
+
+            with _thread_env_variables(threads_per_worker):
+                with ProcessPoolExecutor(max_workers=n_workers, mp_context=mp.get_context(start_method)) as executor:
+                    futures = [executor.submit(_run_origins, agent_factory, task, template, data_paths, underage_cost, overage_cost, warm_start, threads_per_worker)
+                               for task in tasks]
+                    for future in as_completed(futures):
+                        rows.extend(future.result())
+        finally:
+            if tmp_dir is not None:
+                tmp_dir.cleanup()
+
+    results = pd.DataFrame(rows).sort_values("origin").reset_index(drop=True)
+
+    if results_path is not None:
+        results.to_csv(results_path, index=False)
+
+    return results
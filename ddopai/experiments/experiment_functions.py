@@ -3,8 +3,8 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/40_experiments/10_experiment_functions.ipynb.
 
 # %% auto 0
-__all__ = ['EarlyStoppingHandler', 'calculate_score', 'log_info', 'update_best', 'save_agent', 'test_agent', 'run_test_episode',
-           'run_experiment']
+__all__ = ['EarlyStoppingHandler', 'calculate_score', 'log_info', 'update_best', 'save_agent', 'EvaluationCache', 'log_profiling',
+           'test_agent', 'run_test_episode', 'run_experiment']
 
 # %% ../../nbs/40_experiments/10_experiment_functions.ipynb 3
 from abc import ABC, abstractmethod
@@ -12,20 +12,28 @@ from typing import Union, List, Tuple, Dict, Literal
 import logging
 from datetime import datetime  
 import numpy as np
+import os
 import sys
-import wandb
+import gymnasium as gym
 
 from ..envs.base import BaseEnvironment
+from ..envs.actionprocessors import ClipAction, RoundAction
 from ..agents.base import BaseAgent
+from ..agents.obsprocessors import FlattenTimeDimNumpy
+from ..checkpointing import CheckpointWriter
+from ..profiling import PROFILER
+from ..utils import LazyModule
 
 import importlib
 
 from tqdm import tqdm, trange
 
-# Think about how to handle mushroom integration.
-from mushroom_rl.core import Core
-
 # %% ../../nbs/40_experiments/10_experiment_functions.ipynb 4
+# wandb is only needed when tracking is enabled and Mushroom (imported in run_experiment) only for
+# env_interaction agents, such that e.g. evaluation workers of SAA agents do not import them
+wandb = LazyModule("wandb")
+
+# %% ../../nbs/40_experiments/10_experiment_functions.ipynb 5
 class EarlyStoppingHandler():
 
     '''
@@ -35,22 +43,98 @@ class EarlyStoppingHandler():
     typically one epoch is one pass through the training data. For reinforcement learning, in between each evaluation
     epoch there may be less than one, one, or many episodes played in the training environment.
 
+    Only the last 2 * patience scores are kept in a ring buffer together with the running sums of both windows,
+    such that memory and the cost per call are constant, independent of the number of epochs.
+
+    Alternatively to the window comparison, mode "best" stops if the best score has not improved for "patience"
+    epochs. In both modes, an improvement must be larger than "min_delta" and the scores can be exponentially
+    smoothed before they are compared. If an EarlyStoppingHandler is passed to run_experiment, the best agent is
+    saved whenever the handler counts a result as improvement ("improved"), i.e., according to its criteria,
+    direction, min_delta and smoothing. If "restore_best_weights" is set, run_experiment loads this agent (of
+    "best_epoch") at the end of training.
+
     '''
     def __init__(
         self,
         patience: int = 50, # Number of epochs to evaluate for stopping
         warmup: int = 100, # How many initial epochs to wait before evaluating
         criteria: str = "J",  # Whether to use discounted rewards J or total rewards R as criteria
-        direction: str = "max"  # Whether reward shall be maximized or minimized
+        direction: str = "max",  # Whether reward shall be maximized or minimized
+        mode: Literal["window", "best"] = "window", # "window": compare the means of the last two windows, "best": stop if there was no new best for patience epochs
+        min_delta: float = 0., # Minimum improvement of the window mean or of the best score to count as improvement
+        smoothing: float | None = None, # If given, weight of the newest score for exponential smoothing of the scores (between 0 and 1)
+        restore_best_weights: bool = False, # Whether run_experiment shall load the best saved agent at the end of training
     ):
 
-        self.history = list()
+        if criteria not in ["J", "R"]:
+            raise ValueError("Criteria must be J or R")
+        if direction not in ["max", "min"]:
+            raise ValueError("Direction must be max or min")
+        if mode not in ["window", "best"]:
+            raise ValueError("Mode must be window or best")
+        if smoothing is not None and not 0 < smoothing <= 1:
+            raise ValueError("Smoothing must be between 0 (exclusive) and 1")
+
         self.patience = patience
         if warmup is None or warmup < patience * 2:
             warmup = patience * 2
         self.warmup = warmup
         self.criteria = criteria
         self.direction = direction
+        self.mode = mode
+        self.min_delta = min_delta
+        self.smoothing = smoothing
+        self.restore_best_weights = restore_best_weights
+
+        self.reset()
+
+    def reset(self):
+
+        """ Reset the handler, e.g., to reuse it for another run """
+
+        self._buffer = np.zeros(self.patience * 2) # scores of the last 2 * patience epochs, sign flipped for direction "min"
+        self._sum_old = 0.
+        self._sum_recent = 0.
+        self._smoothed = None
+
+        self.n_results = 0
+        self.best_score = None
+        self.best_epoch = None
+        self.improved = False # whether the last result was a new best
+
+    @property
+    def history(self) -> np.ndarray:
+
+        """ The (smoothed) scores of the last 2 * patience epochs, oldest first """
+
+        n = min(self.n_results, self.patience * 2)
+        values = self._buffer[np.arange(self.n_results - n, self.n_results) % max(self.patience * 2, 1)]
+        return values if self.direction == "max" else -values
+
+    def _update_windows(self, score: float):
+
+        """ Add a score to the ring buffer and update the running sums of both windows """
+
+        if self.patience == 0:
+            self._sum_recent += score # the recent window covers the whole history in this case
+            return
+
+        size = self.patience * 2
+        position = self.n_results % size
+
+        if self.n_results >= self.patience: # the oldest score of the recent window moves to the old window
+            moving = self._buffer[(self.n_results - self.patience) % size]
+            self._sum_recent -= moving
+            self._sum_old += moving
+        if self.n_results >= size: # the oldest score of the old window is dropped
+            self._sum_old -= self._buffer[position]
+
+        self._buffer[position] = score
+        self._sum_recent += score
+
+        if position == size - 1: # recompute once per cycle (amortized constant) to avoid accumulating rounding errors
+            self._sum_old = self._buffer[:self.patience].sum()
+            self._sum_recent = self._buffer[self.patience:].sum()
 
     def add_result(self,
                     J: float, # Return (discounted rewards) of the last epoch
@@ -61,28 +145,33 @@ class EarlyStoppingHandler():
         Add the result of the last epoch to the history and check if the experiment should be stopped.
 
         """
-        if self.criteria == "J":
-            self.history.append(J)
-        elif self.criteria == "R":
-            self.history.append(R)
+
+        score = float(J if self.criteria == "J" else R)
+
+        if self.smoothing is not None and self._smoothed is not None:
+            score = self.smoothing * score + (1 - self.smoothing) * self._smoothed
+        self._smoothed = score
+
+        signed_score = score if self.direction == "max" else -score # internally, the score is always maximized
+
+        self.improved = self.best_score is None or signed_score > self._signed_best + self.min_delta
+        if self.improved:
+            self.best_score = score
+            self._signed_best = signed_score
+            self.best_epoch = self.n_results + 1
+
+        self._update_windows(signed_score)
+        self.n_results += 1
+
+        if self.n_results < self.warmup:
+            return False
+
+        if self.mode == "window":
+            return bool(self._sum_recent - self._sum_old <= self.min_delta * self.patience)
         else:
-            raise ValueError("Criteria must be J or R")
-        
-        if len(self.history) >= self.warmup:
-            if self.direction == "max":
-                if sum(self.history[-self.patience*2:-self.patience]) >= sum(self.history[-self.patience:]):
-                    return True
-                else:
-                    return False
-            elif self.direction == "min":
-                if sum(self.history[-self.patience*2:-self.patience]) <= sum(self.history[-self.patience:]):
-                    return True
-                else:
-                    return False
-            else:
-                raise ValueError("Direction must be max or min")
+            return self.n_results - self.best_epoch >= self.patience
 
-# %% ../../nbs/40_experiments/10_experiment_functions.ipynb 8
+# %% ../../nbs/40_experiments/10_experiment_functions.ipynb 11
 def calculate_score(
                     dataset: List,
                     env: BaseEnvironment, # Any environment inheriting from BaseEnvironment
@@ -144,6 +233,8 @@ def save_agent(agent: BaseAgent, # Any agent inheriting from BaseAgent
                 best_J: float,
                 criteria: str = "J",
                 force_save = False,
+                checkpoint_writer: CheckpointWriter | None = None, # If given, the agent is saved via the writer instead of synchronously
+                improved: bool | None = None, # If given (e.g., by an EarlyStoppingHandler), decides whether the agent is the new best instead of criteria
                 ):
 
     """
@@ -153,22 +244,128 @@ def save_agent(agent: BaseAgent, # Any agent inheriting from BaseAgent
     """
 
     if save_best:
-        if criteria == "R":
-            if R == best_R:
-                save_dir = f"{experiment_dir}/saved_models/best"
-                agent.save(save_dir)
-            elif force_save:
-                save_dir = f"{experiment_dir}/saved_models/best"
-                agent.save(save_dir)
-        elif criteria == "J":
-            if J == best_J:
-                save_dir = f"{experiment_dir}/saved_models/best"
-                agent.save(save_dir)
-            elif force_save:
-                save_dir = f"{experiment_dir}/saved_models/best"
-                agent.save(save_dir)
-
-# %% ../../nbs/40_experiments/10_experiment_functions.ipynb 10
+        if criteria not in ["J", "R"]:
+            raise ValueError("Criteria must be J or R")
+        if improved is None:
+            improved = R == best_R if criteria == "R" else J == best_J
+
+        if improved or force_save:
+            save_dir = f"{experiment_dir}/saved_models/best"
+            with PROFILER.timer("agent.save"):
+                if checkpoint_writer is not None:
+                    checkpoint_writer.submit(agent, save_dir)
+                else:
+                    agent.save(save_dir)
+
+# %% ../../nbs/40_experiments/10_experiment_functions.ipynb 12
+class EvaluationCache():
+
+    """
+    Cache of the observations and demands of a full val or test episode. For environments where the
+    observations do not depend on previous actions (such as the Newsvendor problem), the agent can then be
+    evaluated with a single batched call to ```agent.draw_action_batch``` and a vectorized cost function,
+    without switching the mode of the environment and stepping through the episode at each evaluation.
+    """
+
+    def __init__(self,
+                    env: BaseEnvironment, # Any environment providing a determine_cost_batch method
+                    mode: Literal["val", "test"] = "val", # dataset to be cached
+                    ):
+
+        if mode not in ["val", "test"]:
+            raise ValueError("mode must be 'val' or 'test'")
+        if not hasattr(env, "determine_cost_batch"):
+            raise ValueError("The environment does not support cached evaluation (no determine_cost_batch method).")
+
+        self.env = env
+        self.mode = mode
+
+        previous_mode = env.mode
+        getattr(env, mode)()
+
+        observations = []
+        demands = []
+
+        obs = env.reset()
+        action = np.zeros(env.action_space.shape, dtype=env.action_space.dtype) # observations do not depend on the action
+        truncated = False
+        while not truncated:
+            observations.append(obs)
+            obs, reward, terminated, truncated, info = env.step_(action)
+            demands.append(info["demand"])
+
+        getattr(env, previous_mode)()
+
+        if not all(isinstance(obs, np.ndarray) for obs in observations):
+            raise TypeError("Cached evaluation is only available for environments with array observations.")
+
+        self.observations = np.stack(observations) # (T, ...)
+        self.demand = np.stack(demands) # (T, n_SKUs)
+        self.discount = env.mdp_info.gamma ** np.arange(len(demands))
+
+    @staticmethod
+    def is_supported(agent: BaseAgent, # Any agent inheriting from BaseAgent
+                    env: BaseEnvironment, # Any environment inheriting from BaseEnvironment
+                    ) -> bool:
+
+        """
+        Check if the agent and environment can be evaluated via the cache. This requires an environment with
+        a vectorized cost function and array observations, an agent that receives observations without batch
+        dimension and only processors that operate on a full batch.
+        """
+
+        return (hasattr(env, "determine_cost_batch")
+                and isinstance(env.observation_space, gym.spaces.Box)
+                and not agent.receive_batch_dim
+                and all(isinstance(p, FlattenTimeDimNumpy) and p.batch_dim_included for p in agent.obsprocessors)
+                and all(isinstance(p, (ClipAction, RoundAction)) for p in env.postprocessors))
+
+    def test_agent(self,
+                    agent: BaseAgent, # Any agent inheriting from BaseAgent
+                    tracking: Union[str, None] = None, # other: "wandb"
+                    ) -> Tuple[float, float]:
+
+        """
+        Evaluate the agent on the cached episode and return the total rewards R and the discounted rewards J,
+        equivalent to ```test_agent``` on the environment in val or test mode.
+        """
+
+        actions = np.asarray(agent.draw_action_batch(self.observations))
+        if actions.size != self.demand.size:
+            raise ValueError(f"Expected {self.demand.shape} actions for the cached episode, but got shape {actions.shape}")
+        actions = actions.reshape(self.demand.shape)
+
+        for postprocessor in self.env.postprocessors:
+            actions = postprocessor(actions)
+
+        rewards = -self.env.determine_cost_batch(self.demand, actions).sum(axis=1)
+
+        R = float(rewards.sum())
+        J = float(self.discount @ rewards)
+
+        if tracking == "wandb":
+            wandb.log({f"{self.mode}/R": R, f"{self.mode}/J": J})
+
+        return R, J
+
+# %% ../../nbs/40_experiments/10_experiment_functions.ipynb 16
+def log_profiling(experiment_dir: str, # Directory to write profiling.json to
+                    tracking: Union[str, None] = None, # other: "wandb"
+                    ):
+
+    """
+    Write the summary of the timings recorded by ```PROFILER``` to profiling.json in the
+    experiment directory, log it and, if a tracking tool is used, log it to the tracking tool.
+    """
+
+    os.makedirs(experiment_dir, exist_ok=True)
+    PROFILER.to_json(f"{experiment_dir}/profiling.json")
+    PROFILER.log_summary()
+
+    if tracking == "wandb":
+        wandb.log(PROFILER.flat_summary())
+
+# %% ../../nbs/40_experiments/10_experiment_functions.ipynb 19
 def test_agent(agent: BaseAgent,
             env: BaseEnvironment,
             return_dataset = False,
@@ -278,6 +475,16 @@ def run_experiment( agent: BaseAgent,
                     eval_step_info = False,
 
                     return_score = False,
+
+                    checkpoint_mode: Literal["sync", "async", "memory"] = "sync", # "async" saves in a background thread, "memory" keeps the best agent in memory and saves it at the end
+
+                    cached_evaluation: bool = False, # evaluate epochs_fit and env_interaction agents via an EvaluationCache of the val set if agent and environment support it
+
+                    profiling: bool = False, # record per-stage timings, written to profiling.json in the experiment directory
+
+                    n_actors: int = 0, # number of actor processes collecting transitions for off-policy env_interaction agents (0: single process)
+                    actor_sync_freq: int = 10, # with actors: number of fits after which the policy weights are published to the actors
+                    actor_batch_size: int = 32, # with actors: number of transitions an actor sends to the learner at once
                 ):
 
     """
@@ -286,6 +493,13 @@ def run_experiment( agent: BaseAgent,
 
     """
 
+    if checkpoint_mode == "sync":
+        checkpoint_writer = None
+    elif checkpoint_mode in ["async", "memory"]:
+        checkpoint_writer = CheckpointWriter(mode=checkpoint_mode)
+    else:
+        raise ValueError("checkpoint_mode must be 'sync', 'async' or 'memory'")
+
     if return_score:
         R_list = []
         J_list = []
@@ -298,151 +512,209 @@ def run_experiment( agent: BaseAgent,
 
     print(f"Experiment directory: {experiment_dir}")
 
+    if profiling:
+        PROFILER.reset()
+        PROFILER.enable()
+
     logging.info("Starting experiment")
 
-    env.reset()
+    actor_learner_core = None
 
-    # initial evaluation
-    env.val()
-    agent.eval()
-    R, J = test_agent(agent, env, tracking = tracking)
+    try:
+        env.reset()
 
-    env.train()
-    agent.train()
+        # initial evaluation
+        env.val()
+        agent.eval()
+        R, J = test_agent(agent, env, tracking = tracking)
 
-    logging.info(f"Initial evaluation: R={R}, J={J}")
+        env.train()
+        agent.train()
 
-    best_J = J 
-    best_R = R
+        logging.info(f"Initial evaluation: R={R}, J={J}")
+
+        best_J = J 
+        best_R = R
 
-    if agent.train_mode == "direct_fit":
+        if agent.train_mode == "direct_fit":
         
-        logging.info("Starting training with direct fit")
-        agent.fit(X=env.dataloader.get_all_X("train"), Y=env.dataloader.get_all_Y("train"))
-        logging.info("Finished training with direct fit")
+            logging.info("Starting training with direct fit")
+            with PROFILER.timer("agent.fit"):
+                agent.fit(X=env.dataloader.get_all_X("train"), Y=env.dataloader.get_all_Y("train"))
+            logging.info("Finished training with direct fit")
 
-        env.val()
-        agent.eval()
+            env.val()
+            agent.eval()
 
-        R, J = test_agent(agent, env, tracking = tracking, eval_step_info=eval_step_info)
-        best_R, best_J = update_best(R, J, best_R, best_J)
+            with PROFILER.timer("evaluation"):
+                R, J = test_agent(agent, env, tracking = tracking, eval_step_info=eval_step_info)
+            best_R, best_J = update_best(R, J, best_R, best_J)
 
-        logging.info(f"Evaluation after training: R={R}, J={J}")
+            logging.info(f"Evaluation after training: R={R}, J={J}")
 
-        save_agent(agent, experiment_dir, save_best, R, J, best_R, best_J, performance_criterion, force_save = True) # save even if not best
+            save_agent(agent, experiment_dir, save_best, R, J, best_R, best_J, performance_criterion, force_save = True, checkpoint_writer = checkpoint_writer) # save even if not best
 
-        log_info(R, J, n_epochs-1, tracking, "val")
+            log_info(R, J, n_epochs-1, tracking, "val")
 
-        if return_score:
-            R_list.append(R)
-            J_list.append(J)
+            if return_score:
+                R_list.append(R)
+                J_list.append(J)
 
-    elif agent.train_mode == "epochs_fit":
+        elif agent.train_mode == "epochs_fit":
 
-        # save initial agent
-        save_dir = f"{experiment_dir}/saved_models/best"
-        agent.save(save_dir)
+            # save initial agent
+            save_agent(agent, experiment_dir, save_best, R, J, best_R, best_J, performance_criterion, force_save = True, checkpoint_writer = checkpoint_writer)
         
-        logging.info("Starting training with epochs fit")
-        for epoch in trange(n_epochs):
+            if cached_evaluation and EvaluationCache.is_supported(agent, env):
+                evaluation_cache = EvaluationCache(env, "val")
+            else:
+                evaluation_cache = None
+
+            logging.info("Starting training with epochs fit")
+            for epoch in trange(n_epochs):
             
-            agent.fit_epoch() # Access to dataloader provided to the agent at initialization
+                with PROFILER.timer("agent.fit_epoch"):
+                    agent.fit_epoch() # Access to dataloader provided to the agent at initialization
 
-            env.val()
-            agent.eval()
+                agent.eval()
 
-            R, J = test_agent(agent, env, tracking = tracking, eval_step_info=eval_step_info)
+                with PROFILER.timer("evaluation"):
+                    if evaluation_cache is not None:
+                        R, J = evaluation_cache.test_agent(agent, tracking = tracking) # environment stays in train mode
+                    else:
+                        env.val()
+                        R, J = test_agent(agent, env, tracking = tracking, eval_step_info=eval_step_info)
 
-            if return_score:
-                R_list.append(R)
-                J_list.append(J)
+                if return_score:
+                    R_list.append(R)
+                    J_list.append(J)
             
-            if ((epoch+1) % print_freq) == 0:
-                logging.info(f"Epoch {epoch+1}: R={R}, J={J}")
-            
-            best_R, best_J = update_best(R, J, best_R, best_J)
-            save_agent(agent, experiment_dir, save_best, R, J, best_R, best_J, performance_criterion)
+                if ((epoch+1) % print_freq) == 0:
+                    logging.info(f"Epoch {epoch+1}: R={R}, J={J}")
             
-            if early_stopping_handler is not None:
-                stop = early_stopping_handler.add_result(J, R)
-            else:
-                stop = False
+                best_R, best_J = update_best(R, J, best_R, best_J)
+
+                if early_stopping_handler is not None:
+                    stop = early_stopping_handler.add_result(J, R)
+                else:
+                    stop = False
 
-            if stop:
-                log_info(R, J, n_epochs-epoch-1, tracking, "val")
-                logging.info(f"Early stopping after {epoch+1} epochs")
-                break
+                # with a handler, the best agent is the one the handler considers best (direction, min_delta, smoothing)
+                improved = getattr(early_stopping_handler, "improved", None)
+                save_agent(agent, experiment_dir, save_best, R, J, best_R, best_J, performance_criterion, checkpoint_writer = checkpoint_writer, improved = improved)
+
+                if stop:
+                    log_info(R, J, n_epochs-epoch-1, tracking, "val")
+                    logging.info(f"Early stopping after {epoch+1} epochs")
+                    break
         
-            env.train()
-            agent.train()
+                if evaluation_cache is None:
+                    env.train()
+                agent.train()
 
-        logging.info("Finished training with epochs fit")
+            logging.info("Finished training with epochs fit")
 
-    elif agent.train_mode == "env_interaction":
+        elif agent.train_mode == "env_interaction":
 
-        # save initial agent
-        save_dir = f"{experiment_dir}/saved_models/best"
-        agent.save(save_dir)
+            # save initial agent
+            save_agent(agent, experiment_dir, save_best, R, J, best_R, best_J, performance_criterion, force_save = True, checkpoint_writer = checkpoint_writer)
 
-        logging.info("Starting training with env_interaction")
+            if cached_evaluation and EvaluationCache.is_supported(agent, env):
+                evaluation_cache = EvaluationCache(env, "val")
+            else:
+                evaluation_cache = None
 
-        core = Core(agent, env)
+            logging.info("Starting training with env_interaction")
 
-        agent.train()
-        env.train()
+            from mushroom_rl.core import Core
 
-        if hasattr(agent, "warmup_training_steps"):
-            warmup_training = True
-            warmup_training_steps = agent.warmup_training_steps
-        else:
-            warmup_training = False
+            core = Core(agent, env)
+
+            agent.train()
+            env.train()
+
+            if hasattr(agent, "warmup_training_steps"):
+                warmup_training = True
+                warmup_training_steps = agent.warmup_training_steps
+            else:
+                warmup_training = False
         
-        if hasattr(agent, "n_steps_per_fit"):
-            n_steps_per_fit = agent.n_steps_per_fit
-        else:
-            n_steps_per_fit = 1
+            if hasattr(agent, "n_steps_per_fit"):
+                n_steps_per_fit = agent.n_steps_per_fit
+            else:
+                n_steps_per_fit = 1
 
-        if warmup_training:
-            env.set_return_truncation(False) # For mushroom Core to work, the step function should not return the truncation flag
-            core.learn(n_steps=warmup_training_steps, n_steps_per_fit=warmup_training_steps, quiet=True)
+            if warmup_training:
+                env.set_return_truncation(False) # For mushroom Core to work, the step function should not return the truncation flag
+                core.learn(n_steps=warmup_training_steps, n_steps_per_fit=warmup_training_steps, quiet=True)
+
+            if n_actors > 0:
+                from ddopai.experiments.actor_learner import ActorLearnerCore
+                core = actor_learner_core = ActorLearnerCore(agent, env, n_actors=n_actors, sync_freq=actor_sync_freq, batch_size=actor_batch_size) # actors are started at the first call of learn
         
-        for epoch in trange(n_epochs):
+            for epoch in trange(n_epochs):
 
-            env.set_return_truncation(False) # For mushroom Core to work, the step function should not return the truncation flag
-            agent.train()
-            core.learn(n_steps=n_steps, n_steps_per_fit=n_steps_per_fit, quiet=True)
-            env.set_return_truncation(True) # Set back to standard gynmasium behavior
+                env.set_return_truncation(False) # For mushroom Core to work, the step function should not return the truncation flag
+                agent.train()
+                with PROFILER.timer("core.learn"):
+                    core.learn(n_steps=n_steps, n_steps_per_fit=n_steps_per_fit, quiet=True)
+                env.set_return_truncation(True) # Set back to standard gynmasium behavior
 
-            env.val()
-            agent.eval()
+                agent.eval()
 
-            R, J = test_agent(agent, env, tracking = tracking, eval_step_info=eval_step_info)
+                with PROFILER.timer("evaluation"):
+                    if evaluation_cache is not None:
+                        R, J = evaluation_cache.test_agent(agent, tracking = tracking) # environment stays in train mode, Core resets it at the start of learn
+                    else:
+                        env.val()
+                        R, J = test_agent(agent, env, tracking = tracking, eval_step_info=eval_step_info)
 
-            if return_score:
-                R_list.append(R)
-                J_list.append(J)
+                if return_score:
+                    R_list.append(R)
+                    J_list.append(J)
 
-            if ((epoch+1) % print_freq) == 0:
-                logging.info(f"Epoch {epoch+1}: R={R}, J={J}")
+                if ((epoch+1) % print_freq) == 0:
+                    logging.info(f"Epoch {epoch+1}: R={R}, J={J}")
             
-            best_R, best_J = update_best(R, J, best_R, best_J)
-            save_agent(agent, experiment_dir, save_best, R, J, best_R, best_J, performance_criterion)
+                best_R, best_J = update_best(R, J, best_R, best_J)
 
-            if early_stopping_handler is not None:
-                stop = early_stopping_handler.add_result(J, R)
-            else:
-                stop = False
+                if early_stopping_handler is not None:
+                    stop = early_stopping_handler.add_result(J, R)
+                else:
+                    stop = False
+
+                # with a handler, the best agent is the one the handler considers best (direction, min_delta, smoothing)
+                improved = getattr(early_stopping_handler, "improved", None)
+                save_agent(agent, experiment_dir, save_best, R, J, best_R, best_J, performance_criterion, checkpoint_writer = checkpoint_writer, improved = improved)
 
-            if stop:
-                log_info(R, J, n_epochs-epoch-1, tracking, "val")
-                logging.info(f"Early stopping after {epoch+1} epochs")
-                break
+                if stop:
+                    log_info(R, J, n_epochs-epoch-1, tracking, "val")
+                    logging.info(f"Early stopping after {epoch+1} epochs")
+                    break
         
-            env.train()
-            agent.train()
+                if evaluation_cache is None:
+                    env.train()
+                agent.train()
 
-    else:
-        raise ValueError("Unknown train mode")
+        else:
+            raise ValueError("Unknown train mode")
+    finally:
+        if actor_learner_core is not None:
+            actor_learner_core.close() # stop the actor processes, also if training fails
+        if checkpoint_writer is not None:
+            checkpoint_writer.close() # write the latest (best) checkpoint to disk, also if training fails
+        if profiling:
+            PROFILER.disable() # later timer calls in the process must not keep recording, also if training fails
+
+    if getattr(early_stopping_handler, "restore_best_weights", False):
+        if save_best:
+            agent.load(f"{experiment_dir}/saved_models/best")
+            logging.info(f"Restored the best agent of epoch {early_stopping_handler.best_epoch}")
+        else:
+            logging.warning("restore_best_weights requires save_best=True, keeping the agent of the last epoch")
+
+    if profiling:
+        log_profiling(experiment_dir, tracking)
 
     if return_score:
         return R_list, J_list
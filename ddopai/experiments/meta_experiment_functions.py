@@ -19,15 +19,13 @@ import os
 import yaml
 import pickle
 import warnings
-import torch
 
 from .tracking import get_git_hash, get_library_version
 from ..agents.class_names import AGENT_CLASSES
 from ..dataloaders.tabular import XYDataLoader
 from ..datasets.default_datasets import DatasetLoader
 from .experiment_functions import EarlyStoppingHandler, test_agent
-
-import wandb
+from ..utils import LazyModule
 
 import gc
 
@@ -35,10 +33,10 @@ import importlib
 
 from tqdm import tqdm, trange
 
-# Think about how to handle mushroom integration.
-from mushroom_rl.core import Core
+# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 4
+wandb = LazyModule("wandb") # only imported when an experiment is tracked
 
-# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 5
+# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 6
 def set_warnings (logging_level):
 
     """ Set warnings to be ignored for the given logging level or higher."""
@@ -48,7 +46,7 @@ def set_warnings (logging_level):
         warnings.filterwarnings("ignore", category=UserWarning, message=".*TypedStorage is deprecated.*")
         warnings.filterwarnings("ignore", category=FutureWarning, message=".*You are using `torch.load` with `weights_only=False`.*")
 
-# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 7
+# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 8
 def prep_experiment(
     project_name: str,
     libraries_to_track: List[str] = ["ddopai"],
@@ -77,7 +75,7 @@ def prep_experiment(
 
     return config_train, config_agent, config_env, AgentClass, agent_name
 
-# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 8
+# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 9
 def init_wandb(project_name: str): #
 
     """ init wandb """
@@ -87,7 +85,7 @@ def init_wandb(project_name: str): #
         name = f"{project_name}_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}"
     )
 
-# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 9
+# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 10
 def track_libraries_and_git(    libraries_to_track: List[str],
                                 tracking: bool = True,
                                 tracking_tool = "wandb", # Currenty only wandb is supported
@@ -104,7 +102,7 @@ def track_libraries_and_git(    libraries_to_track: List[str],
     git_hash = get_git_hash(".", tracking=tracking, tracking_tool=tracking_tool)
     logging.info(f"Git hash: {git_hash}")
 
-# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 10
+# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 11
 def import_config(  filename: str, # Name of the file, must be a yaml file
                     path: str = None # Optional path to the file if it is not in the current directory
                     ) -> Dict:
@@ -147,7 +145,7 @@ def import_config(  filename: str, # Name of the file, must be a yaml file
 
     return config
 
-# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 11
+# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 12
 def transfer_lag_window_to_env(config_env: Dict, #
                                 config_agent: Dict
                                 ) -> None:
@@ -183,7 +181,7 @@ def transfer_additional_target_to_env(config_env: Dict, #
             raise ValueError(f"Expected boolean value for provide_additional_target, got {config_agent['provide_additional_target']}")
         del config_agent["provide_additional_target"]
 
-# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 13
+# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 14
 def get_ddop_data(
     config_env: Dict,
     overwrite: bool = False
@@ -198,7 +196,7 @@ def get_ddop_data(
     return data, val_index_start, test_index_start
 
 
-# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 14
+# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 15
 def download_data(  config_env: Dict,
                     overwrite: bool = False #
                     ) -> Tuple:
@@ -216,7 +214,7 @@ def download_data(  config_env: Dict,
 
     return data_tuple
 
-# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 15
+# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 16
 def set_indices(config_env: Dict, #
                 X: np.ndarray 
 ) -> Tuple:
@@ -228,7 +226,7 @@ def set_indices(config_env: Dict, #
 
     return val_index_start, test_index_start
 
-# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 17
+# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 18
 def set_up_env(
     env_class,
     raw_data: Tuple, #
@@ -255,7 +253,7 @@ def set_up_env(
 
     return environment
 
-# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 19
+# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 20
 def set_up_earlystoppinghandler(config_train: Dict) -> object: #
 
     """ Set up the early stopping handler """
@@ -265,13 +263,21 @@ def set_up_earlystoppinghandler(config_train: Dict) -> object: #
         warmup = config_train["early_stopping_warmup"] if "early_stopping_warmup" in config_train else 0
         patience = config_train["early_stopping_patience"] if "early_stopping_patience" in config_train else 0
 
-        earlystoppinghandler = EarlyStoppingHandler(warmup=warmup, patience=patience)
+        optional_params = {
+            "mode": "early_stopping_mode",
+            "min_delta": "early_stopping_min_delta",
+            "smoothing": "early_stopping_smoothing",
+            "restore_best_weights": "early_stopping_restore_best_weights",
+        }
+        kwargs = {param: config_train[key] for param, key in optional_params.items() if key in config_train}
+
+        earlystoppinghandler = EarlyStoppingHandler(warmup=warmup, patience=patience, **kwargs)
     else:
         earlystoppinghandler = None
 
     return earlystoppinghandler
 
-# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 21
+# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 22
 def prep_and_run_test(
     agent,
     environment,
@@ -338,7 +344,7 @@ def prep_and_run_test(
 
 
 
-# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 23
+# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 24
 def clean_up(agent, environment):
 
     """ Clean up agent and environment to free up GPU memory """
@@ -350,15 +356,16 @@ def clean_up(agent, environment):
     # Force garbage collection
     gc.collect()
 
-    # Clear GPU cache
-    if torch.cuda.is_available():
+    # Clear GPU cache (only if torch has been imported by the agent)
+    torch = sys.modules.get("torch")
+    if torch is not None and torch.cuda.is_available():
         torch.cuda.empty_cache()
 
     wandb.finish()
 
     return None, None
 
-# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 25
+# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 26
 def select_agent(agent_name: str) -> type: #
     """ Select an agent class from a list of agent names and return the class"""
     if agent_name in AGENT_CLASSES:
@@ -368,7 +375,7 @@ def select_agent(agent_name: str) -> type: #
     else:
         raise ValueError(f"Unknown agent name: {agent_name}")
 
-# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 26
+# %% ../../nbs/40_experiments/20_meta_experiment_functions.ipynb 27
 def merge_with_namespace(target_dict, source_dict, target_dict_name):
     
     """
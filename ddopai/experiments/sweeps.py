@@ -0,0 +1,487 @@
+"""Local hyperparameter sweeps that run many trials in parallel on a single machine, without a remote sweep service."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/40_experiments/21_sweeps.ipynb.
+
+# %% auto 0
+__all__ = ['THREAD_ENV_VARIABLES', 'sample_configs', 'apply_params', 'share_data', 'load_shared_data', 'ASHAScheduler',
+           'ASHATrialHandler', 'limit_threads', 'run_sweep']
+
+# %% ../../nbs/40_experiments/21_sweeps.ipynb 3
+import copy
+import itertools
+import logging
+import multiprocessing as mp
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Literal, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..dataloaders.base import BaseDataLoader
+from .meta_experiment_functions import merge_with_namespace
+
+# %% ../../nbs/40_experiments/21_sweeps.ipynb 5
+def _grid_values(name: str, spec) -> List:
+
+    """ Values of one parameter for a grid search """
+
+    if isinstance(spec, dict):
+        if "values" in spec:
+            return list(spec["values"])
+        elif "value" in spec:
+            return [spec["value"]]
+        else:
+            raise ValueError(f"Parameter {name} must specify 'values' or 'value' for grid search, ranges can only be used with random search")
+    elif isinstance(spec, (list, tuple)):
+        return list(spec)
+    else:
+        return [spec]
+
+def _sample_value(name: str, spec, rng: np.random.Generator):
+
+    """ Sample one value of one parameter for a random search """
+
+    if isinstance(spec, dict) and ("min" in spec or "max" in spec):
+        low, high = spec["min"], spec["max"]
+        default_distribution = "int_uniform" if isinstance(low, int) and isinstance(high, int) else "uniform"
+        distribution = spec.get("distribution", default_distribution)
+        if distribution == "uniform":
+            return float(rng.uniform(low, high))
+        elif distribution == "log_uniform":
+            return float(np.exp(rng.uniform(np.log(low), np.log(high))))
+        elif distribution == "int_uniform":
+            return int(rng.integers(low, high + 1))
+        else:
+            raise ValueError(f"Unknown distribution {distribution} for parameter {name}")
+
+    values = _grid_values(name, spec)
+    return values[rng.integers(len(values))]
+
+def sample_configs(
+        search_space: Dict, # namespaced parameters, see above
+        method: Literal["grid", "random"] = "grid",
+        n_trials: int | None = None, # required for random search, optional upper limit for grid search
+        seed: int = 0, # seed of the random search
+        ) -> List[Dict]:
+
+    """
+    Create the parameters of all trials of a sweep. Each element of the returned list is a dict
+    with the namespaced keys of the search space and can be merged into the configs with ```apply_params```.
+    """
+
+    if method == "grid":
+        names = list(search_space.keys())
+        grids = [_grid_values(name, search_space[name]) for name in names]
+        configs = [dict(zip(names, values)) for values in itertools.product(*grids)]
+        if n_trials is not None:
+            configs = configs[:n_trials]
+
+    elif method == "random":
+        if n_trials is None:
+            raise ValueError("n_trials must be specified for random search")
+        rng = np.random.default_rng(seed)
+        configs = [{name: _sample_value(name, spec, rng) for name, spec in search_space.items()} for _ in range(n_trials)]
+
+    else:
+        raise ValueError("method must be 'grid' or 'random'")
+
+    return configs
+
+# %% ../../nbs/40_experiments/21_sweeps.ipynb 7
+def apply_params(
+        params: Dict, # namespaced parameters of one trial
+        config_train: Dict,
+        config_agent: Dict,
+        config_env: Dict,
+        ) -> Tuple[Dict, Dict, Dict]:
+
+    """
+    Merge the parameters of one trial into copies of the configs via ```merge_with_namespace```.
+    The original configs are not modified.
+    """
+
+    for key in params:
+        if key.split("-")[0] not in ["train", "agent", "env"]:
+            raise ValueError(f"Parameter {key} must start with 'train-', 'agent-' or 'env-'")
+
+    config_train = merge_with_namespace(copy.deepcopy(config_train), params, "train")
+    config_agent = merge_with_namespace(copy.deepcopy(config_agent), params, "agent")
+    config_env = merge_with_namespace(copy.deepcopy(config_env), params, "env")
+
+    return config_train, config_agent, config_env
+
+# %% ../../nbs/40_experiments/21_sweeps.ipynb 11
+def share_data(
+        raw_data: Tuple, # arrays of the dataset, e.g., (X, Y); None entries are kept
+        directory: str, # directory to write the arrays to
+        ) -> Tuple:
+
+    """
+    Write the arrays of a dataset as .npy files such that all trials can memory-map the same data
+    instead of loading or downloading it again. Returns the paths to be passed to ```load_shared_data```.
+    """
+
+    os.makedirs(directory, exist_ok=True)
+
+    paths = []
+    for i, array in enumerate(raw_data):
+        if array is None:
+            paths.append(None)
+            continue
+        array = np.asarray(array)
+        if array.dtype == object:
+            raise ValueError(f"Element {i} of raw_data has dtype object and cannot be memory-mapped")
+        path = os.path.join(directory, f"data_{i}.npy")
+        np.save(path, array)
+        paths.append(path)
+
+    return tuple(paths)
+
+def load_shared_data(paths: Tuple) -> Tuple: # paths returned by share_data
+
+    """ Memory-map the arrays written by ```share_data``` (read-only) """
+
+    return tuple(None if path is None else np.load(path, mmap_mode="r") for path in paths)
+
+def _dataloader_template(dataloader: BaseDataLoader) -> BaseDataLoader:
+
+    """ Shallow copy of a dataloader without its X and Y arrays, which are shared via ```share_data``` instead """
+
+    if not (hasattr(dataloader, "X") and hasattr(dataloader, "Y")):
+        raise ValueError(f"Only dataloaders with X and Y arrays can be shared, got {type(dataloader).__name__}")
+
+    template = copy.copy(dataloader)
+    template.__dict__.pop("_row_buffers", None) # appending in a trial must not affect the buffers of the original dataloader
+    template.X, template.Y = None, None
+
+    return template
+
+# %% ../../nbs/40_experiments/21_sweeps.ipynb 15
+class ASHAScheduler():
+
+    """
+    Scheduler for asynchronous successive halving. The scores at the rungs are kept in memory or, if
+    ```directory``` is given, appended to one file per rung, such that trials running in different
+    processes share them without a coordinating service.
+    """
+
+    def __init__(self,
+                    min_resource: int = 1, # number of epochs until the first rung
+                    max_resource: int = 100, # maximum number of epochs of a trial (e.g., n_epochs), there is no rung at or after it
+                    reduction_factor: int = 3, # only the best 1/reduction_factor of the trials continue at each rung
+                    criteria: Literal["J", "R"] = "J", # score used to compare trials
+                    direction: Literal["max", "min"] = "max", # whether the score shall be maximized or minimized
+                    directory: str | None = None, # directory for the rung files, required if trials run in parallel processes
+                    ):
+
+        if min_resource < 1 or reduction_factor < 2:
+            raise ValueError("min_resource must be at least 1 and reduction_factor at least 2")
+        if criteria not in ["J", "R"]:
+            raise ValueError("Criteria must be J or R")
+        if direction not in ["max", "min"]:
+            raise ValueError("Direction must be max or min")
+
+        self.min_resource = min_resource
+        self.max_resource = max_resource
+        self.reduction_factor = reduction_factor
+        self.criteria = criteria
+        self.direction = direction
+        self.directory = directory
+
+        self.rungs = []
+        resource = min_resource
+        while resource < max_resource:
+            self.rungs.append(resource)
+            resource *= reduction_factor
+
+        self._recorded = {rung: [] for rung in self.rungs}
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def _rung_path(self, rung: int) -> str:
+        return os.path.join(self.directory, f"rung_{rung}.txt")
+
+    def recorded(self, rung: int) -> List[Tuple[str, float]]: # (trial_id, score) of all trials that reached the rung
+
+        """ Return the scores recorded at a rung """
+
+        if self.directory is None:
+            return list(self._recorded[rung])
+
+        path = self._rung_path(rung)
+        if not os.path.exists(path):
+            return []
+        with open(path, "r") as f:
+            lines = [line.split() for line in f.read().splitlines() if line]
+        return [(trial_id, float(score)) for trial_id, score in lines]
+
+    def _record(self, rung: int, trial_id: str, score: float) -> None:
+        if self.directory is None:
+            self._recorded[rung].append((trial_id, score))
+        else:
+            with open(self._rung_path(rung), "a") as f: # one short append per result, such that concurrent writers do not interleave
+                f.write(f"{trial_id} {score!r}\n")
+
+    def cutoff(self, rung: int) -> float | None:
+
+        """ Score a trial needs to reach to continue after the rung, None if no trial reached the rung yet """
+
+        scores = np.array([score for _, score in self.recorded(rung)], dtype=float)
+        if len(scores) == 0:
+            return None
+        quantile = 1 - 1 / self.reduction_factor if self.direction == "max" else 1 / self.reduction_factor
+        return float(np.quantile(scores, quantile))
+
+    def on_result(self,
+                    trial_id: str,
+                    epoch: int, # number of epochs the trial has been trained for
+                    score: float,
+                    ) -> bool: # whether the trial shall be stopped
+
+        """ Record the score of a trial if it reached a rung and decide whether it continues """
+
+        if epoch not in self._recorded:
+            return False
+
+        cutoff = self.cutoff(epoch)
+        self._record(epoch, trial_id, score)
+
+        if cutoff is None:
+            return False
+        if self.direction == "max":
+            return score < cutoff
+        else:
+            return score > cutoff
+
+    def handler(self,
+                    trial_id: str,
+                    early_stopping_handler: object | None = None, # optional EarlyStoppingHandler of the trial itself
+                    ) -> "ASHATrialHandler":
+
+        """ Create the handler of one trial to be passed to run_experiment """
+
+        return ASHATrialHandler(self, trial_id, early_stopping_handler)
+
+class ASHATrialHandler():
+
+    """
+    Handler of one trial with the interface of the ```EarlyStoppingHandler```. It counts the epochs and
+    reports the scores to the scheduler. The trial is stopped if the scheduler or the wrapped early
+    stopping handler signals to stop.
+    """
+
+    def __init__(self,
+                    scheduler: ASHAScheduler,
+                    trial_id: str,
+                    early_stopping_handler: object | None = None,
+                    ):
+
+        self.scheduler = scheduler
+        self.trial_id = trial_id
+        self.early_stopping_handler = early_stopping_handler
+
+        self.epoch = 0
+        self.stopped_by_scheduler = False
+
+    def add_result(self,
+                    J: float, # Return (discounted rewards) of the last epoch
+                    R: float, # Total rewards of the last epoch
+                    ) -> bool:
+
+        """ Report the result of the last epoch and return whether the trial shall be stopped """
+
+        self.epoch += 1
+
+        stop = False
+        if self.early_stopping_handler is not None:
+            stop = bool(self.early_stopping_handler.add_result(J, R))
+
+        score = float(J if self.scheduler.criteria == "J" else R)
+        if self.scheduler.on_result(self.trial_id, self.epoch, score):
+            logging.info(f"{self.trial_id} stopped by ASHA after {self.epoch} epochs")
+            self.stopped_by_scheduler = True
+            stop = True
+
+        return stop
+
+# %% ../../nbs/40_experiments/21_sweeps.ipynb 22
+THREAD_ENV_VARIABLES = ["OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "NUMEXPR_NUM_THREADS", "VECLIB_MAXIMUM_THREADS"]
+
+def limit_threads(n_threads: int) -> None: # number of threads per process
+
+    """
+    Limit the number of threads of BLAS/OpenMP (via threadpoolctl if installed) and torch (if imported) in the
+    current process. The environment variables are set as well, such that libraries imported later follow the limit.
+    Called in the worker processes of a sweep to avoid oversubscription when many trials run in parallel.
+    """
+
+    for variable in THREAD_ENV_VARIABLES:
+        os.environ[variable] = str(n_threads)
+
+    try:
+        from threadpoolctl import threadpool_limits
+        threadpool_limits(limits=n_threads)
+    except ImportError:
+        pass
+
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        torch.set_num_threads(n_threads)
+
+@contextmanager
+def _thread_env_variables(n_threads: int):
+
+    """ Temporarily set the thread environment variables, such that new worker processes inherit them at start-up """
+
+    previous = {variable: os.environ.get(variable) for variable in THREAD_ENV_VARIABLES}
+    for variable in THREAD_ENV_VARIABLES:
+        os.environ[variable] = str(n_threads)
+    try:
+        yield
+    finally:
+        for variable, value in previous.items():
+            if value is None:
+                os.environ.pop(variable, None)
+            else:
+                os.environ[variable] = value
+
+# %% ../../nbs/40_experiments/21_sweeps.ipynb 24
+def _run_trial(
+        trial_function: Callable,
+        trial_id: str,
+        params: Dict,
+        config_train: Dict,
+        config_agent: Dict,
+        config_env: Dict,
+        data_paths: Tuple,
+        threads_per_trial: int | None,
+        scheduler: ASHAScheduler | None = None,
+        template: BaseDataLoader | None = None, # if given, the shared arrays are its X and Y
+        ) -> Dict:
+
+    """ Run one trial (in a worker process) and return one row of the results table """
+
+    if threads_per_trial is not None:
+        limit_threads(threads_per_trial) # repeated per trial since a previous trial may have imported torch
+
+    row = {"trial": trial_id, **params}
+    start = time.perf_counter()
+
+    try:
+        config_train, config_agent, config_env = apply_params(params, config_train, config_agent, config_env)
+        raw_data = load_shared_data(data_paths)
+        if template is not None:
+            dataloader = copy.copy(template)
+            dataloader.X, dataloader.Y = raw_data
+            raw_data = dataloader
+        if scheduler is None:
+            metrics = trial_function(config_train, config_agent, config_env, raw_data, trial_id)
+        else:
+            handler = scheduler.handler(trial_id)
+            metrics = trial_function(config_train, config_agent, config_env, raw_data, trial_id, early_stopping_handler=handler)
+            row["epochs"] = handler.epoch
+            row["stopped_by_scheduler"] = handler.stopped_by_scheduler
+        row.update(metrics or {})
+        row["status"] = "finished"
+        row["error"] = None
+    except Exception as e:
+        logging.warning(f"Trial {trial_id} failed: {e!r}")
+        row["status"] = "failed"
+        row["error"] = repr(e)
+
+    row["duration"] = time.perf_counter() - start
+
+    return row
+
+def run_sweep(
+        trial_function: Callable, # called as trial_function(config_train, config_agent, config_env, raw_data, trial_id), returns a dict of metrics
+        search_space: Dict, # namespaced parameters, see sample_configs
+        config_train: Dict, # base configs the parameters of each trial are merged into
+        config_agent: Dict,
+        config_env: Dict,
+        raw_data: Tuple | BaseDataLoader, # arrays shared by all trials, e.g., (X, Y), or a preprocessed dataloader with X and Y arrays
+        method: Literal["grid", "random"] = "grid",
+        n_trials: int | None = None, # required for random search
+        seed: int = 0, # seed of the random search
+        n_workers: int | None = None, # number of parallel trials, None: number of CPUs // threads_per_trial, 0: run in the calling process
+        threads_per_trial: int = 1, # BLAS/OpenMP/torch threads per trial
+        data_dir: str | None = None, # directory for the shared data, defaults to a temporary directory
+        start_method: Literal["fork", "spawn", "forkserver"] = "fork", # start method of the worker processes
+        results_path: str | None = None, # if given, the results table is also written to this csv file
+        scheduler: ASHAScheduler | None = None, # if given, trials are stopped early and trial_function receives the keyword argument early_stopping_handler
+        ) -> pd.DataFrame:
+
+    """
+    Run a local hyperparameter sweep. The parameters of all trials are created with ```sample_configs```,
+    the dataset is written once with ```share_data``` and each trial runs ```trial_function``` in a process
+    pool on the memory-mapped data, with the number of threads limited to ```threads_per_trial```.
+    A failing trial does not stop the sweep but is marked as failed in the results table, which contains one
+    row per trial with the parameters, the metrics returned by ```trial_function```, the status and the duration.
+
+    The trial function must be picklable (defined at module level) when ```start_method``` is ```"spawn"``` or ```"forkserver"```.
+
+    If a ```scheduler``` is given, the trial function is called with the additional keyword argument ```early_stopping_handler```,
+    which should be passed on to ```run_experiment```. The results table then also contains the number of epochs each trial ran
+    and whether it was stopped by the scheduler.
+
+    If ```raw_data``` is a dataloader (e.g., an ```XYDataLoader``` with lags and normalization already applied), its preprocessed
+    X and Y arrays are shared instead of the raw data and each trial receives a copy of the dataloader on the memory-mapped arrays
+    as ```raw_data```. Trials then skip the preprocessing, but parameters that change the preprocessing cannot be part of the search space.
+    """
+
+    if scheduler is not None and scheduler.directory is None and n_workers != 0:
+        raise ValueError("The scheduler needs a directory to share the results of trials running in parallel processes")
+
+    configs = sample_configs(search_space, method=method, n_trials=n_trials, seed=seed)
+    trial_ids = [f"trial_{i:04d}" for i in range(len(configs))]
+
+    if n_workers is None:
+        n_workers = max(1, (os.cpu_count() or 1) // threads_per_trial)
+
+    tmp_dir = None
+    if data_dir is None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        data_dir = tmp_dir.name
+
+    template = None
+    if isinstance(raw_data, BaseDataLoader):
+        template = _dataloader_template(raw_data)
+        raw_data = (raw_data.X, raw_data.Y)
+
+    try:
+        data_paths = share_data(raw_data, data_dir)
+        logging.info(f"Running {len(configs)} trials with {n_workers} workers and {threads_per_trial} threads per trial")
+
+        rows = []
+        if n_workers == 0:
+            for trial_id, params in zip(trial_ids, configs):
+                rows.append(_run_trial(trial_function, trial_id, params, config_train, config_agent, config_env, data_paths, None, scheduler, template))
+        else:
+            with _thread_env_variables(threads_per_trial):
+                with ProcessPoolExecutor(max_workers=n_workers, mp_context=mp.get_context(start_method)) as executor:
+                    futures = [executor.submit(_run_trial, trial_function, trial_id, params, config_train, config_agent, config_env, data_paths, threads_per_trial, scheduler, template)
+                               for trial_id, params in zip(trial_ids, configs)]
+                    for future in as_completed(futures):
+                        row = future.result()
+                        logging.info(f"{row['trial']} {row['status']} after {row['duration']:.2f}s")
+                        rows.append(row)
+    finally:
+        if tmp_dir is not None:
+            tmp_dir.cleanup()
+
+    if len(rows) == 0:
+        columns = ["trial", *search_space.keys()] + (["epochs", "stopped_by_scheduler"] if scheduler is not None else []) + ["status", "error", "duration"]
+        results = pd.DataFrame(columns=columns)
+    else:
+        results = pd.DataFrame(rows).sort_values("trial").reset_index(drop=True)
+
+    if results_path is not None:
+        results.to_csv(results_path, index=False)
+
+    return results
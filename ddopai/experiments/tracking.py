@@ -7,12 +7,16 @@ __all__ = ['get_git_hash', 'get_library_version']
 
 # %% ../../nbs/40_experiments/30_tracking.ipynb 3
 from typing import Union, List, Tuple, Literal
-import pkg_resources
 import subprocess
-import wandb
 import logging
 
+from ..utils import LazyModule
+
 # %% ../../nbs/40_experiments/30_tracking.ipynb 4
+pkg_resources = LazyModule("pkg_resources") # both are only imported when a version or hash is tracked
+wandb = LazyModule("wandb")
+
+# %% ../../nbs/40_experiments/30_tracking.ipynb 5
 def get_git_hash(
     directory: str, # the directory where the git repository is located
     tracking: bool = False, # whether to directly track the git revision hash
@@ -31,7 +35,7 @@ def get_git_hash(
 
     return hash
 
-# %% ../../nbs/40_experiments/30_tracking.ipynb 6
+# %% ../../nbs/40_experiments/30_tracking.ipynb 7
 def get_library_version(
     library_name: str,
     tracking: bool = False, # Whether to directly track the library version
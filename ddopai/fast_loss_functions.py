@@ -0,0 +1,139 @@
+"""Fast-path versions of the Numpy-based loss functions without input validation, with in-place and batched variants."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/00_utils/22_fast_loss_functions.ipynb.
+
+# %% auto 0
+__all__ = ['pinball_loss_fast', 'quantile_loss_fast', 'pinball_loss_batch', 'quantile_loss_batch']
+
+# %% ../nbs/00_utils/22_fast_loss_functions.ipynb 3
+from typing import Union, Optional, Literal
+import functools
+import importlib.util
+
+import numpy as np
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None # numba itself is only imported when the kernel is first used
+
+# %% ../nbs/00_utils/22_fast_loss_functions.ipynb 5
+def pinball_loss_fast(
+            Y_true: np.ndarray,
+            Y_pred: np.ndarray,
+            underage_cost: np.ndarray | float,
+            overage_cost: np.ndarray | float,
+            out: np.ndarray | None = None, # optional array to write the result into (must have the broadcasted shape)
+            ) -> np.ndarray: # returns the cost per observation
+
+    """
+    Pinball loss without input validation. Uses that for non-negative cost parameters the loss is
+    max((y - q) * cu, (q - y) * co), such that only one temporary array is needed. If out is
+    provided, the result is written into it, otherwise a float array (at least float64) is allocated,
+    such that integer demand and predictions can be combined with float costs.
+    """
+
+    if out is None:
+        out = np.empty(np.broadcast_shapes(np.shape(Y_true), np.shape(Y_pred)), dtype=np.result_type(Y_true, Y_pred, np.float64))
+    np.subtract(Y_true, Y_pred, out=out)
+    overage = np.multiply(out, np.negative(overage_cost))
+    np.multiply(out, underage_cost, out=out)
+    np.maximum(out, overage, out=out)
+
+    return out
+
+# %% ../nbs/00_utils/22_fast_loss_functions.ipynb 7
+def quantile_loss_fast(
+            Y_true: np.ndarray,
+            Y_pred: np.ndarray,
+            quantile: np.ndarray | float,
+            out: np.ndarray | None = None, # optional array to write the result into (must have the broadcasted shape)
+            ) -> np.ndarray: # returns the cost per observation
+
+    """
+    Quantile loss without input validation. Equivalent to the pinball loss with
+    underage cost quantile and overage cost 1 - quantile.
+    """
+
+    return pinball_loss_fast(Y_true, Y_pred, quantile, np.subtract(1, quantile), out=out)
+
+# %% ../nbs/00_utils/22_fast_loss_functions.ipynb 9
+def _pinball_kernel(Y_true, Y_pred, underage_cost, overage_cost, out): #
+    T, S = Y_true.shape
+    for t in range(T):
+        for s in range(S):
+            diff = Y_true[t, s] - Y_pred[t, s]
+            if diff > 0:
+                out[t, s] = diff * underage_cost[s]
+            else:
+                out[t, s] = -diff * overage_cost[s]
+    return out
+
+@functools.cache
+def _get_pinball_kernel(): #
+
+    """ Jit-compile the pinball kernel on first use """
+
+    from numba import njit
+    return njit(cache=True)(_pinball_kernel)
+
+# %% ../nbs/00_utils/22_fast_loss_functions.ipynb 10
+def pinball_loss_batch(
+            Y_true: np.ndarray, # array of shape (T, n_SKUs)
+            Y_pred: np.ndarray, # array of shape (T, n_SKUs)
+            underage_cost: np.ndarray | float, # scalar or array of shape (n_SKUs,)
+            overage_cost: np.ndarray | float, # scalar or array of shape (n_SKUs,)
+            reduction: Literal["none", "sum_SKUs", "sum"] = "none", # "none" returns (T, n_SKUs), "sum_SKUs" returns (T,), "sum" a scalar
+            out: np.ndarray | None = None, # optional array of shape (T, n_SKUs) to write the per-observation cost into
+            use_numba: bool | None = None, # if None, Numba is used when available
+            ) -> np.ndarray | float:
+
+    """
+    Pinball loss over a full horizon of shape (T, n_SKUs). Can be used to evaluate an entire
+    validation or test set at once or to compute the cost of several vectorized environments in one call.
+    Both backends cast the inputs to float64 and accept the same shapes.
+    """
+
+    if use_numba is None:
+        use_numba = NUMBA_AVAILABLE
+    elif use_numba and not NUMBA_AVAILABLE:
+        raise ImportError("Numba is not installed. Install numba or set use_numba to False or None.")
+
+    Y_true = np.asarray(Y_true, dtype=np.float64)
+    Y_pred = np.asarray(Y_pred, dtype=np.float64)
+    if Y_true.ndim != 2 or Y_true.shape != Y_pred.shape:
+        raise ValueError(f"Y_true and Y_pred must be 2D arrays of the same shape, but got {Y_true.shape} and {Y_pred.shape}")
+    num_SKUs = Y_true.shape[1]
+    underage_cost = np.ascontiguousarray(np.broadcast_to(np.asarray(underage_cost, dtype=np.float64).reshape(-1), (num_SKUs,)))
+    overage_cost = np.ascontiguousarray(np.broadcast_to(np.asarray(overage_cost, dtype=np.float64).reshape(-1), (num_SKUs,)))
+    if out is None:
+        out = np.empty(Y_true.shape, dtype=np.float64)
+    elif out.shape != Y_true.shape:
+        raise ValueError(f"out must have shape {Y_true.shape}, but got {out.shape}")
+
+    if use_numba:
+        loss = _get_pinball_kernel()(Y_true, Y_pred, underage_cost, overage_cost, out)
+    else:
+        loss = pinball_loss_fast(Y_true, Y_pred, underage_cost, overage_cost, out=out)
+
+    if reduction == "none":
+        return loss
+    elif reduction == "sum_SKUs":
+        return loss.sum(axis=-1)
+    elif reduction == "sum":
+        return loss.sum()
+    else:
+        raise ValueError(f"reduction={reduction} is not valid")
+
+# %% ../nbs/00_utils/22_fast_loss_functions.ipynb 12
+def quantile_loss_batch(
+            Y_true: np.ndarray, # array of shape (T, n_SKUs)
+            Y_pred: np.ndarray, # array of shape (T, n_SKUs)
+            quantile: np.ndarray | float, # scalar or array of shape (n_SKUs,)
+            reduction: Literal["none", "sum_SKUs", "sum"] = "none", # "none" returns (T, n_SKUs), "sum_SKUs" returns (T,), "sum" a scalar
+            out: np.ndarray | None = None, # optional array of shape (T, n_SKUs) to write the per-observation cost into
+            use_numba: bool | None = None, # if None, Numba is used when available
+            ) -> np.ndarray | float:
+
+    """
+    Quantile loss over a full horizon of shape (T, n_SKUs), see ```pinball_loss_batch```.
+    """
+
+    return pinball_loss_batch(Y_true, Y_pred, quantile, np.subtract(1, quantile), reduction=reduction, out=out, use_numba=use_numba)
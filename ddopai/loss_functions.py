@@ -11,10 +11,6 @@ from typing import Union, Optional
 import numpy as np
 from .utils import Parameter, check_parameter_types
 
-import torch
-import torch.nn as nn
-import torch.nn.functional as F
-
 # %% ../nbs/00_utils/20_loss_functions.ipynb 4
 def pinball_loss(
             Y_true: np.ndarray, 
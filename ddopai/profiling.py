@@ -0,0 +1,226 @@
+"""Lightweight timer registry to measure where the time of an experiment is spent."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/00_utils/24_profiling.ipynb.
+
+# %% auto 0
+__all__ = ['PROFILER', 'LIGHTWEIGHT_MODULES', 'HEAVY_DEPENDENCIES', 'TimerRegistry', 'import_time', 'import_time_benchmark']
+
+# %% ../nbs/00_utils/24_profiling.ipynb 3
+import json
+import importlib.util
+import os
+import subprocess
+import sys
+import time
+import logging
+from contextlib import nullcontext
+from typing import Dict, List
+
+import numpy as np
+
+# %% ../nbs/00_utils/24_profiling.ipynb 4
+class _Timer():
+
+    """ Context manager measuring the time of a single call and recording it in the registry """
+
+    __slots__ = ("registry", "name", "start")
+
+    def __init__(self, registry, name):
+        self.registry = registry
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.registry.record(self.name, time.perf_counter() - self.start)
+        return False
+
+# %% ../nbs/00_utils/24_profiling.ipynb 5
+_NULL_TIMER = nullcontext()
+
+class TimerRegistry():
+
+    """
+    Registry collecting the durations of named stages (e.g., ```"env.step_"``` or ```"agent.fit_epoch"```).
+    Stages are timed via ```with registry.timer(name):```. When the registry is disabled (default), ```timer```
+    returns a shared no-op context manager, such that the instrumentation on the hot paths has close to zero cost.
+    The registry can also be used as context manager to enable it for a block of code.
+    """
+
+    def __init__(self,
+                    enabled: bool = False, # whether timings are recorded
+                    ):
+
+        self.enabled = enabled
+        self.timings: Dict[str, List[float]] = {}
+
+    def timer(self,
+                name: str, # name of the stage, e.g., "env.step_"
+                ):
+
+        """
+        Return a context manager that records the duration of the enclosed block under name.
+        """
+
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def record(self,
+                name: str, # name of the stage
+                duration: float, # duration in seconds
+                ) -> None:
+
+        """
+        Record a duration for a stage.
+        """
+
+        timings = self.timings.get(name)
+        if timings is None:
+            timings = self.timings[name] = []
+        timings.append(duration)
+
+    def enable(self):
+        """ Start recording timings """
+        self.enabled = True
+
+    def disable(self):
+        """ Stop recording timings (already recorded timings are kept) """
+        self.enabled = False
+
+    def reset(self):
+        """ Delete all recorded timings """
+        self.timings = {}
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.disable()
+        return False
+
+    def summary(self,
+                percentiles: List[float] = [50, 90, 99], # percentiles to report
+                ) -> Dict[str, Dict[str, float]]:
+
+        """
+        Aggregate the recorded timings per stage into count, total, mean, max and the
+        given percentiles (all in seconds). Stages are sorted by total time.
+        """
+
+        summary = {}
+        for name, timings in self.timings.items():
+            timings = np.asarray(timings)
+            stats = {
+                "count": int(len(timings)),
+                "total": float(timings.sum()),
+                "mean": float(timings.mean()),
+                "max": float(timings.max()),
+            }
+            for percentile, value in zip(percentiles, np.percentile(timings, percentiles)):
+                stats[f"p{percentile}"] = float(value)
+            summary[name] = stats
+
+        return dict(sorted(summary.items(), key=lambda item: item[1]["total"], reverse=True))
+
+    def flat_summary(self,
+                        prefix: str = "profiling", # prefix of the keys
+                        ) -> Dict[str, float]:
+
+        """
+        Summary as flat dict with keys ```"{prefix}/{stage}/{statistic}"```, e.g., to log it to a tracking tool.
+        """
+
+        return {f"{prefix}/{name}/{key}": value for name, stats in self.summary().items() for key, value in stats.items()}
+
+    def to_json(self,
+                path: str, # path of the json file
+                ) -> None:
+
+        """
+        Write the summary to a json file.
+        """
+
+        with open(path, "w") as f:
+            json.dump(self.summary(), f, indent=4)
+
+    def log_summary(self):
+
+        """
+        Log the summary via logging.info, one line per stage.
+        """
+
+        for name, stats in self.summary().items():
+            logging.info(f"{name}: count={stats['count']}, total={stats['total']:.4f}s, mean={stats['mean']*1e3:.4f}ms, p90={stats.get('p90', float('nan'))*1e3:.4f}ms")
+
+PROFILER = TimerRegistry() # global registry used by the instrumentation of environments, agents and experiment functions
+
+# %% ../nbs/00_utils/24_profiling.ipynb 15
+LIGHTWEIGHT_MODULES = [ # modules that should be importable without heavy dependencies
+    "ddopai.utils",
+    "ddopai.dataloaders.tabular",
+    "ddopai.envs.inventory.single_period",
+    "ddopai.envs.inventory.multi_period",
+    "ddopai.agents.newsvendor.saa",
+    "ddopai.experiments.experiment_functions",
+]
+
+HEAVY_DEPENDENCIES = ["torch", "sklearn", "wandb", "mushroom_rl", "xgboost", "numba", "torchinfo", "IPython"]
+
+def import_time(module: str, # name of the module to import, e.g., "ddopai.agents.newsvendor.saa"
+                heavy_dependencies: List[str] = HEAVY_DEPENDENCIES, # top-level packages to check for
+                python: str | None = None, # python executable, defaults to the current interpreter
+                ) -> Dict:
+
+    """
+    Import a module in a fresh interpreter with ```python -X importtime``` and return the cumulative
+    import time of the module in seconds, the ten slowest imported modules, and the heavy dependencies
+    that have been imported along the way.
+    """
+
+    python = python or sys.executable
+    package_root = os.path.dirname(importlib.util.find_spec("ddopai").submodule_search_locations[0]) # import the same ddopai as the caller
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([package_root] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else []))
+
+    code = f"import {module}, sys; print(' '.join(sys.modules))"
+    result = subprocess.run([python, "-X", "importtime", "-c", code], capture_output=True, text=True, env=env)
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = [part.strip() for part in line[len("import time:"):].split("|")]
+        cumulative[name] = int(cumulative_us) / 1e6
+
+    loaded = set(result.stdout.split())
+    slowest = sorted(cumulative.items(), key=lambda item: item[1], reverse=True)
+
+    return {
+        "module": module,
+        "seconds": cumulative.get(module, float("nan")),
+        "slowest": [name for name, _ in slowest[:10]],
+        "heavy_dependencies": [name for name in heavy_dependencies if name in loaded],
+    }
+
+def import_time_benchmark(modules: List[str] = LIGHTWEIGHT_MODULES, # modules to benchmark
+                            heavy_dependencies: List[str] = HEAVY_DEPENDENCIES, # top-level packages to check for
+                            ) -> List[Dict]:
+
+    """
+    Run ```import_time``` for each module (each in its own interpreter, such that the times are
+    not affected by previously imported modules) and log one line per module.
+    """
+
+    results = []
+    for module in modules:
+        result = import_time(module, heavy_dependencies)
+        logging.info(f"{module}: {result['seconds']:.3f}s, heavy dependencies: {result['heavy_dependencies']}")
+        results.append(result)
+
+    return results
@@ -3,20 +3,43 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/00_utils/00_utils.ipynb.
 
 # %% auto 0
-__all__ = ['check_parameter_types', 'Parameter', 'MDPInfo', 'DatasetWrapper', 'DatasetWrapperMeta', 'merge_dictionaries',
-           'set_param']
+__all__ = ['set_default_dtype', 'get_default_dtype', 'check_parameter_types', 'Parameter', 'MDPInfo', 'DatasetWrapper',
+           'DatasetWrapperMeta', 'merge_dictionaries', 'set_param', 'LazyModule']
 
 # %% ../nbs/00_utils/00_utils.ipynb 3
-from torch.utils.data import Dataset
 from typing import Union, List, Tuple, Literal, Dict
+import importlib
+import sys
+import types
 from gymnasium.spaces import Space
 from .dataloaders.base import BaseDataLoader
+from .profiling import PROFILER
 
 import logging
 
 import numpy as np
 
-# %% ../nbs/00_utils/00_utils.ipynb 4
+# %% ../nbs/00_utils/00_utils.ipynb 5
+_default_dtype = np.dtype(np.float32)
+
+def set_default_dtype(dtype: str | type | np.dtype # floating point dtype, e.g., "float32" or np.float64
+                      ) -> None:
+
+    """ Set the floating point dtype in which data is stored and served """
+
+    global _default_dtype
+    dtype = np.dtype(dtype)
+    if dtype.kind != "f":
+        raise ValueError(f"dtype must be a floating point dtype, got {dtype}")
+    _default_dtype = dtype
+
+def get_default_dtype() -> np.dtype:
+
+    """ Get the floating point dtype in which data is stored and served """
+
+    return _default_dtype
+
+# %% ../nbs/00_utils/00_utils.ipynb 9
 def check_parameter_types(
                             *args,                      # any number of parameters to be checked
                             parameter_type=np.ndarray   # the expected type for each parameter
@@ -30,7 +53,7 @@ def check_parameter_types(
         if not isinstance(arg, parameter_type):
             raise TypeError(f"Argument {index+1} of {len(args)} is of type {type(arg).__name__}, expected {parameter_type.__name__}")
 
-# %% ../nbs/00_utils/00_utils.ipynb 7
+# %% ../nbs/00_utils/00_utils.ipynb 12
 class Parameter():
 
     """
@@ -39,7 +62,7 @@ class Parameter():
     
     pass
 
-# %% ../nbs/00_utils/00_utils.ipynb 8
+# %% ../nbs/00_utils/00_utils.ipynb 13
 class MDPInfo():
     """
     This class is used to store the information of the environment.
@@ -81,13 +104,17 @@ class MDPInfo():
         """
         return self.observation_space.shape + self.action_space.shape
 
-# %% ../nbs/00_utils/00_utils.ipynb 12
-class DatasetWrapper(Dataset):
+# %% ../nbs/00_utils/00_utils.ipynb 17
+class DatasetWrapper():
     """
     This class is used to wrap a Pytorch Dataset around the ddopai dataloader
     to enable the usage of the Pytorch Dataloader during training. This way,
     agents that are trained using Pytorch without interacting with the environment
     can directly train on the data generated by the dataloader.
+
+    The wrapper is a map-style dataset (it implements ```__getitem__``` and ```__len__```),
+    which is all the Pytorch Dataloader requires. It therefore does not inherit from
+    ```torch.utils.data.Dataset``` such that importing ```ddopai.utils``` does not import torch.
     
     """
 
@@ -106,7 +133,8 @@ class DatasetWrapper(Dataset):
 
         # create tuple of items
 
-        output = self.dataloader[idx]
+        with PROFILER.timer("dataset.dataloader.__getitem__"):
+            output = self.dataloader[idx]
 
         X = output[0]
 
@@ -117,7 +145,8 @@ class DatasetWrapper(Dataset):
         
         X = np.squeeze(X, axis=0) # remove batch dimension
 
-        output = (X, *output[1:])
+        # no copy if the dataloader already serves the default dtype
+        output = (np.asarray(X, dtype=get_default_dtype()), np.asarray(output[1], dtype=get_default_dtype()), *output[2:])
         
         return output
 
@@ -140,7 +169,7 @@ class DatasetWrapper(Dataset):
         else:
             raise ValueError("Dataset type must be either 'train', 'val' or 'test'")
 
-# %% ../nbs/00_utils/00_utils.ipynb 16
+# %% ../nbs/00_utils/00_utils.ipynb 21
 class DatasetWrapperMeta(DatasetWrapper):
     """
     This class is used to wrap a Pytorch Dataset around the ddopai dataloader
@@ -182,7 +211,8 @@ class DatasetWrapperMeta(DatasetWrapper):
 
         """
 
-        features, demand = self.dataloader[idx] 
+        with PROFILER.timer("dataset.dataloader.__getitem__"):
+            features, demand = self.dataloader[idx] 
 
         features = np.expand_dims(features, axis=0) # add batch dimension as meta environments also return a batch dimension (needed for obsprocessor)
 
@@ -199,9 +229,9 @@ class DatasetWrapperMeta(DatasetWrapper):
 
         obs = np.squeeze(obs, axis=0) # remove batch dimension after observation has been processed as the pytorch dataloader adds the batch dimension
 
-        return obs, demand, params
+        return np.asarray(obs, dtype=get_default_dtype()), np.asarray(demand, dtype=get_default_dtype()), params
 
-# %% ../nbs/00_utils/00_utils.ipynb 18
+# %% ../nbs/00_utils/00_utils.ipynb 23
 def merge_dictionaries(dict1, dict2):
     """ Merge two dictionaries. If a key is found in both dictionaries, raise a KeyError. """
     for key in dict2:
@@ -212,7 +242,7 @@ def merge_dictionaries(dict1, dict2):
     merged_dict = {**dict1, **dict2}
     return merged_dict
 
-# %% ../nbs/00_utils/00_utils.ipynb 20
+# %% ../nbs/00_utils/00_utils.ipynb 25
 def set_param(obj,
                 name: str, # name of the parameter (will become the attribute name)
                 input: Parameter | int | float | np.ndarray | List | Dict | None , # input value of the parameter
@@ -280,3 +310,33 @@ def set_param(obj,
             raise AttributeError(f"Parameter {name} does not exist")
         else:
             setattr(obj, name, param)
+
+# %% ../nbs/00_utils/00_utils.ipynb 27
+class LazyModule(types.ModuleType):
+    """
+    Placeholder for a heavy or optional dependency that is only imported when one of its
+    attributes is accessed for the first time. Used as ```wandb = LazyModule("wandb")``` at
+    module level, such that call sites such as ```wandb.log(...)``` remain unchanged while importing
+    the ddopai module does not import the dependency. If the dependency is not installed, the
+    ImportError is raised at the first access instead of at import time.
+    """
+
+    def __init__(self,
+                    name: str, # name of the module, as passed to importlib.import_module
+                    ):
+        super().__init__(name)
+        self._lazy_module = None
+
+    def _load(self):
+        """ Import the module (once) and return it """
+        if self._lazy_module is None:
+            self._lazy_module = importlib.import_module(self.__name__)
+        return self._lazy_module
+
+    def __getattr__(self, attr):
+        # only called for attributes that are not set on the placeholder itself
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self._lazy_module is not None else "not loaded"
+        return f"<LazyModule '{self.__name__}' ({state})>"